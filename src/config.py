@@ -1,5 +1,55 @@
 """Source configuration for islands and providers."""
 
+# Seconds between runs of each scraper in daemon mode (`python3 -m src.generate --daemon`).
+DEFAULT_SCRAPE_INTERVAL = 15 * 60
+SCRAPE_INTERVALS = {
+    "breaking_news": 60,
+    "time_wheel": 5 * 60,
+    "info_kauai": 60 * 60,
+    "nws_alerts": 2 * 60,
+    "weather_kauai": 10 * 60,
+    "precipitation": 10 * 60,
+    "kiuc": 2 * 60,
+    "kauai_water": 30 * 60,
+    "verizon_mobile": 10 * 60,
+    "att_mobile": 10 * 60,
+    "kauai_solid_waste": 60 * 60,
+    "hidot_highways_news": 15 * 60,
+    "usgs_water_levels": 10 * 60,
+    "ocean_water_quality": 60 * 60,
+    "adsbexchange_live": 2 * 60,
+    "marinetraffic_kauai": 10 * 60,
+    "kauai_county_press": 30 * 60,
+    "kauai_now": 30 * 60,
+    "global_events_wire": 30 * 60,
+}
+# Each run is rescheduled within +/- this fraction of its interval so sources drift apart.
+SCRAPE_JITTER = 0.1
+
+# Byte budget of the text bulletin (site/bulletin.txt) relayed over Winlink and SMS;
+# an island can set its own "bulletin_max_bytes".
+BULLETIN_MAX_BYTES = 2048
+
+# Kauai town centers (lat, lon), shared by the aircraft and town forecast sections.
+TOWN_COORDS = {
+    "Hanalei": (22.205, -159.500),
+    "Princeville": (22.220, -159.473),
+    "Kilauea": (22.209, -159.406),
+    "Anahola": (22.142, -159.315),
+    "Kealia": (22.096, -159.318),
+    "Kapaa": (22.088, -159.338),
+    "Lihue": (21.981, -159.368),
+    "Koloa": (21.902, -159.469),
+    "Lawai": (21.907, -159.481),
+    "Kalaheo": (21.913, -159.535),
+    "Eleele": (21.913, -159.586),
+    "Hanapepe": (21.905, -159.592),
+    "Makaweli": (21.916, -159.631),
+    "Kaumakani": (21.914, -159.628),
+    "Waimea": (21.953, -159.672),
+    "Kekaha": (21.973, -159.719),
+}
+
 ISLANDS = {
     "kauai": {
         "name": "Kauai",
@@ -7,6 +57,7 @@ ISLANDS = {
             "breaking_news",
             "time_wheel",
             "info_kauai",
+            "nws_alerts",
             "weather_kauai",
             "precipitation",
             "kiuc",
@@ -1,26 +1,68 @@
 import argparse
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
+from typing import Callable
 
 from dotenv import load_dotenv
 
-from src.config import ISLANDS
+from src.config import DEFAULT_SCRAPE_INTERVAL, ISLANDS, SCRAPE_INTERVALS, SCRAPE_JITTER
 from src.render.html import render_html
+from src.render.targets import DEFAULT_TARGETS, TARGETS, Build, write_targets
 from src.scrape.base import now_iso
-from src.scrape.cache import load_cache, save_cache
-from src.scrape.registry import get_scraper
+from src.scrape.cache import (
+    CACHE_SCHEMA_VERSION,
+    content_hash,
+    is_current_schema,
+    load_cache,
+    save_cache,
+)
+from src.scrape.registry import get_renderer, get_scraper
 
 _REPO_ROOT = Path(__file__).resolve().parents[1]
 
 # Scrapers backed by a committed cache file; live fetch often fails in CI.
 COMMITTED_CACHE_SCRAPERS = frozenset({"marinetraffic_kauai"})
+# Daemon-mode scrapes run concurrently on a shared pool of this many workers.
+DAEMON_MAX_WORKERS = 4
 
 
 def _uses_committed_cache(scraper_name: str) -> bool:
     return scraper_name in COMMITTED_CACHE_SCRAPERS
 
 
-def scrape_with_cache(scraper_name: str, cache_dir: Path, offline: bool) -> dict:
+def load_section(cache_dir: Path, scraper_name: str) -> dict | None:
+    """Cached section, re-rendered from its stored data when the schema is current.
+
+    Older entries (or scrapers without a renderer) replay their stored html.
+    """
     cached = load_cache(cache_dir, scraper_name)
+    if not cached or not is_current_schema(cached) or "data" not in cached:
+        return cached
+    renderer = get_renderer(scraper_name)
+    if renderer is None:
+        return cached
+    try:
+        return {**cached, **renderer(cached["data"])}
+    except Exception as exc:  # noqa: BLE001 - fall back to the stored markup
+        print(f"Re-render failed for {scraper_name}: {exc}")
+        return cached
+
+
+def scrape_with_cache(
+    scraper_name: str, cache_dir: Path, offline: bool, cached: dict | None = None
+) -> dict:
+    """Scrape one source, falling back to its cached section when the fetch fails.
+
+    ``cached`` is the section already held in memory (daemon mode); it stands in for
+    reading and re-rendering the cache file. A fresh section is returned stamped like
+    a cache entry, so it can be passed back as ``cached`` on the next run.
+    """
+    if cached is None:
+        cached = load_section(cache_dir, scraper_name)
+    else:
+        cached = dict(cached)
     if offline:
         if cached:
             if not _uses_committed_cache(scraper_name):
@@ -41,8 +83,14 @@ def scrape_with_cache(scraper_name: str, cache_dir: Path, offline: bool) -> dict
     try:
         scraper = get_scraper(scraper_name)
         data = scraper()
-        save_cache(cache_dir, scraper_name, data)
-        return data
+        save_cache(
+            cache_dir,
+            scraper_name,
+            data,
+            previous=cached,
+            readable=_uses_committed_cache(scraper_name),
+        )
+        return {**data, "schema": CACHE_SCHEMA_VERSION, "content_hash": content_hash(data)}
     except Exception as exc:  # noqa: BLE001 - keep generator resilient
         if cached:
             if _uses_committed_cache(scraper_name):
@@ -64,22 +112,133 @@ def scrape_with_cache(scraper_name: str, cache_dir: Path, offline: bool) -> dict
         }
 
 
+def _get_island(island_key: str) -> dict:
+    if island_key not in ISLANDS:
+        raise SystemExit(f"Unknown island: {island_key}")
+    return ISLANDS[island_key]
+
+
+def _write_index(
+    island: dict,
+    results: list[dict],
+    output_dir: Path,
+    inline_css: bool = False,
+    targets: list[str] | None = None,
+) -> None:
+    """Render every output target (index.html, variants, JSON API, bulletin) from ``results``.
+
+    ``targets`` defaults to the island's ``"targets"``, else ``DEFAULT_TARGETS``.
+    """
+    build = Build(island, results, output_dir, now_iso(), inline_css)
+    write_targets(build, targets or island.get("targets", DEFAULT_TARGETS))
+
+
 def generate_island(
     island_key: str,
     output_dir: Path,
     cache_dir: Path,
     offline: bool,
+    inline_css: bool = False,
+    targets: list[str] | None = None,
 ) -> None:
-    if island_key not in ISLANDS:
-        raise SystemExit(f"Unknown island: {island_key}")
-    island = ISLANDS[island_key]
+    island = _get_island(island_key)
     scrapers = island.get("scrapers", [])
     results = [scrape_with_cache(name, cache_dir, offline) for name in scrapers]
-    generated_at = now_iso()
+    _write_index(island, results, output_dir, inline_css, targets)
+
+
+def regenerate_island(
+    island_key: str,
+    output_dir: Path,
+    cache_dir: Path,
+    fresh: dict[str, dict],
+    inline_css: bool = False,
+    targets: list[str] | None = None,
+) -> None:
+    """Re-render the page from cached sections, substituting freshly scraped ones.
+
+    Cached sections keep their own retrieved_at/stale flags; nothing is fetched.
+    """
+    island = _get_island(island_key)
+    results = []
+    for name in island.get("scrapers", []):
+        if name in fresh:
+            save_cache(cache_dir, name, fresh[name], readable=_uses_committed_cache(name))
+            results.append(fresh[name])
+        else:
+            results.append(load_section(cache_dir, name) or scrape_with_cache(name, cache_dir, True))
+    _write_index(island, results, output_dir, inline_css, targets)
 
-    output_dir.mkdir(parents=True, exist_ok=True)
-    html = render_html(island["name"], results, generated_at)
-    (output_dir / "index.html").write_text(html, encoding="utf-8")
+
+def _next_run(scraper_name: str, now: float) -> float:
+    interval = SCRAPE_INTERVALS.get(scraper_name, DEFAULT_SCRAPE_INTERVAL)
+    return now + interval * (1 + random.uniform(-SCRAPE_JITTER, SCRAPE_JITTER))
+
+
+def run_daemon(
+    island_key: str,
+    output_dir: Path,
+    cache_dir: Path,
+    max_runs: int | None = None,
+    clock: Callable[[], float] = time.time,
+    sleep: Callable[[float], None] = time.sleep,
+    inline_css: bool = False,
+    targets: list[str] | None = None,
+) -> None:
+    """Keep one warm process scraping each source on its own interval.
+
+    index.html is first written from cached sections, as ``regenerate_island`` does,
+    so it never waits on a slow source. Every source then runs at startup and again
+    after its interval (with jitter). Due sources go to a shared pool and each is
+    handled as soon as it finishes. Sections stay in memory, serve as each scrape's
+    fallback and are mirrored to the cache by ``scrape_with_cache``. index.html is
+    rewritten, atomically, only when a section's content changes; a new
+    ``retrieved_at`` alone does not count.
+    ``max_runs`` (completed scrapes) bounds the loop for tests.
+    """
+    island = _get_island(island_key)
+    names = island.get("scrapers", [])
+    sections = {
+        name: load_section(cache_dir, name) or scrape_with_cache(name, cache_dir, True)
+        for name in names
+    }
+    hashes = {name: content_hash(section) for name, section in sections.items()}
+    _write_index(island, list(sections.values()), output_dir, inline_css, targets)
+    due_at = {name: clock() for name in names}
+    running: dict[Future, str] = {}
+    runs = 0
+    with ThreadPoolExecutor(max_workers=DAEMON_MAX_WORKERS) as pool:
+        while max_runs is None or runs < max_runs:
+            now = clock()
+            busy = set(running.values())
+            for name in names:
+                if name not in busy and due_at[name] <= now:
+                    future = pool.submit(scrape_with_cache, name, cache_dir, False, sections[name])
+                    running[future] = name
+                    busy.add(name)
+            idle = [due_at[name] for name in names if name not in busy]
+            wait_for = max(0.0, min(idle) - now) if idle else None
+            if not running:
+                sleep(wait_for or 0.0)
+                continue
+            done, _ = wait(running, timeout=wait_for, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                runs += 1
+                due_at[name] = _next_run(name, clock())
+                exc = future.exception()
+                if exc is not None:
+                    print(f"{now_iso()} {name} failed: {exc}")
+                    continue
+                section = future.result()
+                sections[name] = section
+                digest = content_hash(section)
+                if digest == hashes.get(name):
+                    continue
+                hashes[name] = digest
+                results = [sections[other] for other in names]
+                _write_index(island, results, output_dir, inline_css, targets)
+                print(f"{now_iso()} updated {name}; rewrote {output_dir / 'index.html'}")
 
 
 def main() -> None:
@@ -91,6 +250,20 @@ def main() -> None:
         help="Run a single scraper by name (overrides island config)",
     )
     parser.add_argument("--offline", action="store_true", help="Render from cache only")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep running, scraping each source on its own interval",
+    )
+    parser.add_argument(
+        "--inline-css",
+        action="store_true",
+        help="Inline styles into index.html instead of writing a fingerprinted stylesheet",
+    )
+    parser.add_argument(
+        "--targets",
+        help=f"Comma-separated outputs to write ({', '.join(TARGETS)}); default from island config",
+    )
     parser.add_argument(
         "--output-dir", default="site", help="Output directory for generated pages"
     )
@@ -101,14 +274,22 @@ def main() -> None:
 
     output_dir = Path(args.output_dir)
     cache_dir = Path(args.cache_dir)
+    targets = [name.strip() for name in args.targets.split(",")] if args.targets else None
+    unknown = sorted(set(targets or []) - TARGETS.keys())
+    if unknown:
+        raise SystemExit(f"Unknown output target: {', '.join(unknown)}")
     if args.scraper:
         result = scrape_with_cache(args.scraper, cache_dir, args.offline)
         generated_at = now_iso()
         html = render_html(args.scraper.upper(), [result], generated_at)
         output_dir.mkdir(parents=True, exist_ok=True)
         (output_dir / f"{args.scraper}.html").write_text(html, encoding="utf-8")
+    elif args.daemon:
+        run_daemon(args.island, output_dir, cache_dir, inline_css=args.inline_css, targets=targets)
     else:
-        generate_island(args.island, output_dir, cache_dir, args.offline)
+        generate_island(
+            args.island, output_dir, cache_dir, args.offline, args.inline_css, targets
+        )
 
 
 if __name__ == "__main__":
@@ -1,10 +1,22 @@
 """Hawaii Climate Data Portal (HCDP) API client — Mesonet measurements."""
 
 from src.hcdp.client import MesonetClient
-from src.hcdp.parse import normalize_measurements_payload, pivot_latest_measurements
+from src.hcdp.parse import (
+    MeasurementColumns,
+    decode_measurement_columns,
+    normalize_measurements_payload,
+    pivot_latest_columns,
+    pivot_latest_measurements,
+)
+from src.hcdp.shared import measurements, register
 
 __all__ = [
+    "MeasurementColumns",
     "MesonetClient",
+    "decode_measurement_columns",
+    "measurements",
     "normalize_measurements_payload",
+    "pivot_latest_columns",
     "pivot_latest_measurements",
+    "register",
 ]
@@ -8,6 +8,7 @@ from urllib.parse import urlencode
 
 import httpx
 
+from src.hcdp.parse import MeasurementColumns, decode_measurement_columns
 from src.scrape.base import DEFAULT_HEADERS
 
 HCDP_BASE_URL = "https://api.hcdp.ikewai.org"
@@ -37,7 +38,7 @@ class MesonetClient:
     def has_credentials(self) -> bool:
         return bool(self._api_key)
 
-    def get_measurements(
+    def _fetch_payload(
         self,
         *,
         station_ids: str | Sequence[str],
@@ -52,7 +53,7 @@ class MesonetClient:
         offset: int | None = None,
         reverse: str | None = None,
         intervals: str | None = None,
-    ) -> list[dict[str, Any]]:
+    ) -> Any:
         if not self._api_key:
             raise RuntimeError("HCDP_API_KEY is not set.")
 
@@ -89,8 +90,11 @@ class MesonetClient:
         with httpx.Client(follow_redirects=True, timeout=self._timeout, headers=headers) as client:
             response = client.get(url)
             response.raise_for_status()
-            payload = response.json()
+            return response.json()
 
+    def get_measurements(self, **query: Any) -> list[dict[str, Any]]:
+        """Measurements as one dict per row; see ``_fetch_payload`` for the query options."""
+        payload = self._fetch_payload(**query)
         if isinstance(payload, list):
             return payload
         if isinstance(payload, dict) and "data" in payload and "index" in payload:
@@ -101,3 +105,6 @@ class MesonetClient:
             return [payload]
         return []
 
+    def get_measurement_columns(self, **query: Any) -> MeasurementColumns:
+        """Measurements decoded column-wise (cheaper for large multi-day pulls)."""
+        return decode_measurement_columns(self._fetch_payload(**query))
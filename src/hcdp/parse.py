@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from array import array
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
 
@@ -89,3 +91,142 @@ def pivot_latest_measurements(records: list[dict[str, Any]]) -> list[dict[str, A
         )
     return out
 
+
+@dataclass
+class MeasurementColumns:
+    """Long-format measurements decoded column-wise.
+
+    ``epoch`` and ``value`` are packed float arrays (NaN when missing); station and
+    variable ids are interned strings. Station metadata is kept once per station.
+    """
+
+    station_id: list[str] = field(default_factory=list)
+    variable: list[str] = field(default_factory=list)
+    epoch: array = field(default_factory=lambda: array("d"))
+    value: array = field(default_factory=lambda: array("d"))
+    metadata: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.epoch)
+
+    def select(self, var_ids) -> "MeasurementColumns":
+        wanted = set(var_ids)
+        keep = [i for i, var in enumerate(self.variable) if var in wanted]
+        return MeasurementColumns(
+            station_id=[self.station_id[i] for i in keep],
+            variable=[self.variable[i] for i in keep],
+            epoch=array("d", (self.epoch[i] for i in keep)),
+            value=array("d", (self.value[i] for i in keep)),
+            metadata=self.metadata,
+        )
+
+
+_NAN = float("nan")
+_META_FIELDS = ("station_name", "nws_id")
+
+
+def _epoch(raw: Any, memo: dict[Any, float]) -> float:
+    cached = memo.get(raw)
+    if cached is not None:
+        return cached
+    ts = _parse_timestamp(raw)
+    if ts is None:
+        result = _NAN
+    else:
+        if ts.tzinfo is None:
+            ts = ts.replace(tzinfo=timezone.utc)
+        result = ts.timestamp()
+    memo[raw] = result
+    return result
+
+
+def _column_value(raw: Any) -> float:
+    if isinstance(raw, (int, float)) and not isinstance(raw, bool):
+        return float(raw)
+    parsed = _float_value(raw)
+    return _NAN if parsed is None else parsed
+
+
+def decode_measurement_columns(payload: Any) -> MeasurementColumns:
+    """Decode a measurements response straight into columns, without per-row dicts.
+
+    Timestamps repeat across stations and variables, so each distinct string is parsed once.
+    """
+    cols = MeasurementColumns()
+    if isinstance(payload, dict) and "data" in payload and "index" in payload:
+        index = {name: pos for pos, name in enumerate(payload["index"])}
+        rows = [row for row in payload["data"] if isinstance(row, (list, tuple))]
+
+        def getter(name: str):
+            pos = index.get(name)
+            if pos is None:
+                return lambda row: None
+            return lambda row: row[pos] if pos < len(row) else None
+
+    else:
+        rows = normalize_measurements_payload(payload)
+
+        def getter(name: str):
+            return lambda row: row.get(name)
+
+    get_sid, get_var = getter("station_id"), getter("variable")
+    get_ts, get_value = getter("timestamp"), getter("value")
+    meta_getters = {name: getter(name) for name in _META_FIELDS}
+    ts_memo: dict[Any, float] = {}
+    interned: dict[str, str] = {}
+    for row in rows:
+        sid = str(get_sid(row) or "").strip()
+        var = str(get_var(row) or "").strip()
+        if not sid or not var:
+            continue
+        epoch = _epoch(get_ts(row), ts_memo)
+        if epoch != epoch:  # NaN: unparseable timestamp
+            continue
+        sid = interned.setdefault(sid, sid)
+        cols.station_id.append(sid)
+        cols.variable.append(interned.setdefault(var, var))
+        cols.epoch.append(epoch)
+        cols.value.append(_column_value(get_value(row)))
+        if sid not in cols.metadata:
+            meta = {name: get(row) for name, get in meta_getters.items()}
+            if any(meta.values()):
+                cols.metadata[sid] = meta
+    return cols
+
+
+def latest_indices(cols: MeasurementColumns) -> dict[tuple[str, str], int]:
+    """Row index of the newest measurement per (station, variable), in one pass."""
+    latest: dict[tuple[str, str], int] = {}
+    epoch = cols.epoch
+    for i, key in enumerate(zip(cols.station_id, cols.variable)):
+        prev = latest.get(key)
+        if prev is None or epoch[i] > epoch[prev]:
+            latest[key] = i
+    return latest
+
+
+def pivot_latest_columns(cols: MeasurementColumns) -> list[dict[str, Any]]:
+    """Columnar equivalent of ``pivot_latest_measurements``."""
+    by_station: dict[str, list[int]] = {}
+    for (sid, _), i in latest_indices(cols).items():
+        by_station.setdefault(sid, []).append(i)
+
+    out: list[dict[str, Any]] = []
+    for sid in sorted(by_station):
+        indices = by_station[sid]
+        ts_max = max(cols.epoch[i] for i in indices)
+        meta = cols.metadata.get(sid, {})
+        values: dict[str, float | None] = {}
+        for i in indices:
+            value = cols.value[i]
+            values[cols.variable[i]] = None if value != value else value
+        out.append(
+            {
+                "station_id": sid,
+                "station_name": str(meta.get("station_name") or sid).strip(),
+                "nws_id": meta.get("nws_id"),
+                "timestamp": datetime.fromtimestamp(ts_max, tz=timezone.utc),
+                "values": values,
+            }
+        )
+    return out
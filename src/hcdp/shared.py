@@ -0,0 +1,92 @@
+"""Shared Mesonet measurements: one merged, windowed request per run for every section.
+
+Sections register the variables and lookback they need at import time; the first
+section to read triggers a single request covering the union, and the decoded
+columns are memoized so later sections in the same run read from memory. The window
+is the longest resolved lookback; incremental readers keep theirs short once warm.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Sequence
+
+from src.hcdp.client import MesonetClient
+from src.hcdp.parse import MeasurementColumns
+
+HCDP_STATION_IDS = ("0603", "0601", "0602", "0611", "0641", "0621")
+# HCDP endpoint can intermittently 504; fail fast so the dependent sections still render.
+REQUEST_TIMEOUT = 20.0
+# How long a merged fetch (or its failure) is reused before hitting HCDP again.
+MEMO_TTL_SECONDS = 300
+SAMPLE_MINUTES = 5
+
+Lookback = timedelta | Callable[[], timedelta]
+
+_LOCK = threading.Lock()
+_SUBSCRIPTIONS: dict[str, list[Lookback]] = {}
+_MEMO: dict[str, Any] = {}
+
+
+def register(var_ids: Sequence[str], lookback: Lookback) -> None:
+    """Declare variables a section reads; the merged window covers the longest lookback.
+
+    ``lookback`` may be a callable evaluated at fetch time, so incremental readers can
+    ask only for rows newer than what they already stored.
+    """
+    with _LOCK:
+        for var_id in var_ids:
+            _SUBSCRIPTIONS.setdefault(var_id, []).append(lookback)
+        _MEMO.clear()
+
+
+def reset() -> None:
+    with _LOCK:
+        _MEMO.clear()
+
+
+def has_credentials() -> bool:
+    return MesonetClient().has_credentials
+
+
+def _row_limit(n_stations: int, n_vars: int, lookback: timedelta) -> int:
+    samples = int(lookback.total_seconds() // (SAMPLE_MINUTES * 60)) + 1
+    return max(int(n_stations * n_vars * samples * 1.1), 120)
+
+
+def _resolve(lookback: Lookback) -> timedelta:
+    return lookback() if callable(lookback) else lookback
+
+
+def _fetch_merged() -> MeasurementColumns:
+    var_ids = tuple(sorted(_SUBSCRIPTIONS))
+    lookback = max(_resolve(lb) for lbs in _SUBSCRIPTIONS.values() for lb in lbs)
+    start_utc = datetime.now(tz=timezone.utc) - lookback
+    client = MesonetClient(timeout=REQUEST_TIMEOUT)
+    return client.get_measurement_columns(
+        station_ids=HCDP_STATION_IDS,
+        var_ids=var_ids,
+        start_date=start_utc.isoformat(timespec="seconds").replace("+00:00", "Z"),
+        limit=_row_limit(len(HCDP_STATION_IDS), len(var_ids), lookback),
+    )
+
+
+def measurements(var_ids: Sequence[str]) -> MeasurementColumns:
+    """Columns for ``var_ids`` from this run's merged request; raises if that request failed."""
+    with _LOCK:
+        memo_fresh = _MEMO and time.monotonic() - _MEMO["fetched_at"] < MEMO_TTL_SECONDS
+        if not memo_fresh:
+            _MEMO.clear()
+            try:
+                _MEMO["columns"] = _fetch_merged()
+                _MEMO["error"] = None
+            except Exception as exc:  # noqa: BLE001 - replayed to every reader
+                _MEMO["columns"] = MeasurementColumns()
+                _MEMO["error"] = exc
+            _MEMO["fetched_at"] = time.monotonic()
+        if _MEMO["error"] is not None:
+            raise _MEMO["error"]
+        columns = _MEMO["columns"]
+    return columns.select(var_ids)
@@ -0,0 +1,104 @@
+"""Per-section JSON documents and a change feed written next to index.html.
+
+``site/api/<id>.json`` holds one section: its structured data and rows when the
+scraper provides them, plain text, html, ``retrieved_at``, stale/error flags and a
+content hash. ``site/api/changes.json`` lists every section's hash and which
+sections changed since the previous build, so pollers fetch only those.
+"""
+
+from __future__ import annotations
+
+import html
+import json
+import re
+from pathlib import Path
+
+from src.render.compress import remove_site_file, write_site_file
+from src.render.html import label_to_id
+from src.scrape.cache import content_hash
+
+API_DIR_NAME = "api"
+CHANGES_NAME = "changes.json"
+
+
+def _plain_label(label: str) -> str:
+    return html.unescape(re.sub(r"<[^>]+>", "", label)).strip()
+
+
+def section_document(section: dict) -> dict:
+    label = str(section.get("label", ""))
+    return {
+        "id": section["id"],
+        "label": _plain_label(label),
+        "anchor": label_to_id(label),
+        "retrieved_at": section.get("retrieved_at"),
+        "stale": bool(section.get("stale")),
+        "error": section.get("error"),
+        "content_hash": content_hash(section),
+        "source_urls": section.get("source_urls", []),
+        "data": section.get("data"),
+        "rows": section.get("rows"),
+        "text": section.get("text"),
+        "html": section.get("html"),
+    }
+
+
+def _dump(payload: dict) -> bytes:
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _load_changes(api_dir: Path) -> dict:
+    try:
+        changes = json.loads((api_dir / CHANGES_NAME).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return changes if isinstance(changes, dict) else {}
+
+
+def write_api(results: list[dict], output_dir: Path, generated_at: str) -> list[str]:
+    """Write section documents and the change feed; returns the ids whose content changed.
+
+    A document is rewritten when its content hash or its ``retrieved_at``, stale flag
+    or error differ from the previous build, so it never reports older freshness than
+    ``changes.json``. Documents of sections no longer on the page are removed.
+    """
+    api_dir = output_dir / API_DIR_NAME
+    previous = _load_changes(api_dir)
+    previous_sections = previous.get("sections", {})
+    sections = {}
+    changed = []
+    for section in results:
+        if section.get("skip") or not section.get("id"):
+            continue
+        document = section_document(section)
+        section_id = document["id"]
+        path = api_dir / f"{section_id}.json"
+        before = previous_sections.get(section_id, {})
+        entry = {
+            "content_hash": document["content_hash"],
+            "retrieved_at": document["retrieved_at"],
+            "stale": document["stale"],
+            "error": document["error"],
+            "url": f"{section_id}.json",
+        }
+        if before.get("content_hash") != document["content_hash"]:
+            changed.append(section_id)
+        if before != entry or not path.exists():
+            write_site_file(path, _dump(document))
+        sections[section_id] = entry
+    for section_id in previous_sections.keys() - sections.keys():
+        remove_site_file(api_dir / f"{section_id}.json")
+    removed = sorted(previous_sections.keys() - sections.keys())
+    write_site_file(
+        api_dir / CHANGES_NAME,
+        _dump(
+            {
+                "generated_at": generated_at,
+                "previous_generated_at": previous.get("generated_at"),
+                "changed": changed,
+                "removed": removed,
+                "sections": sections,
+            }
+        ),
+    )
+    return changed
@@ -0,0 +1,77 @@
+"""Plain-text bulletin for Winlink and SMS relays, built from sections' structured data.
+
+Summarizers (``SUMMARIZERS`` in ``src.scrape.registry``) turn a section's ``data``
+into ``(status class, line)`` pairs, using the same status classes as the tables.
+Lines are ranked by severity, folded to ASCII and kept until the byte budget is
+reached; a last line counts what did not fit. No HTML is parsed.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+
+from src.render.html import format_ts
+from src.scrape.registry import get_summarizer
+
+BULLETIN_NAME = "bulletin.txt"
+# Longest single line, so one long headline cannot crowd out the rest.
+LINE_MAX_CHARS = 160
+# Status class -> rank; unknown classes rank as plain information.
+SEVERITY = {"status-red": 3, "status-yellow": 2, "": 1, "status-green": 0}
+_REPLACEMENTS = str.maketrans({"▲": "up ", "▼": "down ", "·": "-", "—": "-", "–": "-", "↔": "-"})
+
+
+def fold_line(text: str) -> str:
+    """ASCII-only, single-spaced and at most ``LINE_MAX_CHARS`` long."""
+    text = unicodedata.normalize("NFKD", text.translate(_REPLACEMENTS))
+    text = re.sub(r"\s+", " ", text.encode("ascii", "ignore").decode("ascii")).strip()
+    if len(text) > LINE_MAX_CHARS:
+        text = text[: LINE_MAX_CHARS - 2].rstrip() + ".."
+    return text
+
+
+def bulletin_lines(providers: list[dict]) -> list[str]:
+    """Summary lines of every section with a summarizer, most severe first."""
+    entries = []
+    for order, provider in enumerate(providers):
+        summarize = get_summarizer(provider.get("id", ""))
+        if provider.get("skip") or summarize is None or "data" not in provider:
+            continue
+        try:
+            lines = summarize(provider["data"])
+        except Exception as exc:  # noqa: BLE001 - one bad section must not sink the bulletin
+            print(f"Bulletin summary failed for {provider.get('id')}: {exc}")
+            continue
+        suffix = " (stale)" if provider.get("stale") else ""
+        for status_class, line in lines:
+            entries.append((-SEVERITY.get(status_class, 1), order, fold_line(line + suffix)))
+    entries.sort(key=lambda entry: entry[:2])
+    return [line for _, _, line in entries if line]
+
+
+def build_bulletin(island_name: str, providers: list[dict], generated_at: str, max_bytes: int) -> str:
+    """The bulletin text, at most ``max_bytes`` bytes including newlines.
+
+    The header is cut to fit a tiny budget, and the "+N more" line is dropped when
+    even it does not fit; a budget below one byte yields an empty bulletin.
+    """
+    if max_bytes < 1:
+        return ""
+    header = fold_line(f"{island_name.upper()} SITREP {format_ts(generated_at)}")
+    header = header[: max_bytes - 1]
+    lines = bulletin_lines(providers) or ["No reports available."]
+    kept = [header]
+    size = len(header) + 1
+    for position, line in enumerate(lines):
+        left_out = len(lines) - position
+        # Room for a "+N more" line must remain unless this is the last line.
+        reserve = 0 if left_out == 1 else len(f"+{left_out - 1} more") + 1
+        if size + len(line) + 1 + reserve > max_bytes:
+            more = f"+{left_out} more"
+            if size + len(more) + 1 <= max_bytes:
+                kept.append(more)
+            break
+        kept.append(line)
+        size += len(line) + 1
+    return "\n".join(kept) + "\n"
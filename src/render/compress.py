@@ -0,0 +1,73 @@
+"""Write site files together with precompressed ``.gz``, ``.br`` and ``.zst`` siblings.
+
+Each sibling is compressed once, at build time, at the codec's highest level, so
+static hosts (``gzip_static``/``brotli_static``) and ``src.serve`` can send it
+as-is. Brotli needs the ``brotli`` package from requirements.txt; if it is missing a
+warning is raised, no ``.br`` is written and any old one is removed so it never
+outlives its source.
+"""
+
+from __future__ import annotations
+
+import gzip
+import warnings
+from pathlib import Path
+
+import zstandard
+
+from src.scrape.cache import write_atomic
+
+try:
+    import brotli
+except ImportError:  # warned about on write; .gz and .zst are always written
+    brotli = None
+
+# Site files are read by whatever serves them, not just the generating user.
+SITE_FILE_MODE = 0o644
+
+
+def _gzip(data: bytes) -> bytes:
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _zstd(data: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=zstandard.MAX_COMPRESSION_LEVEL).compress(data)
+
+
+def _brotli(data: bytes) -> bytes:
+    return brotli.compress(data, quality=11)
+
+
+# Sibling suffix -> (HTTP content-coding, compressor).
+COMPRESSED_SUFFIXES = {
+    ".br": ("br", _brotli if brotli is not None else None),
+    ".zst": ("zstd", _zstd),
+    ".gz": ("gzip", _gzip),
+}
+
+
+def sibling_path(path: Path, suffix: str) -> Path:
+    return path.with_name(path.name + suffix)
+
+
+def write_site_file(path: Path, data: bytes) -> None:
+    """Write ``path`` and then its compressed siblings (so a sibling is never older)."""
+    write_atomic(path, data, mode=SITE_FILE_MODE)
+    for suffix, (_encoding, compress) in COMPRESSED_SUFFIXES.items():
+        sibling = sibling_path(path, suffix)
+        if compress is None:
+            warnings.warn(
+                f"brotli is not installed, so no {suffix} files are written; "
+                "install it with pip install -r requirements.txt",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            sibling.unlink(missing_ok=True)
+        else:
+            write_atomic(sibling, compress(data), mode=SITE_FILE_MODE)
+
+
+def remove_site_file(path: Path) -> None:
+    path.unlink(missing_ok=True)
+    for suffix in COMPRESSED_SUFFIXES:
+        sibling_path(path, suffix).unlink(missing_ok=True)
@@ -1,14 +1,384 @@
 import datetime as dt
+import hashlib
 import html as html_module
 import re
 from pathlib import Path
 
-from bs4 import BeautifulSoup
+from src.render.tables import collapse_tables, ensure_compact_tables
 
 HST = dt.timezone(dt.timedelta(hours=-10))
+# Fingerprinted stylesheets live under this directory of the site.
+ASSETS_DIR = "assets"
+# Page variants: "desktop" (live-updating), "mobile" (one column, tables collapsed)
+# and "kiosk" (no contents list, larger type, reloads itself).
+VARIANTS = ("desktop", "mobile", "kiosk")
+KIOSK_REFRESH_SECONDS = 300
+_STYLE_RE = re.compile(r"<style\b[^>]*>(.*?)</style>", re.DOTALL | re.IGNORECASE)
 
+PAGE_CSS = """
+:root {
+  color-scheme: light dark;
+  --bg: #fff;
+  --text: #111;
+  --text-muted: #555;
+  --border: #e2e2e2;
+  --header-border: #ddd;
+  --module-bg: #fff;
+  --link: #0b4d9b;
+  --code-bg: #f5f5f5;
+  --footer-border: #eee;
+  --status-text: #111;
+  --stale-bg: #fffbe6;
+  --stale-border: #e6b800;
+  --stale-badge-bg: #fff4cc;
+  --stale-badge-text: #7a5d00;
+  --error-text: #8a1c1c;
+  --breaking-bg: #fde2e2;
+  --breaking-border: #c62828;
+  --breaking-label: #b71c1c;
+  --warn-text: #8a6d00;
+  --alert-text: #8a1c1c;
+  --shadow: rgba(0, 0, 0, 0.05);
+  --row-hover: rgba(0, 0, 0, 0.03);
+  --table-row-border: rgba(0, 0, 0, 0.08);
+}
+@media (prefers-color-scheme: dark) {
+  :root {
+    --bg: #121212;
+    --text: #e8e8e8;
+    --text-muted: #aaa;
+    --border: #333;
+    --header-border: #333;
+    --module-bg: #1a1a1a;
+    --link: #6eb3ff;
+    --code-bg: #2a2a2a;
+    --footer-border: #333;
+    --status-text: #e8e8e8;
+    --stale-bg: #2a2610;
+    --stale-border: #b89400;
+    --stale-badge-bg: #3d3510;
+    --stale-badge-text: #e6c84a;
+    --error-text: #f4a4a4;
+    --breaking-bg: #3d1a1a;
+    --breaking-border: #c62828;
+    --breaking-label: #ff8a80;
+    --warn-text: #e6c84a;
+    --alert-text: #f4a4a4;
+    --shadow: rgba(0, 0, 0, 0.3);
+    --row-hover: rgba(255, 255, 255, 0.04);
+    --table-row-border: rgba(255, 255, 255, 0.08);
+  }
+}
+* {
+  box-sizing: border-box;
+}
+body {
+  font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
+  margin: 0;
+  padding: 1rem;
+  line-height: 1.4;
+  color: var(--text);
+  background: var(--bg);
+}
+.breaking-news-banner {
+  background: var(--breaking-bg);
+  border: 2px solid var(--breaking-border);
+  border-radius: 6px;
+  padding: 0.75rem 1rem;
+  margin-bottom: 1rem;
+}
+.breaking-news-label {
+  font-weight: 700;
+  font-size: 1rem;
+  color: var(--breaking-label);
+  margin-bottom: 0.35rem;
+  text-transform: uppercase;
+  letter-spacing: 0.03em;
+}
+.breaking-news-body {
+  font-size: 0.95rem;
+}
+.breaking-news-body p {
+  margin: 0.35rem 0 0;
+}
+.breaking-news-body p:first-child {
+  margin-top: 0;
+}
+header {
+  border-bottom: 1px solid var(--header-border);
+  margin-bottom: 1rem;
+}
+h1 {
+  margin: 0 0 0.15rem;
+  font-size: 1.6rem;
+  letter-spacing: -0.01em;
+}
+h2 {
+  margin: 0;
+  font-size: 1.05rem;
+}
+h3 {
+  margin: 0.5rem 0 0.25rem;
+  font-size: 0.95rem;
+  color: var(--text-muted);
+}
+.toc ul {
+  margin: 0;
+  padding-left: 1.1rem;
+  columns: 2;
+  column-gap: 1.25rem;
+}
+.toc li {
+  break-inside: avoid;
+}
+@media (max-width: 480px) {
+  .toc ul {
+    columns: 1;
+  }
+}
+.modules {
+  display: grid;
+  grid-template-columns: repeat(2, minmax(0, 1fr));
+  gap: 1rem;
+  align-items: stretch;
+}
+.module {
+  border: 1px solid var(--border);
+  padding: 0.85rem 1rem;
+  margin: 0;
+  border-radius: 8px;
+  background: var(--module-bg);
+  box-shadow: 0 1px 2px var(--shadow);
+  display: flex;
+  flex-direction: column;
+  min-width: 0;
+}
+.module > h2 {
+  padding-bottom: 0.4rem;
+  margin-bottom: 0.4rem;
+  border-bottom: 1px solid var(--border);
+}
+.module > .meta {
+  margin: -0.15rem 0 0.5rem;
+}
+.module--narrow {
+  grid-column: span 1;
+}
+.module--full {
+  grid-column: 1 / -1;
+}
+.module--stale {
+  border-left: 3px solid var(--stale-border);
+  background: var(--module-bg);
+}
+.provider-status {
+  display: flex;
+  flex-wrap: wrap;
+  align-items: center;
+  gap: 0.35rem 0.5rem;
+  margin: 0.15rem 0 0.5rem;
+}
+.status-badge {
+  display: inline-block;
+  font-size: 0.65rem;
+  font-weight: 600;
+  text-transform: uppercase;
+  letter-spacing: 0.04em;
+  padding: 0.1rem 0.35rem;
+  border-radius: 3px;
+  line-height: 1.3;
+}
+.status-badge--stale {
+  background: var(--stale-badge-bg);
+  color: var(--stale-badge-text);
+  border: 1px solid var(--stale-border);
+}
+.status--error {
+  color: var(--error-text);
+  font-size: 0.75rem;
+  margin: 0;
+}
+.meta {
+  color: var(--text-muted);
+  font-size: 0.7rem;
+  margin-top: 0;
+}
+.status {
+  color: var(--status-text);
+  font-size: 0.8rem;
+  margin-top: 0;
+}
 
-def _format_ts(ts: str | None) -> str:
+.info {
+  color: var(--text-muted);
+  font-size: 0.8rem;
+  margin-top: 0;
+}
+.info::before {
+  content: "ⓘ ";
+}
+.info code {
+  background: var(--code-bg);
+  padding: 0.2rem 0.4rem;
+  border-radius: 4px;
+}
+ul {
+  padding-left: 1.1rem;
+  margin-top: 0.5rem;
+}
+a {
+  color: var(--link);
+  text-decoration: none;
+}
+a:hover {
+  text-decoration: underline;
+}
+th,
+td {
+  padding: 0.15rem 0.5rem;
+  vertical-align: top;
+}
+th {
+  text-align: left;
+  font-weight: 600;
+}
+.status-cell {
+  white-space: nowrap;
+  font-variant-numeric: tabular-nums;
+}
+.status-green {
+  color: var(--text-muted);
+}
+.status-yellow {
+  color: var(--warn-text);
+  font-weight: 600;
+}
+.status-red {
+  color: var(--alert-text);
+  font-weight: 700;
+}
+.module .status-table-wrap {
+  display: block;
+  width: 100%;
+  max-width: 100%;
+  min-width: 0;
+}
+.module table.status-table-compact {
+  width: 100%;
+  max-width: 100%;
+  font-size: 0.85rem;
+  border-collapse: collapse;
+  table-layout: auto;
+}
+.module table.status-table-compact th {
+  color: var(--text-muted);
+  font-weight: 600;
+  border-bottom: 1px solid var(--border);
+}
+.module table.status-table-compact th,
+.module table.status-table-compact td {
+  white-space: normal;
+  overflow-wrap: break-word;
+  word-break: break-word;
+  padding: 0.18rem 0.4rem;
+  vertical-align: top;
+}
+.module table.status-table-compact tbody tr + tr td {
+  border-top: 1px solid var(--table-row-border);
+}
+.module table.status-table-compact tbody tr:hover td {
+  background: var(--row-hover);
+}
+.module .info-td-num {
+  text-align: right;
+  font-variant-numeric: tabular-nums;
+}
+.module .info-module td.info-td-phone {
+  white-space: nowrap;
+}
+.footer {
+  border-top: 1px solid var(--footer-border);
+  color: var(--text-muted);
+  font-size: 0.9rem;
+  margin-top: 1rem;
+}
+details {
+  margin: 0.5rem 0 0 0.5rem;
+}
+.info-module .info-td-notes,
+.info-module .info-kicker {
+  color: var(--text-muted);
+}
+.solid-waste-table tbody tr + tr td {
+  border-top-color: var(--table-row-border);
+}
+@media (prefers-color-scheme: dark) {
+  .time-wheel .tw-hole {
+    fill: var(--bg);
+  }
+  .time-wheel .tw-seg--day {
+    fill: #1a2a3a;
+  }
+  .time-wheel .tw-label--inner,
+  .time-wheel .tw-label--outer {
+    fill: var(--text);
+  }
+  .time-wheel .tw-outer-label {
+    fill: var(--text-muted);
+  }
+}
+.table-collapse > summary {
+  color: var(--text-muted);
+  font-size: 0.85rem;
+  cursor: pointer;
+}
+.variant-mobile .modules {
+  grid-template-columns: 1fr;
+}
+.variant-kiosk {
+  font-size: 1.2rem;
+}
+.variant-kiosk .modules {
+  grid-template-columns: repeat(3, minmax(0, 1fr));
+}
+@media (max-width: 720px) {
+  .modules {
+    grid-template-columns: 1fr;
+  }
+}
+"""
+
+
+def minify_css(css: str) -> str:
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def page_stylesheet(providers: list[dict]) -> str:
+    """Minified page CSS followed by each section's own styles, in page order.
+
+    Sections declare styles in a ``css`` key; ``<style>`` blocks still embedded in
+    older cached html are collected too (and stripped from the body when rendering).
+    """
+    parts = [PAGE_CSS]
+    for provider in providers:
+        if provider.get("skip"):
+            continue
+        if provider.get("css"):
+            parts.append(provider["css"])
+        parts.extend(_STYLE_RE.findall(provider.get("html") or ""))
+    return minify_css("\n".join(dict.fromkeys(parts)))
+
+
+def stylesheet_name(css: str) -> str:
+    return f"dash.{hashlib.sha256(css.encode('utf-8')).hexdigest()[:12]}.css"
+
+
+def format_ts(ts: str | None) -> str:
+    """ISO timestamp as ``YYYY-MM-DD HH:MM HST``; naive times are taken as HST."""
     if not ts:
         return "unknown"
     try:
@@ -106,45 +476,13 @@ def _next_update_ts(
     return fallback.astimezone(HST).strftime("%H:%M HST")
 
 
-def _label_to_id(label: str) -> str:
+def label_to_id(label: str) -> str:
+    """Anchor id of a section label (tags stripped, lowercase, dash-separated)."""
     text = re.sub(r"<[^>]+>", "", label)
     text = re.sub(r"[^a-zA-Z0-9]+", "-", text).strip("-").lower()
     return text or "section"
 
 
-def _ensure_compact_tables(fragment: str) -> str:
-    """Wrap every table in a horizontal-scroll container and mark compact styling."""
-    if "<table" not in fragment.lower():
-        return fragment
-    soup = BeautifulSoup(f"<body>{fragment}</body>", "lxml")
-    body = soup.body
-    if not body:
-        return fragment
-    for table in list(body.find_all("table", recursive=True)):
-        parent = table.parent
-        if parent and parent.name == "div":
-            pclass = parent.get("class") or []
-            if isinstance(pclass, str):
-                pclass = pclass.split()
-            if "status-table-wrap" in pclass:
-                tclass = table.get("class") or []
-                if isinstance(tclass, str):
-                    tclass = tclass.split()
-                if "status-table-compact" not in tclass:
-                    tclass.append("status-table-compact")
-                    table["class"] = tclass
-                continue
-        tclass = table.get("class") or []
-        if isinstance(tclass, str):
-            tclass = tclass.split()
-        if "status-table-compact" not in tclass:
-            tclass.append("status-table-compact")
-            table["class"] = tclass
-        wrap = soup.new_tag("div", attrs={"class": "status-table-wrap"})
-        table.wrap(wrap)
-    return body.decode_contents()
-
-
 def _provider_status_note(provider: dict) -> tuple[str, list[str]]:
     extra_classes: list[str] = []
     parts: list[str] = []
@@ -165,7 +503,37 @@ def _provider_status_note(provider: dict) -> tuple[str, list[str]]:
     return f'<p class="provider-status">{"".join(parts)}</p>', extra_classes
 
 
-def render_html(island_name: str, providers: list[dict], generated_at: str) -> str:
+# Only the desktop page is index.html, whose sections src.serve pushes over /events.
+_LIVE_SCRIPT = """<script>
+    // Live section updates when served by src.serve; elsewhere /events is missing and this stays idle.
+    if (window.EventSource && location.protocol.indexOf("http") === 0) {
+      var updates = new EventSource("events");
+      updates.addEventListener("section", function (event) {
+        var data = JSON.parse(event.data);
+        var section = document.getElementById(data.id);
+        if (section) {
+          section.outerHTML = data.html;
+        } else {
+          location.reload();
+        }
+      });
+      updates.addEventListener("reload", function () {
+        location.reload();
+      });
+    }
+  </script>"""
+
+
+def render_html(
+    island_name: str,
+    providers: list[dict],
+    generated_at: str,
+    stylesheet_href: str | None = None,
+    variant: str = "desktop",
+) -> str:
+    """Render one page variant; styles are inlined unless ``stylesheet_href`` names a stylesheet."""
+    if variant not in VARIANTS:
+        raise ValueError(f"Unknown page variant: {variant}")
     sections = []
     toc_items = []
     banner_html = ""
@@ -173,7 +541,7 @@ def render_html(island_name: str, providers: list[dict], generated_at: str) -> s
         if provider.get("skip"):
             continue
         if provider.get("banner") or provider.get("id") == "breaking_news":
-            body = provider.get("html") or ""
+            body = _STYLE_RE.sub("", provider.get("html") or "")
             banner_html = (
                 '<div class="breaking-news-banner" role="alert">'
                 '<div class="breaking-news-label">Breaking News</div>'
@@ -184,15 +552,17 @@ def render_html(island_name: str, providers: list[dict], generated_at: str) -> s
 
         status_note, status_classes = _provider_status_note(provider)
         retrieved_at_raw = provider.get("retrieved_at")
-        last_retrieved = _format_ts(retrieved_at_raw)
+        last_retrieved = format_ts(retrieved_at_raw)
         retrieved_dt_attr = html_module.escape(str(retrieved_at_raw)) if retrieved_at_raw else ""
         meta_html = (
             f"<p class=\"meta\"><time datetime=\"{retrieved_dt_attr}\">{last_retrieved}</time></p>"
         )
 
-        body = provider.get("html") or "<p>No updates available.</p>"
-        body = _ensure_compact_tables(body)
-        section_id = _label_to_id(str(provider.get("label", "")))
+        body = _STYLE_RE.sub("", provider.get("html") or "") or "<p>No updates available.</p>"
+        body = ensure_compact_tables(body)
+        if variant == "mobile":
+            body = collapse_tables(body)
+        section_id = label_to_id(str(provider.get("label", "")))
         toc_items.append(
             f"<li><a href=\"#{section_id}\">{provider['label']}</a></li>"
         )
@@ -209,7 +579,7 @@ def render_html(island_name: str, providers: list[dict], generated_at: str) -> s
             f"</section>"
         )
 
-    generated = _format_ts(generated_at)
+    generated = format_ts(generated_at)
     schedule = _load_cron_schedule()
     next_update = _next_update_ts(generated_at, schedule)
     toc_nav = "<nav class=\"toc\"><ul>" + "".join(toc_items) + "</ul></nav>"
@@ -218,332 +588,27 @@ def render_html(island_name: str, providers: list[dict], generated_at: str) -> s
         f"{toc_nav}"
         "</section>"
     )
+    if variant == "kiosk":
+        toc_section = ""
+    live_script = _LIVE_SCRIPT if variant == "desktop" else ""
+    refresh = (
+        f'\n  <meta http-equiv="refresh" content="{KIOSK_REFRESH_SECONDS}">'
+        if variant == "kiosk"
+        else ""
+    )
+    if stylesheet_href:
+        stylesheet = f'<link rel="stylesheet" href="{html_module.escape(stylesheet_href)}">'
+    else:
+        stylesheet = f"<style>{page_stylesheet(providers)}</style>"
     html = f"""<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1">
+  <meta name="viewport" content="width=device-width, initial-scale=1">{refresh}
   <title>{island_name} Dashboard</title>
-  <style>
-    :root {{
-      color-scheme: light dark;
-      --bg: #fff;
-      --text: #111;
-      --text-muted: #555;
-      --border: #e2e2e2;
-      --header-border: #ddd;
-      --module-bg: #fff;
-      --link: #0b4d9b;
-      --code-bg: #f5f5f5;
-      --footer-border: #eee;
-      --status-text: #111;
-      --stale-bg: #fffbe6;
-      --stale-border: #e6b800;
-      --stale-badge-bg: #fff4cc;
-      --stale-badge-text: #7a5d00;
-      --error-text: #8a1c1c;
-      --breaking-bg: #fde2e2;
-      --breaking-border: #c62828;
-      --breaking-label: #b71c1c;
-      --warn-text: #8a6d00;
-      --alert-text: #8a1c1c;
-      --shadow: rgba(0, 0, 0, 0.05);
-      --row-hover: rgba(0, 0, 0, 0.03);
-      --table-row-border: rgba(0, 0, 0, 0.08);
-    }}
-    @media (prefers-color-scheme: dark) {{
-      :root {{
-        --bg: #121212;
-        --text: #e8e8e8;
-        --text-muted: #aaa;
-        --border: #333;
-        --header-border: #333;
-        --module-bg: #1a1a1a;
-        --link: #6eb3ff;
-        --code-bg: #2a2a2a;
-        --footer-border: #333;
-        --status-text: #e8e8e8;
-        --stale-bg: #2a2610;
-        --stale-border: #b89400;
-        --stale-badge-bg: #3d3510;
-        --stale-badge-text: #e6c84a;
-        --error-text: #f4a4a4;
-        --breaking-bg: #3d1a1a;
-        --breaking-border: #c62828;
-        --breaking-label: #ff8a80;
-        --warn-text: #e6c84a;
-        --alert-text: #f4a4a4;
-        --shadow: rgba(0, 0, 0, 0.3);
-        --row-hover: rgba(255, 255, 255, 0.04);
-        --table-row-border: rgba(255, 255, 255, 0.08);
-      }}
-    }}
-    * {{
-      box-sizing: border-box;
-    }}
-    body {{
-      font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
-      margin: 0;
-      padding: 1rem;
-      line-height: 1.4;
-      color: var(--text);
-      background: var(--bg);
-    }}
-    .breaking-news-banner {{
-      background: var(--breaking-bg);
-      border: 2px solid var(--breaking-border);
-      border-radius: 6px;
-      padding: 0.75rem 1rem;
-      margin-bottom: 1rem;
-    }}
-    .breaking-news-label {{
-      font-weight: 700;
-      font-size: 1rem;
-      color: var(--breaking-label);
-      margin-bottom: 0.35rem;
-      text-transform: uppercase;
-      letter-spacing: 0.03em;
-    }}
-    .breaking-news-body {{
-      font-size: 0.95rem;
-    }}
-    .breaking-news-body p {{
-      margin: 0.35rem 0 0;
-    }}
-    .breaking-news-body p:first-child {{
-      margin-top: 0;
-    }}
-    header {{
-      border-bottom: 1px solid var(--header-border);
-      margin-bottom: 1rem;
-    }}
-    h1 {{
-      margin: 0 0 0.15rem;
-      font-size: 1.6rem;
-      letter-spacing: -0.01em;
-    }}
-    h2 {{
-      margin: 0;
-      font-size: 1.05rem;
-    }}
-    h3 {{
-      margin: 0.5rem 0 0.25rem;
-      font-size: 0.95rem;
-      color: var(--text-muted);
-    }}
-    .toc ul {{
-      margin: 0;
-      padding-left: 1.1rem;
-      columns: 2;
-      column-gap: 1.25rem;
-    }}
-    .toc li {{
-      break-inside: avoid;
-    }}
-    @media (max-width: 480px) {{
-      .toc ul {{
-        columns: 1;
-      }}
-    }}
-    .modules {{
-      display: grid;
-      grid-template-columns: repeat(2, minmax(0, 1fr));
-      gap: 1rem;
-      align-items: stretch;
-    }}
-    .module {{
-      border: 1px solid var(--border);
-      padding: 0.85rem 1rem;
-      margin: 0;
-      border-radius: 8px;
-      background: var(--module-bg);
-      box-shadow: 0 1px 2px var(--shadow);
-      display: flex;
-      flex-direction: column;
-      min-width: 0;
-    }}
-    .module > h2 {{
-      padding-bottom: 0.4rem;
-      margin-bottom: 0.4rem;
-      border-bottom: 1px solid var(--border);
-    }}
-    .module > .meta {{
-      margin: -0.15rem 0 0.5rem;
-    }}
-    .module--narrow {{
-      grid-column: span 1;
-    }}
-    .module--full {{
-      grid-column: 1 / -1;
-    }}
-    .module--stale {{
-      border-left: 3px solid var(--stale-border);
-      background: var(--module-bg);
-    }}
-    .provider-status {{
-      display: flex;
-      flex-wrap: wrap;
-      align-items: center;
-      gap: 0.35rem 0.5rem;
-      margin: 0.15rem 0 0.5rem;
-    }}
-    .status-badge {{
-      display: inline-block;
-      font-size: 0.65rem;
-      font-weight: 600;
-      text-transform: uppercase;
-      letter-spacing: 0.04em;
-      padding: 0.1rem 0.35rem;
-      border-radius: 3px;
-      line-height: 1.3;
-    }}
-    .status-badge--stale {{
-      background: var(--stale-badge-bg);
-      color: var(--stale-badge-text);
-      border: 1px solid var(--stale-border);
-    }}
-    .status--error {{
-      color: var(--error-text);
-      font-size: 0.75rem;
-      margin: 0;
-    }}
-    .meta {{
-      color: var(--text-muted);
-      font-size: 0.7rem;
-      margin-top: 0;
-    }}
-    .status {{
-      color: var(--status-text);
-      font-size: 0.8rem;
-      margin-top: 0;
-    }}
-
-    .info {{
-      color: var(--text-muted);
-      font-size: 0.8rem;
-      margin-top: 0;
-    }}
-    .info::before {{
-      content: "ⓘ ";
-    }}
-    .info code {{
-      background: var(--code-bg);
-      padding: 0.2rem 0.4rem;
-      border-radius: 4px;
-    }}
-    ul {{
-      padding-left: 1.1rem;
-      margin-top: 0.5rem;
-    }}
-    a {{
-      color: var(--link);
-      text-decoration: none;
-    }}
-    a:hover {{
-      text-decoration: underline;
-    }}
-    th,
-    td {{
-      padding: 0.15rem 0.5rem;
-      vertical-align: top;
-    }}
-    th {{
-      text-align: left;
-      font-weight: 600;
-    }}
-    .status-cell {{
-      white-space: nowrap;
-      font-variant-numeric: tabular-nums;
-    }}
-    .status-green {{
-      color: var(--text-muted);
-    }}
-    .status-yellow {{
-      color: var(--warn-text);
-      font-weight: 600;
-    }}
-    .status-red {{
-      color: var(--alert-text);
-      font-weight: 700;
-    }}
-    .module .status-table-wrap {{
-      display: block;
-      width: 100%;
-      max-width: 100%;
-      min-width: 0;
-    }}
-    .module table.status-table-compact {{
-      width: 100%;
-      max-width: 100%;
-      font-size: 0.85rem;
-      border-collapse: collapse;
-      table-layout: auto;
-    }}
-    .module table.status-table-compact th {{
-      color: var(--text-muted);
-      font-weight: 600;
-      border-bottom: 1px solid var(--border);
-    }}
-    .module table.status-table-compact th,
-    .module table.status-table-compact td {{
-      white-space: normal;
-      overflow-wrap: break-word;
-      word-break: break-word;
-      padding: 0.18rem 0.4rem;
-      vertical-align: top;
-    }}
-    .module table.status-table-compact tbody tr + tr td {{
-      border-top: 1px solid var(--table-row-border);
-    }}
-    .module table.status-table-compact tbody tr:hover td {{
-      background: var(--row-hover);
-    }}
-    .module .info-td-num {{
-      text-align: right;
-      font-variant-numeric: tabular-nums;
-    }}
-    .module .info-module td.info-td-phone {{
-      white-space: nowrap;
-    }}
-    .footer {{
-      border-top: 1px solid var(--footer-border);
-      color: var(--text-muted);
-      font-size: 0.9rem;
-      margin-top: 1rem;
-    }}
-    details {{
-      margin: 0.5rem 0 0 0.5rem;
-    }}
-    .info-module .info-td-notes,
-    .info-module .info-kicker {{
-      color: var(--text-muted);
-    }}
-    .solid-waste-table tbody tr + tr td {{
-      border-top-color: var(--table-row-border);
-    }}
-    @media (prefers-color-scheme: dark) {{
-      .time-wheel .tw-hole {{
-        fill: var(--bg);
-      }}
-      .time-wheel .tw-seg--day {{
-        fill: #1a2a3a;
-      }}
-      .time-wheel .tw-label--inner,
-      .time-wheel .tw-label--outer {{
-        fill: var(--text);
-      }}
-      .time-wheel .tw-outer-label {{
-        fill: var(--text-muted);
-      }}
-    }}
-    @media (max-width: 720px) {{
-      .modules {{
-        grid-template-columns: 1fr;
-      }}
-    }}
-  </style>
+  {stylesheet}
 </head>
-<body>
+<body class="variant-{variant}">
   <header>
     <h1>{island_name} Dashboard</h1>
     <p class="meta">{generated} | <a href="https://github.com/islandmagic/sa-dash/issues">Report issue</a></p>
@@ -556,6 +621,7 @@ def render_html(island_name: str, providers: list[dict], generated_at: str) -> s
   <footer class="footer">
     <p>This page aggregates publicly available data from multiple sources. Information may be delayed, incomplete, or contain errors. Always refer to official sources for confirmation.</p>
   </footer>
+  {live_script}
 </body>
 </html>
 """
@@ -0,0 +1,158 @@
+"""Compact, horizontally scrollable tables.
+
+Scrapers build their tables with ``build_table`` (or ``compact_table`` for
+hand-written markup) so sections come out ready to render, along with plain-text
+and JSON renderings of the same rows. ``ensure_compact_tables`` upgrades any other
+table markup (older cached sections, markdown) in a single pass over the string,
+without building a DOM.
+"""
+
+import html
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, Sequence
+
+TABLE_CLASS = "status-table-compact"
+WRAP_CLASS = "status-table-wrap"
+
+_TABLE_TAG_RE = re.compile(r"<(/?)table\b([^>]*)>", re.IGNORECASE)
+_CLASS_ATTR_RE = re.compile(r"""\bclass\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.IGNORECASE)
+_WRAPPED_TABLE_RE = re.compile(
+    r'<div class="' + WRAP_CLASS + r'">(<table\b.*?</table>)</div>', re.DOTALL | re.IGNORECASE
+)
+_DATA_ROW_RE = re.compile(r"<tr\b[^>]*>\s*<td\b", re.IGNORECASE)
+_WRAP_OPEN_RE = re.compile(
+    r"""<div\b[^>]*\bclass\s*=\s*["']?[^"'>]*\b""" + WRAP_CLASS + r"""\b[^>]*>\s*\Z""",
+    re.IGNORECASE,
+)
+
+
+def compact_table(inner: str, classes: str = "") -> str:
+    """A ``<table>`` around ``inner`` (thead/tbody markup), wrapped for horizontal scrolling."""
+    class_attr = f"{classes} {TABLE_CLASS}".strip()
+    return f'<div class="{WRAP_CLASS}"><table class="{class_attr}">{inner}</table></div>'
+
+
+@dataclass(frozen=True)
+class Column:
+    """A table column: ``key`` names the field in JSON rows, ``label`` is the plain-text header."""
+
+    key: str
+    label: str = ""
+    align: str = ""
+
+
+@dataclass(frozen=True)
+class Cell:
+    """A cell whose display differs from its raw value.
+
+    ``value`` goes into JSON rows; ``text`` (default: the value) is shown, escaped,
+    in HTML and text. ``css`` is the ``<td>`` class and ``href`` links the text.
+    """
+
+    value: Any
+    text: str | None = None
+    css: str = ""
+    href: str | None = None
+
+
+@dataclass(frozen=True)
+class Table:
+    html: str
+    text: str
+    rows: list[dict[str, Any]]
+
+
+def _cell_text(cell: Cell) -> str:
+    if cell.text is not None:
+        return cell.text
+    return "" if cell.value is None else str(cell.value)
+
+
+def build_table(
+    columns: Sequence[Column], rows: Iterable[Sequence[Any]], classes: str = ""
+) -> Table:
+    """Render rows (one value or ``Cell`` per column) to compact HTML, text and JSON in one pass."""
+    header_html = "".join(f"<th>{html.escape(col.label)}</th>" for col in columns)
+    styles = [' style="text-align:right;"' if col.align == "right" else "" for col in columns]
+    text_lines = [" | ".join(col.label for col in columns)]
+    body_html: list[str] = []
+    json_rows: list[dict[str, Any]] = []
+    for row in rows:
+        cells = [value if isinstance(value, Cell) else Cell(value) for value in row]
+        tds = []
+        texts = []
+        record = {}
+        for col, style, cell in zip(columns, styles, cells):
+            text = _cell_text(cell)
+            content = html.escape(text)
+            if cell.href:
+                content = f'<a href="{html.escape(cell.href)}">{content}</a>'
+            class_attr = f' class="{cell.css}"' if cell.css else ""
+            tds.append(f"<td{class_attr}{style}>{content}</td>")
+            texts.append(text)
+            record[col.key] = cell.value
+        body_html.append(f"<tr>{''.join(tds)}</tr>")
+        text_lines.append(" | ".join(texts))
+        json_rows.append(record)
+    markup = compact_table(
+        f"<thead><tr>{header_html}</tr></thead><tbody>{''.join(body_html)}</tbody>", classes
+    )
+    return Table(html=markup, text="\n".join(text_lines), rows=json_rows)
+
+
+def _with_compact_class(attrs: str) -> str:
+    match = _CLASS_ATTR_RE.search(attrs)
+    if not match:
+        return f'{attrs} class="{TABLE_CLASS}"'
+    value = next(group for group in match.groups() if group is not None)
+    if TABLE_CLASS in value.split():
+        return attrs
+    classes = f"{value} {TABLE_CLASS}".strip()
+    return f'{attrs[:match.start()]}class="{classes}"{attrs[match.end():]}'
+
+
+def ensure_compact_tables(fragment: str) -> str:
+    """Give every table the compact class and a scroll wrapper unless it already has one.
+
+    Single left-to-right pass over table tags; a stack pairs each ``</table>`` with
+    whether its opening tag was wrapped, so nested tables are handled.
+    """
+    if "<table" not in fragment.lower():
+        return fragment
+    out: list[str] = []
+    wrapped_stack: list[bool] = []
+    pos = 0
+    for match in _TABLE_TAG_RE.finditer(fragment):
+        before = fragment[pos:match.start()]
+        out.append(before)
+        pos = match.end()
+        if match.group(1):
+            out.append(match.group(0))
+            if wrapped_stack and wrapped_stack.pop():
+                out.append("</div>")
+            continue
+        already_wrapped = bool(_WRAP_OPEN_RE.search(before))
+        tag = f"<table{_with_compact_class(match.group(2))}>"
+        if already_wrapped:
+            out.append(tag)
+        else:
+            out.append(f'<div class="{WRAP_CLASS}">{tag}')
+        wrapped_stack.append(not already_wrapped)
+    out.append(fragment[pos:])
+    # Unclosed tables still get their wrapper closed.
+    out.extend("</div>" for wrapped in wrapped_stack if wrapped)
+    return "".join(out)
+
+
+def collapse_tables(fragment: str) -> str:
+    """Fold each wrapped table into a ``<details>`` that shows its row count when closed."""
+
+    def collapse(match: re.Match) -> str:
+        rows = len(_DATA_ROW_RE.findall(match.group(1)))
+        return (
+            f'<details class="table-collapse"><summary>Table ({rows} rows)</summary>'
+            f"{match.group(0)}</details>"
+        )
+
+    return _WRAPPED_TABLE_RE.sub(collapse, fragment)
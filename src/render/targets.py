@@ -0,0 +1,94 @@
+"""Output targets rendered from one set of scraped sections.
+
+Every build scrapes once and hands the sections to each target in turn, so extra
+outputs cost render time only. Targets are chosen per island (``"targets"`` in
+``ISLANDS``, default ``DEFAULT_TARGETS``) or with ``--targets`` on the command line.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from src.config import BULLETIN_MAX_BYTES
+from src.render.api import write_api
+from src.render.bulletin import BULLETIN_NAME, build_bulletin
+from src.render.compress import write_site_file
+from src.render.html import ASSETS_DIR, page_stylesheet, render_html, stylesheet_name
+
+
+@dataclass(frozen=True)
+class Build:
+    """One render pass: the sections of ``island`` and where and how to write them."""
+
+    island: dict
+    results: list[dict]
+    output_dir: Path
+    generated_at: str
+    inline_css: bool = False
+
+
+def write_stylesheet(build: Build) -> str:
+    """Write the page's fingerprinted stylesheet (once per content) and return its href."""
+    css = page_stylesheet(build.results)
+    href = f"{ASSETS_DIR}/{stylesheet_name(css)}"
+    path = build.output_dir / href
+    if not path.exists():
+        write_site_file(path, css.encode("utf-8"))
+    return href
+
+
+def _write_page(build: Build, filename: str, variant: str) -> None:
+    href = None if build.inline_css else write_stylesheet(build)
+    html = render_html(
+        build.island["name"],
+        build.results,
+        build.generated_at,
+        stylesheet_href=href,
+        variant=variant,
+    )
+    write_site_file(build.output_dir / filename, html.encode("utf-8"))
+
+
+def write_desktop(build: Build) -> None:
+    _write_page(build, "index.html", "desktop")
+
+
+def write_mobile(build: Build) -> None:
+    _write_page(build, "mobile.html", "mobile")
+
+
+def write_kiosk(build: Build) -> None:
+    _write_page(build, "kiosk.html", "kiosk")
+
+
+def write_api_target(build: Build) -> None:
+    write_api(build.results, build.output_dir, build.generated_at)
+
+
+def write_bulletin(build: Build) -> None:
+    bulletin = build_bulletin(
+        build.island["name"],
+        build.results,
+        build.generated_at,
+        build.island.get("bulletin_max_bytes", BULLETIN_MAX_BYTES),
+    )
+    write_site_file(build.output_dir / BULLETIN_NAME, bulletin.encode("ascii"))
+
+
+TARGETS: dict[str, Callable[[Build], None]] = {
+    "desktop": write_desktop,
+    "mobile": write_mobile,
+    "kiosk": write_kiosk,
+    "api": write_api_target,
+    "bulletin": write_bulletin,
+}
+DEFAULT_TARGETS = ("desktop", "mobile", "kiosk", "api", "bulletin")
+
+
+def write_targets(build: Build, targets) -> None:
+    for name in targets:
+        if name not in TARGETS:
+            raise KeyError(f"Unknown output target: {name}")
+        TARGETS[name](build)
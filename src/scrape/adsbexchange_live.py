@@ -12,11 +12,15 @@ from typing import Any
 import httpx
 import zstandard as zstd
 
+from src.config import TOWN_COORDS
+from src.render.tables import Cell, Column, build_table
 from src.scrape.base import now_iso
+from src.scrape.sessions import with_session_cookies
 
 
 ADSBEXCHANGE_BASE = "https://globe.adsbexchange.com"
 ADSBEXCHANGE_WARMUP_URL = "https://globe.adsbexchange.com/"
+SESSION_NAME = "adsbexchange"
 ADSBEXCHANGE_RE_API = "https://globe.adsbexchange.com/re-api/"
 DEFAULT_BOX = "21.143471,22.533340,-160.669246,-158.453936" # Kauai
 #DEFAULT_BOX = "19.193752,24.130461,-161.461093,-156.327954"
@@ -57,6 +61,7 @@ TYPE_ENGINE = {
 }
 
 FAA_CACHE_DAYS = 7
+_FAA_REGISTRY_MEMO: dict[str, Any] = {"registry": None, "loaded_at": 0.0}
 COMMERCIAL_JET_MAKERS = ("AIRBUS", "BOEING", "EMBRAER", "BOMBARDIER", "MCDONNELL")
 SPECIAL_MODEL_OVERRIDES = {
     "C2002": ("LOCKHEED MARTIN C-130J Super Hercules", "Military"),
@@ -82,25 +87,19 @@ MILITARY_OWNER_KEYWORDS = (
 COAST_GUARD_KEYWORDS = ("COAST GUARD", "USCG")
 FIRE_DEPT_KEYWORDS = ("FIRE DEPT", "FIRE DEPARTMENT", "FIRE DIST", "FIRE PROTECTION")
 TOWN_RADIUS_MILES = 5.0
-TOWN_COORDS = {
-    "Hanalei": (22.205, -159.500),
-    "Princeville": (22.220, -159.473),
-    "Kilauea": (22.209, -159.406),
-    "Anahola": (22.142, -159.315),
-    "Kealia": (22.096, -159.318),
-    "Kapaa": (22.088, -159.338),
-    "Lihue": (21.981, -159.368),
-    "Koloa": (21.902, -159.469),
-    "Lawai": (21.907, -159.481),
-    "Kalaheo": (21.913, -159.535),
-    "Eleele": (21.913, -159.586),
-    "Hanapepe": (21.905, -159.592),
-    "Makaweli": (21.916, -159.631),
-    "Kaumakani": (21.914, -159.628),
-    "Waimea": (21.953, -159.672),
-    "Kekaha": (21.973, -159.719),
-}
 NA_PALI_COORD = (22.172, -159.643)
+AIRCRAFT_COLUMNS = (
+    Column("callsign", "Callsign"),
+    Column("registration", "Reg"),
+    Column("aircraft_type", "Type"),
+    Column("aircraft_name", "Aircraft"),
+    Column("registrant_name", "Owner"),
+    Column("category", "Category"),
+    Column("vicinity", "Vicinity"),
+    Column("altitude", "Altitude [ft]"),
+    Column("speed", "Speed [kt]"),
+    Column("heading", "Heading"),
+)
 
 
 def _debug_enabled() -> bool:
@@ -381,6 +380,17 @@ def _parse_acftref(path: str) -> dict[str, dict[str, str]]:
 
 
 def _load_faa_registry() -> dict[str, dict[str, Any]]:
+    """FAA registry, kept in memory by a long-running process until the disk copy goes stale."""
+    memo = _FAA_REGISTRY_MEMO
+    if memo["registry"] and time.time() - memo["loaded_at"] < FAA_CACHE_DAYS * 86400:
+        return memo["registry"]
+    registry = _read_faa_registry()
+    if registry:
+        memo.update(registry=registry, loaded_at=time.time())
+    return registry
+
+
+def _read_faa_registry() -> dict[str, dict[str, Any]]:
     cache_dir = _cache_dir()
     os.makedirs(cache_dir, exist_ok=True)
 
@@ -623,6 +633,35 @@ def _parse_bincraft(buffer: bytes) -> dict[str, Any]:
     }
 
 
+def render(data: dict) -> dict:
+    """Section html/text/rows from ``{"aircraft": [...]}`` as built by ``scrape``."""
+    table = build_table(
+        AIRCRAFT_COLUMNS,
+        (
+            (
+                item["callsign"],
+                item["registration"],
+                item["aircraft_type"],
+                item["aircraft_name"],
+                item["registrant_name"],
+                item["category"],
+                item["vicinity"],
+                Cell(
+                    item["altitude"],
+                    f"{'' if item['altitude'] is None else item['altitude']} {item['altitude_trend']}",
+                ),
+                item["speed"],
+                item["heading"],
+            )
+            for item in data["aircraft"]
+        ),
+    )
+    info_html = (
+        "<p class=\"info\">Filtered to aircraft within the Kauai area and below 10,000 ft.</p>"
+    )
+    return {"html": info_html + table.html, "text": table.text, "rows": {"aircraft": table.rows}}
+
+
 def scrape() -> dict:
     box_value = os.getenv("ADSBEXCHANGE_BOX", DEFAULT_BOX)
     try:
@@ -654,19 +693,20 @@ def scrape() -> dict:
     response = None
     try:
         with httpx.Client(timeout=20.0, headers=headers) as client:
-            try:
-                warmup = client.get(ADSBEXCHANGE_WARMUP_URL)
-                _debug(
-                    f"Warmup status={warmup.status_code} cookies={len(client.cookies)}"
-                )
-            except Exception as warmup_exc:
-                _debug(f"Warmup failed: {warmup_exc}")
-
             url = (
                 f"{ADSBEXCHANGE_RE_API}?binCraft&zstd&box={south},{north},{west},{east}"
             )
-            response = client.get(url)
-            response.raise_for_status()
+
+            def fetch() -> httpx.Response:
+                nonlocal response
+                response = client.get(url)
+                response.raise_for_status()
+                return response
+
+            response = with_session_cookies(
+                client, SESSION_NAME, ADSBEXCHANGE_WARMUP_URL, fetch
+            )
+            _debug(f"Fetched with cookies={len(client.cookies)}")
 
         payload = response.content
         if "application/zstd" in response.headers.get("Content-Type", ""):
@@ -783,40 +823,15 @@ def scrape() -> dict:
 
     filtered.sort(key=lambda item: item.get("callsign") or "")
 
-    rows = "".join(
-        "<tr>"
-        f"<td>{html.escape(str(item['callsign']))}</td>"
-        f"<td>{html.escape(str(item['registration'] or ''))}</td>"
-        f"<td>{html.escape(str(item['aircraft_type']))}</td>"
-        f"<td>{html.escape(str(item['aircraft_name'] or ''))}</td>"
-        f"<td>{html.escape(str(item['registrant_name'] or ''))}</td>"
-        f"<td>{html.escape(str(item['category']))}</td>"
-        f"<td>{html.escape(str(item['vicinity'] or ''))}</td>"
-        f"<td>{'' if item['altitude'] is None else item['altitude']} {html.escape(item['altitude_trend'])}</td>"
-        f"<td>{'' if item['speed'] is None else item['speed']}</td>"
-        f"<td>{html.escape(str(item['heading']))}</td>"
-        "</tr>"
-        for item in filtered
-    )
-
-    info_html = (
-        "<p class=\"info\">Filtered to aircraft within the Kauai area and below 10,000 ft.</p>"
-    )
-    body = (
-        info_html
-        + "<table>"
-        "<thead><tr><th>Callsign</th><th>Reg</th><th>Type</th><th>Aircraft</th>"
-        "<th>Owner</th><th>Category</th><th>Vicinity</th><th>Altitude [ft]</th><th>Speed [kt]</th><th>Heading</th></tr></thead>"
-        f"<tbody>{rows}</tbody>"
-        "</table>"
-    )
+    data = {"aircraft": filtered}
 
     return {
         "id": "adsbexchange_live",
         "label": "Air Traffic (<a href=\"https://globe.adsbexchange.com\">ADSBExchange</a>)",
         "retrieved_at": now_iso(),
         "source_urls": [ADSBEXCHANGE_RE_API, ADSBEXCHANGE_BASE],
-        "html": body,
+        **render(data),
+        "data": data,
         "error": None,
         "stale": False,
         "layout": "full",
@@ -1,10 +1,5 @@
-import html
-
-import httpx
-
-from src.http_log import log_provider_failure
 from src.scrape.base import now_iso
-from src.scrape.verizon_mobile import TOWNS
+from src.scrape.outage_probe import TOWNS, Carrier, Status, probe_towns, render, summarize_towns
 
 
 ATT_CHECK_URL = "https://www.att.com/outages/"
@@ -38,34 +33,16 @@ def _payload_for_town(town: dict) -> dict:
     }
 
 
-def _fetch_outage(client: httpx.Client, town: dict) -> tuple[str, str, str | None]:
+def _request(town: dict, token: str | None) -> dict:
     headers = {
         "Content-Type": "application/json",
         "Origin": "https://www.att.com",
         "Referer": ATT_CHECK_URL,
     }
-    response = None
-    try:
-        response = client.post(ATT_URL, json=_payload_for_town(town), headers=headers)
-        response.raise_for_status()
-        payload = response.json()
-    except Exception as exc:
-        town_name = town.get("town", "unknown")
-        if response is not None:
-            log_provider_failure(
-                "AT&T outage check",
-                f"for {town_name}",
-                status_code=response.status_code,
-                response_body=response.text,
-            )
-        else:
-            log_provider_failure(
-                "AT&T outage check",
-                f"for {town_name}",
-                exc=exc,
-            )
-        return "Unknown", "", "Fetch failed."
+    return {"json": _payload_for_town(town), "headers": headers}
+
 
+def _classify_outage(payload: dict) -> Status:
     notifications = payload.get("data", {}).get("WirelessOutageNotifications")
     if not isinstance(notifications, list) or not notifications:
         return "OK", "status-green", None
@@ -96,47 +73,30 @@ def _fetch_outage(client: httpx.Client, town: dict) -> tuple[str, str, str | Non
     return "Outage", "status-red", detail
 
 
-def scrape() -> dict:
-    rows = []
-    with httpx.Client(timeout=20.0, headers=ATT_BASE_HEADERS) as client:
-        try:
-            warmup = client.get(ATT_CHECK_URL)
-            if warmup.status_code >= 400:
-                print(f"AT&T warmup failed (HTTP {warmup.status_code}).")
-        except Exception as exc:
-            print(f"AT&T warmup failed: {exc}")
-        for town in TOWNS:
-            status, status_class, detail = _fetch_outage(client, town)
-            rows.append(
-                {
-                    "town": town["town"],
-                    "status": status,
-                    "status_class": status_class,
-                    "detail": detail or "",
-                }
-            )
+CARRIER = Carrier(
+    name="AT&T",
+    url=ATT_URL,
+    request=_request,
+    classify=_classify_outage,
+    headers=ATT_BASE_HEADERS,
+    warmup_url=ATT_CHECK_URL,
+)
+
 
-    table_rows = "".join(
-        "<tr>"
-        f"<td>{html.escape(row['town'])}</td>"
-        f"<td class=\"status-cell {row['status_class']}\">{html.escape(row['status'])}</td>"
-        f"<td>{html.escape(row['detail'])}</td>"
-        "</tr>"
-        for row in rows
-    )
-    body = (
-        "<table>"
-        "<thead><tr><th>Town</th><th>Status</th><th>Detail</th></tr></thead>"
-        f"<tbody>{table_rows}</tbody>"
-        "</table>"
-    )
+def summarize(data: dict) -> list[tuple[str, str]]:
+    return summarize_towns(CARRIER.name, data)
+
+
+def scrape() -> dict:
+    data = {"towns": probe_towns(CARRIER, TOWNS)}
 
     return {
         "id": "att_mobile",
         "label": f"AT&T Mobile (<a href=\"{ATT_CHECK_URL}\">AT&T</a>)",
         "retrieved_at": now_iso(),
         "source_urls": [ATT_URL, ATT_CHECK_URL],
-        "html": body,
+        **render(data),
+        "data": data,
         "error": None,
         "stale": False,
     }
@@ -1,10 +1,11 @@
 import datetime as dt
 import re
-from typing import Iterable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional
 from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 
 DEFAULT_HEADERS = {
@@ -26,6 +27,14 @@ def fetch_html(url: str, timeout: float = 10.0, headers: dict | None = None) ->
         return response.text
 
 
+def fetch_bytes(url: str, timeout: float = 10.0) -> bytes:
+    """Raw response body, for parsers that handle their own encoding (XML feeds)."""
+    with httpx.Client(follow_redirects=True, timeout=timeout, headers=DEFAULT_HEADERS) as client:
+        response = client.get(url)
+        response.raise_for_status()
+        return response.content
+
+
 def fetch_json(url: str, timeout: float = 10.0) -> dict:
     with httpx.Client(follow_redirects=True, timeout=timeout, headers=DEFAULT_HEADERS) as client:
         response = client.get(url)
@@ -33,13 +42,48 @@ def fetch_json(url: str, timeout: float = 10.0) -> dict:
         return response.json()
 
 
+def gather(calls: dict[str, Callable[[], Any]], max_workers: int = 8) -> dict[str, Any]:
+    """Run independent blocking calls concurrently.
+
+    Returns each call's result by key; a call that raised maps to its exception so
+    callers decide which failures are fatal.
+    """
+    if not calls:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as pool:
+        futures = {key: pool.submit(call) for key, call in calls.items()}
+    results = {}
+    for key, future in futures.items():
+        exc = future.exception()
+        results[key] = exc if exc is not None else future.result()
+    return results
+
+
+def parse_html(markup: str, only: SoupStrainer | None = None) -> BeautifulSoup:
+    """Parse markup with lxml, materializing only the subtrees matched by ``only``.
+
+    CMS pages are mostly chrome; straining skips building tag objects for it. If the
+    strainer matches nothing (layout changed) the whole page is parsed so the caller's
+    own fallbacks still apply.
+    """
+    if only is not None:
+        soup = BeautifulSoup(markup, "lxml", parse_only=only)
+        if soup.contents:
+            return soup
+    return BeautifulSoup(markup, "lxml")
+
+
 def clean_text(text: str) -> str:
     text = re.sub(r"\s+", " ", text or "").strip()
     return text
 
 
+_SUMMARY_TAGS = SoupStrainer(["title", "h1", "h2", "meta"])
+_HEADLINE_TAGS = SoupStrainer(["h1", "h2", "h3", "a"])
+
+
 def extract_page_summary(html: str) -> tuple[Optional[str], Optional[str]]:
-    soup = BeautifulSoup(html, "lxml")
+    soup = parse_html(html, only=_SUMMARY_TAGS)
     title = clean_text(soup.title.get_text()) if soup.title else None
     heading = soup.find(["h1", "h2"])
     heading_text = clean_text(heading.get_text()) if heading else None
@@ -50,7 +94,7 @@ def extract_page_summary(html: str) -> tuple[Optional[str], Optional[str]]:
 
 
 def extract_headlines(html: str, base_url: str, limit: int = 8) -> list[dict]:
-    soup = BeautifulSoup(html, "lxml")
+    soup = parse_html(html, only=_HEADLINE_TAGS)
     candidates: Iterable = soup.find_all(["h1", "h2", "h3", "a"])
     results = []
     seen = set()
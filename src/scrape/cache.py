@@ -1,22 +1,145 @@
+import hashlib
 import json
+import os
+import tempfile
+import time
 from pathlib import Path
 
+import zstandard
+
+# Long-lived scraper state (resolved metadata, rolling series) kept apart from the
+# per-provider section cache so it can be persisted separately in CI.
+STATE_DIR = Path(__file__).resolve().parents[2] / "data" / "cache" / "state"
+
+# Version of the cached section layout. Entries at this version carry the scraper's
+# structured "data" and are re-rendered on load; older entries replay their stored html.
+CACHE_SCHEMA_VERSION = 2
+
+# Sections are stored as compact JSON, zstd-compressed when that is smaller.
+# Small entries are not worth a compression frame.
+ZSTD_MIN_BYTES = 2048
+ZSTD_LEVEL = 10
+# Fields left out of the content hash, so a re-scrape of unchanged data is not rewritten.
+_VOLATILE_FIELDS = frozenset({"retrieved_at", "schema", "content_hash"})
+
 
 def cache_path(cache_dir: Path, provider_id: str) -> Path:
     return cache_dir / f"{provider_id}.json"
 
 
+def compressed_cache_path(cache_dir: Path, provider_id: str) -> Path:
+    return cache_dir / f"{provider_id}.json.zst"
+
+
+def write_atomic(path: Path, data: bytes, mode: int | None = None) -> None:
+    """Write via a temp file in the same directory and rename, so readers never see a partial file.
+
+    The file is private (0600) unless ``mode`` is given.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        if mode is not None:
+            os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def content_hash(payload: dict) -> str:
+    """Hash of a section ignoring when it was retrieved."""
+    stable = {key: value for key, value in payload.items() if key not in _VOLATILE_FIELDS}
+    encoded = json.dumps(stable, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _encode_entry(entry: dict) -> tuple[bytes, bool]:
+    """Compact JSON, or its zstd frame when smaller; the flag says which."""
+    raw = json.dumps(entry, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    if len(raw) >= ZSTD_MIN_BYTES:
+        packed = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+        if len(packed) < len(raw):
+            return packed, True
+    return raw, False
+
+
 def load_cache(cache_dir: Path, provider_id: str):
-    path = cache_path(cache_dir, provider_id)
-    if not path.exists():
-        return None
+    for path, compressed in (
+        (compressed_cache_path(cache_dir, provider_id), True),
+        (cache_path(cache_dir, provider_id), False),
+    ):
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            continue
+        try:
+            if compressed:
+                data = zstandard.ZstdDecompressor().decompress(data)
+            return json.loads(data)
+        except (zstandard.ZstdError, json.JSONDecodeError, UnicodeDecodeError):
+            return None
+    return None
+
+
+def is_current_schema(entry: dict) -> bool:
+    return entry.get("schema") == CACHE_SCHEMA_VERSION
+
+
+def save_cache(
+    cache_dir: Path,
+    provider_id: str,
+    payload: dict,
+    *,
+    previous: dict | None = None,
+    readable: bool = False,
+) -> bool:
+    """Store a section; returns False when the write was skipped as unchanged.
+
+    ``previous`` is the entry already loaded for this provider (read from disk when
+    omitted); if its content hash matches, the file, including its ``retrieved_at``,
+    is left as is. ``readable`` keeps the indented plain-JSON format for caches
+    committed to git.
+    """
+    digest = content_hash(payload)
+    if previous is None:
+        previous = load_cache(cache_dir, provider_id)
+    if previous and is_current_schema(previous) and previous.get("content_hash") == digest:
+        return False
+
+    entry = {**payload, "schema": CACHE_SCHEMA_VERSION, "content_hash": digest}
+    plain_path = cache_path(cache_dir, provider_id)
+    packed_path = compressed_cache_path(cache_dir, provider_id)
+    if readable:
+        data, compressed = json.dumps(entry, indent=2, ensure_ascii=True).encode("utf-8"), False
+    else:
+        data, compressed = _encode_entry(entry)
+    target, other = (packed_path, plain_path) if compressed else (plain_path, packed_path)
+    write_atomic(target, data)
+    other.unlink(missing_ok=True)
+    return True
+
+
+def state_path(name: str, state_dir: Path | None = None) -> Path:
+    return (state_dir or STATE_DIR) / f"{name}.json"
+
+
+def load_state(name: str, max_age: float | None = None, state_dir: Path | None = None):
+    """Return persisted scraper state, or None when missing, unreadable or older than max_age seconds."""
+    path = state_path(name, state_dir)
     try:
+        if max_age is not None and time.time() - path.stat().st_mtime > max_age:
+            return None
         return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+    except (OSError, json.JSONDecodeError):
         return None
 
 
-def save_cache(cache_dir: Path, provider_id: str, payload: dict) -> None:
-    path = cache_path(cache_dir, provider_id)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, ensure_ascii=True), encoding="utf-8")
+def save_state(name: str, payload, state_dir: Path | None = None) -> None:
+    path = state_path(name, state_dir)
+    try:
+        write_atomic(path, json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+    except OSError as exc:
+        print(f"State save failed for {name}: {exc}")
@@ -1,16 +1,17 @@
 import html
 
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 
-from src.scrape.base import clean_text, fetch_html, now_iso
+from src.scrape.base import clean_text, fetch_html, now_iso, parse_html
 
 
 SITE_URL = "https://lite.cnn.com"
+HOMEPAGE_REGION = SoupStrainer("div", class_="layout-homepage__lite")
 
 
 def scrape() -> dict:
     page_html = fetch_html(SITE_URL)
-    soup = BeautifulSoup(page_html, "lxml")
+    soup = parse_html(page_html, only=HOMEPAGE_REGION)
     headlines = []
 
     main = soup.select_one("div.layout-homepage__lite") or soup
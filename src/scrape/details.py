@@ -0,0 +1,72 @@
+"""Shared detail-page stage for listing scrapers.
+
+Listing scrapers (press releases, road news, the Wire) follow each item to its
+article page. Published articles rarely change, so extracted bodies are cached in
+scraper state by URL and only newly listed articles are fetched, a few at a time.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable, Iterable, TypeVar
+
+from src.scrape.base import gather
+from src.scrape.cache import load_state, save_state
+
+T = TypeVar("T")
+
+DETAIL_CACHE_TTL = 7 * 86400
+DETAIL_CACHE_MAX_ENTRIES = 100
+MAX_CONCURRENT_DETAILS = 4
+
+
+def fetch_details(
+    namespace: str,
+    urls: Iterable[str],
+    extract: Callable[[str], T],
+    *,
+    cacheable: Callable[[T], bool] | None = None,
+    ttl: float = DETAIL_CACHE_TTL,
+    max_entries: int = DETAIL_CACHE_MAX_ENTRIES,
+    max_workers: int = MAX_CONCURRENT_DETAILS,
+) -> dict[str, T]:
+    """Extracted detail per URL, from the cache when fresh, otherwise via ``extract``.
+
+    ``extract`` fetches and parses one page and must return JSON-serializable data.
+    Failures (exceptions or empty results) are left out of the result and are not
+    cached, so they are retried next run; ``cacheable`` can also veto degraded results.
+    Entries expire after ``ttl`` seconds and the least recently listed are evicted
+    beyond ``max_entries``.
+    """
+    state_name = f"details_{namespace}"
+    now = time.time()
+    stored = load_state(state_name) or {}
+    entries = {
+        url: entry
+        for url, entry in stored.items()
+        if isinstance(entry, dict) and now - entry.get("fetched_at", 0) <= ttl
+    }
+
+    results: dict[str, T] = {}
+    missing = []
+    for url in dict.fromkeys(u for u in urls if u):
+        entry = entries.get(url)
+        if entry is not None:
+            entry["used_at"] = now
+            results[url] = entry["value"]
+        else:
+            missing.append(url)
+
+    fetched = gather({url: (lambda u=url: extract(u)) for url in missing}, max_workers=max_workers)
+    for url, value in fetched.items():
+        if isinstance(value, Exception) or not value:
+            continue
+        results[url] = value
+        if cacheable is None or cacheable(value):
+            entries[url] = {"value": value, "fetched_at": now, "used_at": now}
+
+    if len(entries) > max_entries:
+        recent = sorted(entries, key=lambda u: entries[u].get("used_at", 0), reverse=True)
+        entries = {url: entries[url] for url in recent[:max_entries]}
+    save_state(state_name, entries)
+    return results
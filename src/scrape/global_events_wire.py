@@ -3,10 +3,11 @@ import html as html_module
 import re
 from typing import List, Optional
 
-import feedparser
 from bs4 import BeautifulSoup
 
 from src.scrape.base import clean_text, fetch_html, now_iso
+from src.scrape.details import fetch_details
+from src.scrape.rss import scrape_rss
 
 
 RSS_URL = "https://publish.obsidian.md/s2underground/rss.xml"
@@ -157,7 +158,8 @@ def _extract_tearline(text: str) -> str:
 def _fetch_wire_page(url: str) -> Optional[dict]:
     """
     Fetch and parse a single Wire report page.
-    Returns dict with keys: bluf, tearline, precedence, header_ts, url.
+    Returns dict with keys: bluf, tearline, precedence, header_ts, url, complete.
+    ``complete`` is False when the markdown source could not be loaded.
     """
     if not url:
         return None
@@ -212,19 +214,21 @@ def _fetch_wire_page(url: str) -> Optional[dict]:
         "tearline": tearline,
         "precedence": precedence,
         "header_ts": header_ts,
+        "complete": bool(md_text),
     }
 
 
-def _select_wire_entries(feed) -> List[dict]:
-    """Select the latest MAX_ITEMS 'The Wire - ' entries from the RSS feed."""
+def _is_wire_item(item: dict) -> bool:
+    return item.get("title", "").startswith("The Wire - ") and bool(item.get("url"))
+
+
+def _select_wire_entries(items: List[dict]) -> List[dict]:
+    """Order 'The Wire - ' feed items newest first and keep MAX_ITEMS."""
     entries = []
-    for entry in getattr(feed, "entries", []):
-        title = clean_text(getattr(entry, "title", "") or "")
-        if not title.startswith("The Wire - "):
-            continue
-        link = getattr(entry, "link", "") or ""
-        if not link:
+    for item in items:
+        if not _is_wire_item(item):
             continue
+        title = item["title"]
         # Parse the Wire date from the title, e.g. "The Wire - November 7, 2025"
         date_ts: Optional[dt.datetime] = None
         m = re.match(r"The Wire - (.+)", title)
@@ -241,7 +245,7 @@ def _select_wire_entries(feed) -> List[dict]:
         entries.append(
             {
                 "title": title,
-                "link": link,
+                "link": item["url"],
                 "ts": date_ts,
             }
         )
@@ -257,7 +261,11 @@ def _select_wire_entries(feed) -> List[dict]:
 
 def scrape() -> dict:
     try:
-        feed = feedparser.parse(RSS_URL)
+        # The feed is newest first, so parsing can stop after MAX_ITEMS Wire entries.
+        parse_errors: list[str] = []
+        items = scrape_rss(RSS_URL, limit=MAX_ITEMS, predicate=_is_wire_item, errors=parse_errors)
+        if parse_errors:
+            raise ValueError(f"Failed to parse RSS feed: {parse_errors[0]}")
     except Exception as exc:
         return {
             "id": "global_events_wire",
@@ -270,28 +278,20 @@ def scrape() -> dict:
             "layout": "full",
         }
 
-    if getattr(feed, "bozo", 0):
-        # feedparser sets bozo flag on parse errors
-        exc = getattr(feed, "bozo_exception", None)
-        msg = f"Failed to parse RSS feed: {exc}" if exc else "Failed to parse RSS feed."
-        return {
-            "id": "global_events_wire",
-            "label": "Global Events (S2 Underground Wire)",
-            "retrieved_at": now_iso(),
-            "source_urls": [RSS_URL],
-            "html": f"<p>{html_module.escape(msg)}</p>",
-            "error": msg,
-            "stale": True,
-            "layout": "full",
-        }
-
-    wire_entries = _select_wire_entries(feed)
+    wire_entries = _select_wire_entries(items)
     source_urls = [RSS_URL]
     blocks: List[str] = []
+    # Degraded (HTML-only) parses are shown but not cached, so the markdown is retried.
+    pages = fetch_details(
+        "global_events_wire",
+        (entry["link"] for entry in wire_entries),
+        _fetch_wire_page,
+        cacheable=lambda page: page.get("complete", False),
+    )
 
     for entry in wire_entries:
         url = entry["link"]
-        parsed = _fetch_wire_page(url)
+        parsed = pages.get(url)
         if not parsed:
             continue
 
@@ -1,18 +1,22 @@
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 
-from src.scrape.base import clean_text, fetch_html, now_iso
+from src.scrape.base import clean_text, fetch_html, now_iso, parse_html
+from src.scrape.details import fetch_details
 from src.scrape.rss import render_rss_html, scrape_rss
 
 
 SITE_URL = "https://hidot.hawaii.gov/highways/category/news/"
 FEED_URL = "https://hidot.hawaii.gov/highways/category/news/feed/"
+CONTENT_REGION = SoupStrainer("div", class_="primary-content")
+# Only the newest feed items are searched for Lihue news, so old posts do not resurface.
+FEED_SCAN_ITEMS = 10
 
 
 def _fetch_primary_content(url: str) -> str:
     if not url:
         return ""
     html_text = fetch_html(url)
-    soup = BeautifulSoup(html_text, "lxml")
+    soup = parse_html(html_text, only=CONTENT_REGION)
     container = soup.find("div", class_="primary-content")
     if not container:
         return ""
@@ -24,29 +28,41 @@ def _fetch_primary_content(url: str) -> str:
     return " ".join([p for p in paragraphs if p])
 
 
+def summarize(data: dict) -> list[tuple[str, str]]:
+    """Bulletin lines (status class, text): the latest road news headlines."""
+    return [("", f"Road: {item['title']}") for item in data["items"][:3] if item["title"]]
+
+
 def scrape() -> dict:
-    items = scrape_rss(FEED_URL, limit=10)
-    lihue_items = []
-    for item in items:
-        summary = item.get("summary", "")
-        if "LĪHUʻE" not in summary.upper():
-            continue
-        try:
-            full_summary = _fetch_primary_content(item.get("url", ""))
-        except Exception:
-            full_summary = ""
-        if full_summary:
-            item = {**item, "summary": full_summary}
-        lihue_items.append(item)
-    items = lihue_items[:5]
+    parse_errors: list[str] = []
+    lihue_items = scrape_rss(
+        FEED_URL,
+        limit=5,
+        predicate=lambda item: "LĪHUʻE" in item.get("summary", "").upper(),
+        scan=FEED_SCAN_ITEMS,
+        errors=parse_errors,
+    )
+    full_summaries = fetch_details(
+        "hidot_highways_news",
+        (item.get("url", "") for item in lihue_items),
+        _fetch_primary_content,
+    )
+    items = [
+        {**item, "summary": full_summaries.get(item.get("url", "")) or item.get("summary", "")}
+        for item in lihue_items
+    ]
     block_html = render_rss_html(items)
+    data = {
+        "items": [{key: item.get(key, "") for key in ("title", "url", "published")} for item in items]
+    }
     return {
         "id": "hidot_highways_news",
         "label": f"Roads &amp; Bridges (<a href=\"{SITE_URL}\">HDOT News</a>)",
         "retrieved_at": now_iso(),
         "source_urls": [SITE_URL, FEED_URL],
         "html": block_html,
-        "error": None,
+        "data": data,
+        "error": f"Failed to parse RSS feed: {parse_errors[0]}" if parse_errors else None,
         "stale": False,
         "layout": "full",
     }
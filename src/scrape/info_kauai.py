@@ -7,6 +7,7 @@ from urllib.parse import urlencode
 
 import httpx
 
+from src.render.tables import compact_table
 from src.scrape.base import DEFAULT_HEADERS, now_iso
 
 WINLINK_STATUS_BASE = "https://cms.winlink.org/gateway/status"
@@ -143,10 +144,11 @@ def _build_winlink_block(
 ) -> str:
     rows = _build_winlink_rows(gateways_by_base, fetch_failed=fetch_failed)
     table = (
-        "<table class=\"info-table\">"
-        "<thead><tr><th>Station</th><th>Status</th><th>Last status</th></tr></thead>"
-        f"<tbody>{rows}</tbody>"
-        "</table>"
+        compact_table(
+            "<thead><tr><th>Station</th><th>Status</th><th>Last status</th></tr></thead>"
+            f"<tbody>{rows}</tbody>",
+            "info-table",
+        )
     )
     info = (
         "<p class=\"info\">"
@@ -194,10 +196,11 @@ def scrape() -> dict:
         for name, phone, notes in contacts
     )
     contacts_table = (
-        "<table class=\"info-table\">"
-        "<thead><tr><th>Contact</th><th>Phone</th><th>Notes</th></tr></thead>"
-        f"<tbody>{contact_rows}</tbody>"
-        "</table>"
+        compact_table(
+            "<thead><tr><th>Contact</th><th>Phone</th><th>Notes</th></tr></thead>"
+            f"<tbody>{contact_rows}</tbody>",
+            "info-table",
+        )
     )
 
     stations = [
@@ -223,10 +226,11 @@ def scrape() -> dict:
         for call, freq, band, area in stations
     )
     broadcast_table = (
-        "<table class=\"info-table info-table--radio\">"
-        "<thead><tr><th>Station</th><th class=\"info-td-num\">Freq</th><th>Band</th><th>Area</th></tr></thead>"
-        f"<tbody>{station_rows}</tbody>"
-        "</table>"
+        compact_table(
+            "<thead><tr><th>Station</th><th class=\"info-td-num\">Freq</th><th>Band</th><th>Area</th></tr></thead>"
+            f"<tbody>{station_rows}</tbody>",
+            "info-table info-table--radio",
+        )
     )
 
     broadcast_radio_block = (
@@ -257,11 +261,12 @@ def scrape() -> dict:
         "24/7 NWS Honolulu warnings, watches, forecasts, and hazards. "
         "<a href=\"https://www.weather.gov/hfo/nwr\">weather.gov/hfo/nwr</a>"
         "</p>"
-        "<table class=\"info-table info-table--radio\">"
-        "<thead><tr><th>Station</th><th class=\"info-td-num\">Freq (MHz)</th>"
-        "<th class=\"info-td-num\">Ch</th><th>Site</th></tr></thead>"
-        f"<tbody>{nwr_rows}</tbody>"
-        "</table>"
+        + compact_table(
+            "<thead><tr><th>Station</th><th class=\"info-td-num\">Freq (MHz)</th>"
+            "<th class=\"info-td-num\">Ch</th><th>Site</th></tr></thead>"
+            f"<tbody>{nwr_rows}</tbody>",
+            "info-table info-table--radio",
+        )
     )
     nwr_block = (
         "<details class=\"info-details-nwr\">"
@@ -296,10 +301,11 @@ def scrape() -> dict:
     )
     repeater_table = (
         "<p class=\"info-kicker\">National calling: 146.520 MHz<br/>GMRS calling: 462.675 MHz (CH 20)<br/>GMRS CERT calling: 462.550 MHz (CH 15)</p>"
-        "<table class=\"info-table info-table--radio\">"
-        "<thead><tr><th>Call</th><th class=\"info-td-num\">Freq</th><th>Offset</th><th>PL</th><th>Site</th></tr></thead>"
-        f"<tbody>{rep_rows}</tbody>"
-        "</table>"
+        + compact_table(
+            "<thead><tr><th>Call</th><th class=\"info-td-num\">Freq</th><th>Offset</th><th>PL</th><th>Site</th></tr></thead>"
+            f"<tbody>{rep_rows}</tbody>",
+            "info-table info-table--radio",
+        )
     )
 
     amateur_radio_block = (
@@ -346,7 +352,6 @@ def scrape() -> dict:
 """
 
     body = (
-        "<style>" + css + "</style>"
         "<div class=\"info-module\">"
         "<div class=\"info-contacts\">"
         f"{contacts_table}"
@@ -364,6 +369,7 @@ def scrape() -> dict:
         "retrieved_at": now_iso(),
         "source_urls": source_urls,
         "html": body,
+        "css": css,
         "error": winlink_error,
         "stale": False,
         "layout": "full",
@@ -3,9 +3,10 @@ import html as html_module
 import re
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 
-from src.scrape.base import clean_text, fetch_html, now_iso
+from src.scrape.base import clean_text, fetch_html, now_iso, parse_html
+from src.scrape.details import fetch_details
 
 
 LISTING_URL = "https://www.kauai.gov/County-Press-Releases"
@@ -25,11 +26,15 @@ def _format_published(date_str: str) -> str:
             continue
     return date_str
 LIMIT = 5
+LISTING_REGION = SoupStrainer("article")
+# The div fallbacks below are only consulted when a page has neither <main> nor
+# <article>, in which case parse_html falls back to the full page.
+BODY_REGION = SoupStrainer(["main", "article"])
 
 
 def _parse_listing(html_text: str, base_url: str) -> list[dict]:
     """Parse listing page; return [{title, url, published?}] up to LIMIT."""
-    soup = BeautifulSoup(html_text, "lxml")
+    soup = parse_html(html_text, only=LISTING_REGION)
     items = []
     for article in soup.find_all("article"):
         h2 = article.find("h2")
@@ -60,7 +65,7 @@ def _fetch_release_body(url: str) -> str:
         html_text = fetch_html(url)
     except Exception:
         return ""
-    soup = BeautifulSoup(html_text, "lxml")
+    soup = parse_html(html_text, only=BODY_REGION)
     container = (
         soup.find("main")
         or soup.find("article")
@@ -103,9 +108,12 @@ def scrape() -> dict:
         }
 
     items = _parse_listing(html_text, LISTING_URL)
+    bodies = fetch_details(
+        "kauai_county_press", (item.get("url", "") for item in items), _fetch_release_body
+    )
     detail_items = []
     for item in items:
-        body = _fetch_release_body(item.get("url", ""))
+        body = bodies.get(item.get("url", ""))
         detail_items.append(
             {
                 "title": item["title"],
@@ -4,6 +4,7 @@ import unicodedata
 
 from bs4 import BeautifulSoup
 
+from src.render.tables import compact_table
 from src.scrape.base import clean_text, fetch_html, now_iso
 
 
@@ -183,12 +184,10 @@ def scrape() -> dict:
 .solid-waste-table tbody tr + tr td { border-top: 1px solid var(--table-row-border, rgba(0,0,0,0.08)); }
 """
 
-    body = (
-        "<style>" + css + "</style>"
-        "<table class=\"solid-waste-table\">"
+    body = compact_table(
         "<thead><tr><th>Location</th><th>Status</th><th>Hours</th></tr></thead>"
-        f"<tbody>{table_rows}</tbody>"
-        "</table>"
+        f"<tbody>{table_rows}</tbody>",
+        "solid-waste-table",
     )
 
     return {
@@ -197,6 +196,7 @@ def scrape() -> dict:
         "retrieved_at": now_iso(),
         "source_urls": [STATUS_URL, TRANSFER_STATIONS_URL, GREEN_WASTE_URL],
         "html": body,
+        "css": css,
         "error": None,
         "stale": False,
         "layout": "full",
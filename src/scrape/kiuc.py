@@ -1,7 +1,9 @@
-import html
+import time
 from datetime import datetime, timedelta, timezone
 
+from src.render.tables import Cell, Column, build_table
 from src.scrape.base import fetch_json, now_iso
+from src.scrape.cache import load_state, save_state
 
 
 KIUC_URL = "https://kiuc.outagemap.coop"
@@ -30,6 +32,20 @@ ZIP_ORDER = [
 
 ZIP_NAME = {zip_code: name for zip_code, name in ZIP_ORDER}
 ZIP_INDEX = {zip_code: index for index, (zip_code, _) in enumerate(ZIP_ORDER)}
+AREA_COLUMNS = (
+    Column("area", "Area"),
+    Column("affected", "Outage"),
+    Column("since", "Since"),
+    Column("trend", "Trend"),
+)
+
+# Per-ZIP outage counts, recorded only when they change, shared by scrape() and the poller.
+KIUC_SERIES_STATE = "kiuc_outage_series"
+SERIES_RETENTION = 48 * 3600
+TREND_WINDOW = 30 * 60
+# How long a restored area keeps showing its restore time.
+RESTORED_DISPLAY = 6 * 3600
+HST = timezone(timedelta(hours=-10))
 
 
 def _format_ts(epoch_ms: int | None) -> str:
@@ -67,44 +83,176 @@ def _pct_class(pct_out: float) -> str:
     return "status-red"
 
 
-def scrape() -> dict:
-    summary = fetch_json(KIUC_SUMMARY_URL)
-    link_label = "KIUC Outage Center"
+def update_series(state: dict, summary: dict) -> bool:
+    """Fold a summary into the per-ZIP series in ``state``.
 
-    rows = _extract_zip_rows(summary)
-    last_update = _format_ts(summary.get("lastUpdate"))
-    total_served = summary.get("totalServed")
-    outages = summary.get("outages", [])
-    total_out = sum(outage.get("nbrOut", 0) for outage in outages)
-    parts = []
-
-    if rows:
-        table_rows = "".join(
-            "<tr>"
-            f"<td>{html.escape(name)}</td>"
-            f"<td class=\"status-cell {_pct_class(pct_out)}\">{affected} ({pct_out:.0f}%)</td>"
-            "</tr>"
-            for zip_code, name, affected, served, pct_out in rows
-        )
-        parts.append(
-            f"<h3>{total_out or 0} Outages</h3>"
-            "<table>"
-            "<thead><tr>"
-            "<th>Area</th><th>Outage</th>"
-            "</tr></thead>"
-            f"<tbody>{table_rows}</tbody></table>"
+    Returns False without touching ``state`` when ``lastUpdate`` has not changed. An
+    area's outage starts when its count leaves zero and is restored when it returns to
+    zero; counts are only stored when they change.
+    """
+    last_update = summary.get("lastUpdate")
+    if last_update is not None and last_update == state.get("last_update"):
+        return False
+    observed_at = last_update / 1000 if last_update else time.time()
+    cutoff = observed_at - SERIES_RETENTION
+    zips = state.setdefault("zips", {})
+    for zip_code, _, number_out, _, _ in _extract_zip_rows(summary):
+        entry = zips.setdefault(zip_code, {"points": [], "since": None})
+        points = entry["points"]
+        previous = points[-1][1] if points else 0
+        if not points or number_out != previous:
+            points.append([observed_at, number_out])
+        if number_out and not previous:
+            entry["since"] = observed_at
+        elif previous and not number_out:
+            entry["restored_at"] = observed_at
+            entry["duration"] = observed_at - (entry.get("since") or observed_at)
+            entry["since"] = None
+        # Keep the last point before the cutoff: it is the count at the cutoff.
+        while len(points) > 1 and points[1][0] <= cutoff:
+            points.pop(0)
+    state["last_update"] = last_update
+    return True
+
+
+def _count_at(points: list, when: float) -> int:
+    count = points[0][1] if points else 0
+    for observed_at, number_out in points:
+        if observed_at > when:
+            break
+        count = number_out
+    return count
+
+
+def _format_duration(seconds: float) -> str:
+    minutes = max(0, int(seconds // 60))
+    if minutes < 60:
+        return f"{minutes}m"
+    return f"{minutes // 60}h {minutes % 60:02d}m"
+
+
+def _since_text(area: dict, as_of: float) -> str:
+    if area["affected"] and area.get("since"):
+        return _format_duration(as_of - area["since"])
+    restored_at = area.get("restored_at")
+    if not area["affected"] and restored_at and as_of - restored_at <= RESTORED_DISPLAY:
+        restored = datetime.fromtimestamp(restored_at, tz=HST).strftime("%H:%M")
+        return f"Restored {restored} after {_format_duration(area.get('duration') or 0)}"
+    return "—"
+
+
+def _trend_text(area: dict) -> str:
+    change = area.get("change") or 0
+    if change > 0:
+        return f"▲ {change}"
+    if change < 0:
+        return f"▼ {-change}"
+    return "Steady" if area["affected"] else "—"
+
+
+def render(data: dict) -> dict:
+    """Section html/text/rows from ``{"total_out", "as_of", "areas": [...]}`` built by ``build_data``."""
+    areas = data["areas"]
+    if not areas:
+        return {
+            "html": "<p>Status data unavailable.</p>",
+            "text": "Status data unavailable.",
+            "rows": {"areas": []},
+        }
+    as_of = data.get("as_of") or time.time()
+    table = build_table(
+        AREA_COLUMNS,
+        (
+            (
+                area["name"],
+                Cell(
+                    area["affected"],
+                    f"{area['affected']} ({area['pct_out']:.0f}%)",
+                    css=f"status-cell {_pct_class(area['pct_out'])}",
+                ),
+                Cell(area.get("since"), _since_text(area, as_of)),
+                Cell(area.get("change"), _trend_text(area)),
+            )
+            for area in areas
+        ),
+    )
+    heading = f"{data['total_out'] or 0} Outages"
+    return {
+        "html": f"<h3>{heading}</h3>{table.html}",
+        "text": f"{heading}\n{table.text}",
+        "rows": {"areas": table.rows},
+    }
+
+
+def summarize(data: dict) -> list[tuple[str, str]]:
+    """Bulletin lines (status class, text): the total, then each affected area by size."""
+    if not data["areas"]:
+        return []
+    affected = sorted(
+        (area for area in data["areas"] if area["affected"]), key=lambda area: -area["affected"]
+    )
+    if not affected:
+        return [("status-green", "Power: no outages")]
+    as_of = data.get("as_of") or time.time()
+    worst = max(area["pct_out"] for area in affected)
+    lines = [(_pct_class(worst), f"Power: {data['total_out'] or 0} out")]
+    for area in affected:
+        text = f"Power: {area['name']} {area['affected']} ({area['pct_out']:.0f}%)"
+        if area.get("since"):
+            text += f" for {_format_duration(as_of - area['since'])}"
+        if area.get("change"):
+            text += f", {area['change']:+d} in 30m"
+        lines.append((_pct_class(area["pct_out"]), text))
+    return lines
+
+
+def build_data(summary: dict, state: dict) -> dict:
+    """Render input for a summary, with start, restore and trend from the series in ``state``."""
+    last_update = summary.get("lastUpdate")
+    as_of = last_update / 1000 if last_update else time.time()
+    zips = state.get("zips", {})
+    areas = []
+    for zip_code, name, affected, served, pct_out in _extract_zip_rows(summary):
+        entry = zips.get(zip_code, {})
+        points = entry.get("points", [])
+        areas.append(
+            {
+                "zip": zip_code,
+                "name": name,
+                "affected": affected,
+                "served": served,
+                "pct_out": pct_out,
+                "since": entry.get("since"),
+                "restored_at": entry.get("restored_at"),
+                "duration": entry.get("duration"),
+                "change": affected - _count_at(points, as_of - TREND_WINDOW) if points else 0,
+            }
         )
-    else:
-        parts.append("<p>Status data unavailable.</p>")
+    outages = summary.get("outages", [])
+    return {
+        "total_out": sum(outage.get("nbrOut", 0) for outage in outages),
+        "as_of": as_of,
+        "areas": areas,
+    }
 
-    block_html = "".join(parts)
 
+def build_result(summary: dict, state: dict) -> dict:
+    data = build_data(summary, state)
     return {
         "id": "kiuc",
         "label": f"Power (<a href=\"{KIUC_URL}\">KIUC</a>)",
-        "retrieved_at": last_update,
+        "retrieved_at": _format_ts(summary.get("lastUpdate")),
         "source_urls": [KIUC_URL, KIUC_SUMMARY_URL],
-        "html": block_html,
+        **render(data),
+        "data": data,
         "error": None,
         "stale": False,
     }
+
+
+def scrape() -> dict:
+    summary = fetch_json(KIUC_SUMMARY_URL)
+    state = load_state(KIUC_SERIES_STATE) or {}
+    if update_series(state, summary):
+        save_state(KIUC_SERIES_STATE, state)
+    return build_result(summary, state)
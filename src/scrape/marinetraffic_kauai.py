@@ -1,4 +1,3 @@
-import html
 import math
 import os
 from datetime import datetime, timezone
@@ -6,10 +5,13 @@ from typing import Any
 
 import httpx
 
+from src.render.tables import Cell, Column, build_table
 from src.scrape.base import now_iso
+from src.scrape.sessions import with_session_cookies
 
 
 MARINETRAFFIC_BASE = "https://www.marinetraffic.com"
+SESSION_NAME = "marinetraffic"
 MARINETRAFFIC_TILE_URL = (
     "https://www.marinetraffic.com/getData/get_data_json_4/z:{z}/X:{x}/Y:{y}/station:0"
 )
@@ -86,6 +88,18 @@ VESSEL_TYPE_OVERRIDES = {
     "LADY KAILANI": "Sight seeing tour boat",
 }
 
+VESSEL_COLUMNS = (
+    Column("name", "Vessel"),
+    Column("type", "Type"),
+    Column("country", "Origin"),
+    Column("distance", "Distance [mi]"),
+    Column("speed", "Speed [kt]"),
+    Column("course", "Course"),
+    Column("destination", "Destination"),
+    Column("status", "Status"),
+    Column("port", "Port"),
+)
+
 
 def _debug_enabled() -> bool:
     return os.getenv("MARINETRAFFIC_DEBUG", "").lower() in {"1", "true", "yes", "on"}
@@ -257,6 +271,31 @@ def _distance_to_port_miles(lat: float, lon: float, destination: str) -> float:
     return (nearest_dist or 0.0) * NM_TO_MI
 
 
+def render(data: dict) -> dict:
+    """Section html/text/rows from ``{"vessels": [...]}`` as built by ``scrape``."""
+    table = build_table(
+        VESSEL_COLUMNS,
+        (
+            (
+                row["name"],
+                row["type"],
+                row["country"],
+                Cell(row["distance"], "" if row["distance"] is None else f"{row['distance']:.1f}"),
+                row["speed"],
+                row["course"],
+                row["destination"],
+                row["status"],
+                row["port"],
+            )
+            for row in data["vessels"]
+        ),
+    )
+    info_html = (
+        "<p class=\"info\">Commercial vessels nearby Kauai ports.</p>"
+    )
+    return {"html": info_html + table.html, "text": table.text, "rows": {"vessels": table.rows}}
+
+
 def scrape() -> dict:
     headers = {
         "Accept": "*/*",
@@ -273,17 +312,16 @@ def scrape() -> dict:
     response = None
     try:
         with httpx.Client(timeout=20.0, headers=headers) as client:
-            try:
-                client.get(headers["Referer"])
-            except Exception as exc:
-                _debug(f"Warmup failed: {exc}")
-            for x, y in tiles:
-                rows = _fetch_tile(client, TILE_ZOOM, x, y)
-                for row in rows:
-                    ship_id = str(row.get("SHIP_ID") or "")
-                    if not ship_id:
-                        continue
-                    vessels[ship_id] = row
+
+            def fetch_tiles() -> None:
+                for x, y in tiles:
+                    for row in _fetch_tile(client, TILE_ZOOM, x, y):
+                        ship_id = str(row.get("SHIP_ID") or "")
+                        if not ship_id:
+                            continue
+                        vessels[ship_id] = row
+
+            with_session_cookies(client, SESSION_NAME, headers["Referer"], fetch_tiles)
     except Exception as exc:
         message = f"MarineTraffic fetch failed: {exc}"
         if response is not None:
@@ -343,39 +381,15 @@ def scrape() -> dict:
 
     rows.sort(key=lambda item: (item["status"] != "En route", item["name"]))
 
-    table_rows = "".join(
-        "<tr>"
-        f"<td>{html.escape(row['name'])}</td>"
-        f"<td>{html.escape(row['type'])}</td>"
-        f"<td>{html.escape(row['country'])}</td>"
-        f"<td>{'' if row['distance'] is None else '{:.1f}'.format(row['distance'])}</td>"
-        f"<td>{'' if row['speed'] is None else row['speed']}</td>"
-        f"<td>{html.escape(row['course'])}</td>"
-        f"<td>{html.escape(row['destination'])}</td>"
-        f"<td>{html.escape(row['status'])}</td>"
-        f"<td>{html.escape(row['port'])}</td>"
-        "</tr>"
-        for row in rows
-    )
-
-    info_html = (
-        "<p class=\"info\">Commercial vessels nearby Kauai ports.</p>"
-    )
-    body = (
-        info_html
-        + "<table>"
-        "<thead><tr><th>Vessel</th><th>Type</th><th>Origin</th><th>Distance [mi]</th>"
-        "<th>Speed [kt]</th><th>Course</th><th>Destination</th><th>Status</th><th>Port</th></tr></thead>"
-        f"<tbody>{table_rows}</tbody>"
-        "</table>"
-    )
+    data = {"vessels": rows}
 
     return {
         "id": "marinetraffic_kauai",
         "label": "Marine Traffic (<a href=\"https://www.marinetraffic.com\">MarineTraffic</a>)",
         "retrieved_at": now_iso(),
         "source_urls": [MARINETRAFFIC_BASE],
-        "html": body,
+        **render(data),
+        "data": data,
         "error": None,
         "stale": False,
         "layout": "full",
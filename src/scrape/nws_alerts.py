@@ -0,0 +1,100 @@
+"""Active NWS alerts (hazards) for Kauai.
+
+Kept apart from the weather section so the alert watcher can refresh it on its own
+and re-render the page from cached sections.
+"""
+
+import html
+
+from src.scrape.base import fetch_json, now_iso
+
+ALERTS_URL = "https://api.weather.gov/alerts?active=true&point=22.21%2C-159.41&limit=500"
+ALERTS_MAP_URL = "https://www.weather.gov/hfo/"
+
+
+def _extract_hazards_from_api(payload: dict) -> list[dict]:
+    hazards = []
+    for feature in payload.get("features", []):
+        props = feature.get("properties", {})
+        headline = props.get("headline") or props.get("event")
+        description = props.get("description") or ""
+        instruction = props.get("instruction") or ""
+        if not headline:
+            continue
+        hazards.append(
+            {
+                "headline": headline,
+                "description": description,
+                "instruction": instruction,
+            }
+        )
+    return hazards
+
+
+def alert_versions(payload: dict) -> dict[str, str]:
+    """Alert id -> its latest ``sent``/``updated`` time, used to detect new or changed alerts."""
+    versions = {}
+    for feature in payload.get("features", []):
+        props = feature.get("properties", {})
+        alert_id = props.get("id") or feature.get("id")
+        if alert_id:
+            versions[alert_id] = props.get("updated") or props.get("sent") or ""
+    return versions
+
+
+def render(data: dict) -> dict:
+    """Section html from ``{"hazards": [{headline, description, instruction}]}``."""
+    hazard_items = []
+    for hazard in data["hazards"]:
+        description = hazard.get("description", "")
+        instruction = hazard.get("instruction", "")
+        summary_parts = [description, instruction]
+        summary = "\n\n".join([part for part in summary_parts if part])
+        summary_html = html.escape(summary).replace("\n", "<br>")
+        headline_html = html.escape(hazard["headline"])
+        if summary:
+            hazard_items.append(
+                "<details>"
+                f"<summary>{headline_html}</summary>"
+                f"<div>{summary_html}</div>"
+                "</details>"
+            )
+        else:
+            hazard_items.append(headline_html)
+
+    return {"html": "".join(hazard_items) if hazard_items else "<p>No active hazards.</p>"}
+
+
+def summarize(data: dict) -> list[tuple[str, str]]:
+    """Bulletin lines (status class, text): one per hazard, warnings ranked above watches."""
+    if not data["hazards"]:
+        return [("status-green", "Hazards: none")]
+    lines = []
+    for hazard in data["hazards"]:
+        headline = hazard["headline"].split(" by NWS")[0]
+        if "Warning" in headline:
+            status_class = "status-red"
+        elif "Watch" in headline or "Advisory" in headline:
+            status_class = "status-yellow"
+        else:
+            status_class = ""
+        lines.append((status_class, f"Hazard: {headline}"))
+    return lines
+
+
+def build_result(payload: dict) -> dict:
+    data = {"hazards": _extract_hazards_from_api(payload)}
+    return {
+        "id": "nws_alerts",
+        "label": f'Hazards (<a href="{ALERTS_MAP_URL}">NWS</a>)',
+        "retrieved_at": now_iso(),
+        "source_urls": [ALERTS_URL],
+        **render(data),
+        "data": data,
+        "error": None,
+        "stale": False,
+    }
+
+
+def scrape() -> dict:
+    return build_result(fetch_json(ALERTS_URL))
@@ -1,6 +1,7 @@
 import html
 from datetime import datetime
 
+from src.render.tables import compact_table
 from src.scrape.base import fetch_json, now_iso
 
 
@@ -125,10 +126,10 @@ def scrape() -> dict:
         )
         body = (
             f"{info_html}"
-            "<table>"
-            "<thead><tr><th>Site</th><th>Bacteria</th><th>Date</th></tr></thead>"
-            f"<tbody>{table_rows}</tbody>"
-            "</table>"
+            + compact_table(
+                "<thead><tr><th>Site</th><th>Bacteria</th><th>Date</th></tr></thead>"
+                f"<tbody>{table_rows}</tbody>"
+            )
         )
         error = None
         stale = False
@@ -0,0 +1,262 @@
+"""Concurrent per-town outage checks shared by the mobile carrier sections.
+
+A carrier is described by a ``Carrier`` adapter: how to build its request for a town
+and how to classify the response. ``probe_towns`` checks every town at once over one
+pooled client, so adding towns does not add latency. Carriers that need a bearer
+token share a ``TokenCache``; concurrent probes rejected with 401/403 trigger a
+single refresh.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import httpx
+
+from src.http_log import log_provider_failure
+from src.render.tables import Cell, Column, build_table
+from src.scrape.base import gather
+from src.scrape.sessions import load_token, save_token
+
+# (status, status class, detail)
+Status = tuple[str, str, str | None]
+
+MAX_CONCURRENT_PROBES = 16
+PROBE_TIMEOUT = 20.0
+# After a failed token fetch, probes in flight give up instead of each retrying it.
+TOKEN_RETRY_SECONDS = 30.0
+
+TOWNS = [
+    {
+        "town": "Princeville",
+        "address": "5-4280 Kuhio Hwy, Princeville, HI 96722, United States",
+        "city": "Princeville",
+        "zipcode": "96722",
+        "latitude": 22.21315,
+        "longitude": -159.47475,
+    },
+    {
+        "town": "Kilauea",
+        "address": "4260 Keneke St, Kilauea, HI 96754, United States",
+        "city": "Kilauea",
+        "zipcode": "96754",
+        "latitude": 22.2119526,
+        "longitude": -159.4061672,
+    },
+    {
+        "town": "Anahola",
+        "address": "4-4350 Kuhio Hwy, Anahola, HI 96703, United States",
+        "city": "Anahola",
+        "zipcode": "96703",
+        "latitude": 22.144722,
+        "longitude": -159.314957,
+    },
+    {
+        "town": "Kapaa",
+        "address": "4-1105 Kuhio Hwy, Kapaa, HI 96746, United States",
+        "city": "Kapaa",
+        "zipcode": "96746",
+        "latitude": 22.05138,
+        "longitude": -159.3338,
+    },
+    {
+        "town": "Lihue",
+        "address": "4280 Rice St, Lihue, HI 96766, United States",
+        "city": "Lihue",
+        "zipcode": "96766",
+        "latitude": 21.97285,
+        "longitude": -159.36477,
+    },
+]
+
+TOWN_STATUS_COLUMNS = (
+    Column("town", "Town"),
+    Column("status", "Status"),
+    Column("detail", "Detail"),
+)
+
+
+class TokenCache:
+    """Bearer token shared by concurrent probes.
+
+    ``fetch(client)`` returns ``(token or None, expires_at)``. The lock makes
+    concurrent callers wait for one fetch instead of each requesting a token, and a
+    failed fetch is not retried for ``TOKEN_RETRY_SECONDS``. With a ``session`` name
+    the token is kept in the session store, so later runs reuse it until it expires
+    or is rejected.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[httpx.Client], tuple[str | None, float]],
+        session: str | None = None,
+    ):
+        self._fetch = fetch
+        self._session = session
+        self._lock = threading.Lock()
+        self.token: str | None = None
+        self.expires_at = 0.0
+        self.failed_at = float("-inf")
+        self._restored = session is None
+
+    def _valid(self) -> bool:
+        return bool(self.token) and self.expires_at > time.time()
+
+    def _refresh(self, client: httpx.Client) -> str | None:
+        if time.time() - self.failed_at < TOKEN_RETRY_SECONDS:
+            return None
+        token, expires_at = self._fetch(client)
+        if token:
+            self.token, self.expires_at = token, expires_at
+            if self._session:
+                save_token(self._session, token, expires_at)
+        else:
+            self.token, self.expires_at, self.failed_at = None, 0.0, time.time()
+        return token
+
+    def get(self, client: httpx.Client) -> str | None:
+        with self._lock:
+            if not self._restored:
+                self._restored = True
+                self.token, self.expires_at = load_token(self._session)
+            if self._valid():
+                return self.token
+            return self._refresh(client)
+
+    def replace(self, client: httpx.Client, rejected: str) -> str | None:
+        """A token to retry with after ``rejected`` got a 401/403.
+
+        Only the first caller holding the rejected token refreshes; the rest reuse its result.
+        """
+        with self._lock:
+            if self.token != rejected and self._valid():
+                return self.token
+            return self._refresh(client)
+
+
+@dataclass(frozen=True)
+class Carrier:
+    """Adapter for one carrier's outage API.
+
+    ``request(town, token)`` returns ``httpx.Client.post`` keyword arguments (``json``,
+    ``headers``...) and ``classify(payload)`` turns the JSON response into a ``Status``.
+    """
+
+    name: str
+    url: str
+    request: Callable[[dict, str | None], dict[str, Any]]
+    classify: Callable[[dict], Status]
+    headers: dict[str, str] | None = None
+    warmup_url: str | None = None
+    tokens: TokenCache | None = None
+
+
+def probe_town(client: httpx.Client, carrier: Carrier, town: dict) -> Status:
+    token = None
+    if carrier.tokens is not None:
+        token = carrier.tokens.get(client)
+        if not token:
+            print(f"{carrier.name} outage check failed: token fetch failed.")
+            return "Unknown", "", "Token fetch failed."
+
+    response = None
+    try:
+        response = client.post(carrier.url, **carrier.request(town, token))
+        if carrier.tokens is not None and response.status_code in {401, 403}:
+            token = carrier.tokens.replace(client, token)
+            if not token:
+                print(f"{carrier.name} outage check failed: token refresh failed.")
+                return "Unknown", "", "Token refresh failed."
+            response = client.post(carrier.url, **carrier.request(town, token))
+        response.raise_for_status()
+        payload = response.json()
+    except Exception as exc:
+        town_name = town.get("town", "unknown")
+        if response is not None:
+            log_provider_failure(
+                f"{carrier.name} outage check",
+                f"for {town_name}",
+                status_code=response.status_code,
+                response_body=response.text,
+            )
+        else:
+            log_provider_failure(f"{carrier.name} outage check", f"for {town_name}", exc=exc)
+        return "Unknown", "", "Fetch failed."
+    return carrier.classify(payload)
+
+
+def _probe_all(
+    client: httpx.Client, carrier: Carrier, towns: list[dict], max_workers: int
+) -> list[dict]:
+    if carrier.warmup_url:
+        try:
+            warmup = client.get(carrier.warmup_url)
+            if warmup.status_code >= 400:
+                print(f"{carrier.name} warmup failed (HTTP {warmup.status_code}).")
+        except Exception as exc:
+            print(f"{carrier.name} warmup failed: {exc}")
+
+    results = gather(
+        {index: (lambda t=town: probe_town(client, carrier, t)) for index, town in enumerate(towns)},
+        max_workers=max_workers,
+    )
+    rows = []
+    for index, town in enumerate(towns):
+        result = results[index]
+        if isinstance(result, Exception):
+            print(f"{carrier.name} outage check failed for {town['town']}: {result}")
+            result = ("Unknown", "", "Fetch failed.")
+        status, status_class, detail = result
+        rows.append(
+            {
+                "town": town["town"],
+                "status": status,
+                "status_class": status_class,
+                "detail": detail or "",
+            }
+        )
+    return rows
+
+
+def probe_towns(
+    carrier: Carrier, towns: list[dict] = TOWNS, max_workers: int = MAX_CONCURRENT_PROBES
+) -> list[dict]:
+    """Town status rows (town, status, status_class, detail), in ``towns`` order."""
+    limits = httpx.Limits(max_connections=max_workers, max_keepalive_connections=max_workers)
+    with httpx.Client(timeout=PROBE_TIMEOUT, headers=carrier.headers, limits=limits) as client:
+        return _probe_all(client, carrier, towns, max_workers)
+
+
+def summarize_towns(carrier_name: str, data: dict) -> list[tuple[str, str]]:
+    """Bulletin lines (status class, text): towns grouped by status, or one "OK" line."""
+    by_status: dict[tuple[str, str], list[str]] = {}
+    for row in data["towns"]:
+        if row["status"] not in {"OK", "Unknown"}:
+            by_status.setdefault((row["status"], row["status_class"]), []).append(row["town"])
+    if not by_status:
+        if all(row["status"] == "Unknown" for row in data["towns"]):
+            return [("", f"{carrier_name}: status unknown")]
+        return [("status-green", f"{carrier_name}: OK")]
+    return [
+        (status_class, f"{carrier_name}: {status} {', '.join(towns)}")
+        for (status, status_class), towns in by_status.items()
+    ]
+
+
+def render(data: dict) -> dict:
+    """Section html/text/rows from ``{"towns": [{town, status, status_class, detail}]}``."""
+    table = build_table(
+        TOWN_STATUS_COLUMNS,
+        (
+            (
+                row["town"],
+                Cell(row["status"], css=f"status-cell {row['status_class']}".strip()),
+                row["detail"],
+            )
+            for row in data["towns"]
+        ),
+    )
+    return {"html": table.html, "text": table.text, "rows": {"towns": table.rows}}
@@ -1,11 +1,14 @@
 import html
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 
 import httpx
 
-from src.hcdp.client import HCDP_BASE_URL, MesonetClient
-from src.hcdp.parse import pivot_latest_measurements
+from src.hcdp.client import HCDP_BASE_URL
+from src.hcdp.shared import HCDP_STATION_IDS, has_credentials, measurements, register
+from src.render.tables import Cell, Column, Table, build_table
 from src.scrape.base import now_iso
+from src.scrape.cache import load_state, save_state
+from src.scrape.rolling import SlotTotals
 
 COCORAS_MAP_URL = "https://maps.cocorahs.org/?maptype=active-stations"
 DEX_STATION_URL = "https://functions-dev-dex-cocorahs-org.azurewebsites.net/api/StationHistoryReport"
@@ -32,8 +35,14 @@ STATION_QUALIFIERS = {
 }
 
 HCDP_DOCS_URL = "https://hcdp.github.io/hcdp_api_docs/"
-HCDP_STATION_IDS = ("0603", "0601", "0602", "0611", "0641", "0621")
 HCDP_RAIN_VAR_ID = "RF_1_Tot300s"  # 5-minute total rainfall, mm
+HCDP_RAIN_STATE = "hcdp_rain_5min"
+HCDP_RAIN_SLOT_SECONDS = 300
+HCDP_RAIN_RETENTION = timedelta(hours=72)
+# Re-request a little before the last stored slot to pick up late-arriving rows.
+HCDP_RAIN_FETCH_OVERLAP = timedelta(minutes=15)
+HCDP_RAIN_WINDOWS = (("1h", 1), ("3h", 3), ("6h", 6), ("24h", 24), ("72h", 72))
+_RAIN_RETENTION_SLOTS = int(HCDP_RAIN_RETENTION.total_seconds()) // HCDP_RAIN_SLOT_SECONDS
 
 # Compact labels (also used in weather module)
 HCDP_STATION_NAMES = {
@@ -45,6 +54,11 @@ HCDP_STATION_NAMES = {
     "0621": "Lawai NTBG",
 }
 
+MESONET_COLUMNS = (
+    Column("station", "Station"),
+    *(Column(f"last_{label}", f"Last {label} [in]", align="right") for label, _ in HCDP_RAIN_WINDOWS),
+)
+
 
 def _mm_to_inches(value_mm: float | None) -> str:
     if value_mm is None:
@@ -56,95 +70,86 @@ def _mm_to_inches(value_mm: float | None) -> str:
         return "—"
 
 
-def _sum_mm(values: list[float]) -> float:
-    total = 0.0
-    for v in values:
-        try:
-            total += float(v)
-        except (TypeError, ValueError):
-            continue
-    return total
+def _load_rain_totals() -> dict[str, SlotTotals]:
+    stored = load_state(HCDP_RAIN_STATE) or {}
+    return {
+        sid: SlotTotals.from_dict(stored.get(sid), HCDP_RAIN_SLOT_SECONDS, _RAIN_RETENTION_SLOTS)
+        for sid in HCDP_STATION_IDS
+    }
 
 
-def _build_mesonet_rain_table() -> str:
-    # HCDP endpoint can intermittently 504; fail fast so the whole module renders.
-    client = MesonetClient(timeout=20.0)
-    if not client.has_credentials:
-        return (
-            "<p class=\"info\">Mesonet rainfall is available when <code>HCDP_API_KEY</code> is set.</p>"
-        )
+def _rain_lookback() -> timedelta:
+    """Fetch only rows newer than the oldest station's last stored slot (cold start: full retention).
+
+    Stations with nothing stored, or nothing stored within the retention window, are
+    ignored so a dead station cannot force a full reload every run.
+    """
+    totals = _load_rain_totals()
+    now = datetime.now(tz=timezone.utc).timestamp()
+    floor = now - HCDP_RAIN_RETENTION.total_seconds()
+    last_times = [
+        t.last_time for t in totals.values() if t.last_time is not None and t.last_time > floor
+    ]
+    if not last_times:
+        return HCDP_RAIN_RETENTION
+    since = now - min(last_times)
+    lookback = timedelta(seconds=since) + HCDP_RAIN_FETCH_OVERLAP
+    return min(lookback, HCDP_RAIN_RETENTION)
 
-    # Rolling window totals (RF_1_Tot3600s / RF_1_Tot86400s) were not available in measurements
-    # for Kauai stations; compute closest match by summing the 5-minute totals.
-    from datetime import timezone
 
-    now_utc = datetime.now(tz=timezone.utc)
-    start_utc = now_utc - timedelta(hours=24, minutes=15)
-    start_date = start_utc.isoformat(timespec="seconds").replace("+00:00", "Z")
+register((HCDP_RAIN_VAR_ID,), _rain_lookback)
 
+
+def _fetch_mesonet_rain() -> dict:
+    """``{"rows": [...]}`` of window totals per station, or ``{"message": html}``."""
+    if not has_credentials():
+        return {
+            "message": "<p class=\"info\">Mesonet rainfall is available when <code>HCDP_API_KEY</code> is set.</p>"
+        }
+
+    # Rolling window totals (RF_1_Tot3600s / RF_1_Tot86400s) were not available in measurements
+    # for Kauai stations; compute them from a persisted buffer of the 5-minute totals.
+    totals = _load_rain_totals()
     try:
-        raw = client.get_measurements(
-            station_ids=HCDP_STATION_IDS,
-            var_ids=(HCDP_RAIN_VAR_ID,),
-            start_date=start_date,
-            limit=8000,
-            join_metadata=False,
-        )
+        columns = measurements((HCDP_RAIN_VAR_ID,))
     except Exception as exc:
-        return f"<p>Mesonet rainfall unavailable: {html.escape(str(exc))}</p>"
+        return {"message": f"<p>Mesonet rainfall unavailable: {html.escape(str(exc))}</p>"}
 
-    # Group 5-min totals by station and time.
-    by_station: dict[str, list[tuple[datetime, float]]] = {}
-    for row in raw:
-        if row.get("variable") != HCDP_RAIN_VAR_ID:
-            continue
-        sid = str(row.get("station_id") or "").strip()
-        if not sid:
-            continue
-        ts_raw = str(row.get("timestamp") or "").strip()
-        if not ts_raw:
-            continue
-        try:
-            ts = datetime.fromisoformat(ts_raw.replace("Z", "+00:00"))
-        except ValueError:
+    order = sorted(range(len(columns)), key=columns.epoch.__getitem__)
+    for i in order:
+        station_totals = totals.get(columns.station_id[i])
+        value = columns.value[i]
+        if station_totals is None or value != value:  # unknown station or NaN
             continue
-        try:
-            v = float(str(row.get("value") or "").strip())
-        except (TypeError, ValueError):
-            continue
-        by_station.setdefault(sid, []).append((ts, v))
+        station_totals.add(columns.epoch[i], value)
+    save_state(HCDP_RAIN_STATE, {sid: t.to_dict() for sid, t in totals.items()})
 
-    rows_html = []
+    now_ts = datetime.now(tz=timezone.utc).timestamp()
+    rows = []
     for sid in HCDP_STATION_IDS:
-        series = by_station.get(sid, [])
-        if not series:
+        station_totals = totals[sid]
+        if not len(station_totals):
             continue
-        # Compute last 1h and last 24h based on timestamps.
-        series.sort(key=lambda x: x[0], reverse=True)
-        cutoff_1h = now_utc - timedelta(hours=1)
-        cutoff_24h = now_utc - timedelta(hours=24)
-        mm_1h = _sum_mm([v for ts, v in series if ts >= cutoff_1h])
-        mm_24h = _sum_mm([v for ts, v in series if ts >= cutoff_24h])
-        name = html.escape(HCDP_STATION_NAMES.get(sid, sid))
-        last_1h = _mm_to_inches(mm_1h)
-        last_24h = _mm_to_inches(mm_24h)
-        rows_html.append(
-            "<tr>"
-            f"<td>{name}</td>"
-            f"<td style=\"text-align:right;\">{html.escape(last_1h)}</td>"
-            f"<td style=\"text-align:right;\">{html.escape(last_24h)}</td>"
-            "</tr>"
-        )
-
-    if not rows_html:
-        return "<p>No Mesonet rainfall values for configured stations.</p>"
-
-    return (
-        "<table>"
-        "<thead><tr><th>Station</th><th>Last 1h [in]</th><th>Last 24h [in]</th></tr></thead>"
-        f"<tbody>{''.join(rows_html)}</tbody>"
-        "</table>"
+        row = {"station": HCDP_STATION_NAMES.get(sid, sid)}
+        for label, hours in HCDP_RAIN_WINDOWS:
+            cutoff = now_ts - hours * 3600
+            # A window that starts after the station's last report has no data, not zero rain.
+            silent = station_totals.last_time < cutoff
+            row[f"last_{label}"] = _mm_to_inches(None if silent else station_totals.total_since(cutoff))
+        rows.append(row)
+
+    if not rows:
+        return {"message": "<p>No Mesonet rainfall values for configured stations.</p>"}
+    return {"rows": rows}
+
+
+def _render_mesonet_rain(block: dict) -> tuple[str, Table | None]:
+    if "rows" not in block:
+        return block["message"], None
+    table = build_table(
+        MESONET_COLUMNS, (tuple(row[col.key] for col in MESONET_COLUMNS) for row in block["rows"])
     )
+    return table.html, table
 
 
 def _format_cocorahs_date(value: date) -> tuple[str, str]:
@@ -256,7 +261,8 @@ def _qualified_station_name(station_name: str, station_number: str) -> str:
     return f"{station_name} ({qualifier})"
 
 
-def _build_precip_table(today: date) -> str:
+def _fetch_cocorahs_reports(today: date) -> dict:
+    """``{"rows": [...], "prev_month": name}`` of station reports, or ``{"message": html}``."""
     yesterday = today - timedelta(days=1)
     range_start = (today.replace(day=1) - timedelta(days=1)).replace(day=1)
     try:
@@ -285,10 +291,10 @@ def _build_precip_table(today: date) -> str:
                     }
                 )
     except Exception:
-        return "<p>Daily precipitation reports unavailable.</p>"
+        return {"message": "<p>Daily precipitation reports unavailable.</p>"}
 
     if not rows:
-        return "<p>No precipitation reports for Kauai stations.</p>"
+        return {"message": "<p>No precipitation reports for Kauai stations.</p>"}
 
     town_order = ["hanalei", "princeville", "kilauea", "kapaa", "lihue"]
 
@@ -303,38 +309,68 @@ def _build_precip_table(today: date) -> str:
         rows,
         key=lambda item: (_town_rank(item["station_name"]), item["station_name"].lower()),
     )
-    table_rows = "".join(
-        "<tr>"
-        f"<td>{html.escape(row['station_name'])}</td>"
-        f"<td><a href=\"{DEX_PRECIP_URL}/{html.escape(row['station_number'])}\">"
-        f"{html.escape(row['station_number'])}</a></td>"
-        f"<td style=\"text-align:right;\">{html.escape(row['today'])}</td>"
-        f"<td style=\"text-align:right;\">{html.escape(row['yesterday'])}</td>"
-        f"<td style=\"text-align:right;\">{html.escape(row['last_72h'])}</td>"
-        f"<td style=\"text-align:right;\">{html.escape(row['month_current'])}</td>"
-        f"<td style=\"text-align:right;\">{html.escape(row['month_prev'])}</td>"
-        "</tr>"
-        for row in sorted_rows
-    )
     prev_month = today.replace(day=1) - timedelta(days=1)
-    prev_label = prev_month.strftime("%B")
-    return (
-        "<table>"
-        "<thead><tr><th>Location</th><th>Station ID</th><th>Today [in]</th><th>Yesterday [in]</th><th>Last 72h [in]</th><th>This Month [in]</th>"
-        f"<th>{html.escape(prev_label)} [in]</th></tr></thead>"
-        f"<tbody>{table_rows}</tbody>"
-        "</table>"
+    return {"rows": sorted_rows, "prev_month": prev_month.strftime("%B")}
+
+
+def _render_cocorahs_reports(block: dict) -> tuple[str, Table | None]:
+    if "rows" not in block:
+        return block["message"], None
+    columns = (
+        Column("location", "Location"),
+        Column("station_id", "Station ID"),
+        Column("today", "Today [in]", align="right"),
+        Column("yesterday", "Yesterday [in]", align="right"),
+        Column("last_72h", "Last 72h [in]", align="right"),
+        Column("month_current", "This Month [in]", align="right"),
+        Column("month_prev", f"{block['prev_month']} [in]", align="right"),
     )
+    table = build_table(
+        columns,
+        (
+            (
+                row["station_name"],
+                Cell(row["station_number"], href=f"{DEX_PRECIP_URL}/{row['station_number']}"),
+                row["today"],
+                row["yesterday"],
+                row["last_72h"],
+                row["month_current"],
+                row["month_prev"],
+            )
+            for row in block["rows"]
+        ),
+    )
+    return table.html, table
 
 
-def scrape() -> dict:
-    today = datetime.now().date()
+def render(data: dict) -> dict:
+    """Section html/text/rows from ``{"cocorahs": block, "mesonet": block}``."""
+    cocorahs_html, cocorahs = _render_cocorahs_reports(data["cocorahs"])
+    mesonet_html, mesonet = _render_mesonet_rain(data["mesonet"])
     body = (
         "<h3>Precipitation</h3>"
-        f"{_build_precip_table(today)}"
+        f"{cocorahs_html}"
         "<h3>Mesonet rainfall</h3>"
-        f"{_build_mesonet_rain_table()}"
+        f"{mesonet_html}"
     )
+    text = "\n\n".join(
+        f"{heading}\n{table.text}"
+        for heading, table in (("Precipitation", cocorahs), ("Mesonet rainfall", mesonet))
+        if table is not None
+    )
+    rows = {
+        name: table.rows
+        for name, table in (("cocorahs", cocorahs), ("mesonet", mesonet))
+        if table is not None
+    }
+    return {"html": body, "text": text, "rows": rows}
+
+
+def scrape() -> dict:
+    data = {
+        "cocorahs": _fetch_cocorahs_reports(datetime.now().date()),
+        "mesonet": _fetch_mesonet_rain(),
+    }
     return {
         "id": "precipitation",
         "label": (
@@ -348,7 +384,8 @@ def scrape() -> dict:
             HCDP_BASE_URL + "/mesonet/db/measurements",
             HCDP_DOCS_URL,
         ],
-        "html": body,
+        **render(data),
+        "data": data,
         "error": None,
         "stale": False,
     }
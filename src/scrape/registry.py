@@ -1,19 +1,20 @@
 from src.scrape.hawaiiantelcom import scrape as scrape_hawaiiantelcom
-from src.scrape.hidot_highways_news import scrape as scrape_hidot_highways_news
+from src.scrape.hidot_highways_news import scrape as scrape_hidot_highways_news, summarize as summarize_hidot_highways_news
 from src.scrape.khon2_kauai import scrape as scrape_khon2_kauai
 from src.scrape.kauai_now import scrape as scrape_kauai_now
 from src.scrape.kauai_water import scrape as scrape_kauai_water
-from src.scrape.kiuc import scrape as scrape_kiuc
+from src.scrape.kiuc import render as render_kiuc, scrape as scrape_kiuc, summarize as summarize_kiuc
 from src.scrape.cnn_topstories import scrape as scrape_cnn_topstories
 from src.scrape.foxnews_us import scrape as scrape_foxnews_us
 from src.scrape.weather_kauai import scrape as scrape_weather_kauai
-from src.scrape.usgs_water_levels import scrape as scrape_usgs_water_levels
+from src.scrape.nws_alerts import render as render_nws_alerts, scrape as scrape_nws_alerts, summarize as summarize_nws_alerts
+from src.scrape.usgs_water_levels import render as render_usgs_water_levels, scrape as scrape_usgs_water_levels, summarize as summarize_usgs_water_levels
 from src.scrape.ocean_water_quality import scrape as scrape_ocean_water_quality
-from src.scrape.verizon_mobile import scrape as scrape_verizon_mobile
-from src.scrape.precipitation import scrape as scrape_precipitation
-from src.scrape.att_mobile import scrape as scrape_att_mobile
-from src.scrape.adsbexchange_live import scrape as scrape_adsbexchange_live
-from src.scrape.marinetraffic_kauai import scrape as scrape_marinetraffic_kauai
+from src.scrape.verizon_mobile import render as render_verizon_mobile, scrape as scrape_verizon_mobile, summarize as summarize_verizon_mobile
+from src.scrape.precipitation import render as render_precipitation, scrape as scrape_precipitation
+from src.scrape.att_mobile import render as render_att_mobile, scrape as scrape_att_mobile, summarize as summarize_att_mobile
+from src.scrape.adsbexchange_live import render as render_adsbexchange_live, scrape as scrape_adsbexchange_live
+from src.scrape.marinetraffic_kauai import render as render_marinetraffic_kauai, scrape as scrape_marinetraffic_kauai
 from src.scrape.kauai_county_press import scrape as scrape_kauai_county_press
 from src.scrape.kauai_solid_waste import scrape as scrape_kauai_solid_waste
 from src.scrape.breaking_news import scrape as scrape_breaking_news
@@ -32,6 +33,7 @@ SCRAPERS = {
     "kauai_water": scrape_kauai_water,
     "kiuc": scrape_kiuc,
     "weather_kauai": scrape_weather_kauai,
+    "nws_alerts": scrape_nws_alerts,
     "usgs_water_levels": scrape_usgs_water_levels,
     "ocean_water_quality": scrape_ocean_water_quality,
     "verizon_mobile": scrape_verizon_mobile,
@@ -47,8 +49,41 @@ SCRAPERS = {
     "global_events_wire": scrape_global_events_wire,
 }
 
+# Scrapers whose sections carry structured "data"; each renderer turns that data back
+# into the section's html/text/rows so cached sections can be re-rendered offline.
+RENDERERS = {
+    "kiuc": render_kiuc,
+    "nws_alerts": render_nws_alerts,
+    "usgs_water_levels": render_usgs_water_levels,
+    "verizon_mobile": render_verizon_mobile,
+    "att_mobile": render_att_mobile,
+    "precipitation": render_precipitation,
+    "adsbexchange_live": render_adsbexchange_live,
+    "marinetraffic_kauai": render_marinetraffic_kauai,
+}
+
+
+# Scrapers whose structured "data" can be summarized into text bulletin lines,
+# ``(status class, text)`` pairs ranked by severity in ``src.render.bulletin``.
+SUMMARIZERS = {
+    "nws_alerts": summarize_nws_alerts,
+    "kiuc": summarize_kiuc,
+    "usgs_water_levels": summarize_usgs_water_levels,
+    "verizon_mobile": summarize_verizon_mobile,
+    "att_mobile": summarize_att_mobile,
+    "hidot_highways_news": summarize_hidot_highways_news,
+}
+
 
 def get_scraper(name: str):
     if name not in SCRAPERS:
         raise KeyError(f"Unknown scraper: {name}")
     return SCRAPERS[name]
+
+
+def get_renderer(name: str):
+    return RENDERERS.get(name)
+
+
+def get_summarizer(name: str):
+    return SUMMARIZERS.get(name)
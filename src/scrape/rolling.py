@@ -0,0 +1,180 @@
+"""Bounded rolling time series with constant-time trend statistics."""
+
+from __future__ import annotations
+
+from collections import deque
+
+
+class RollingRate:
+    """Time series bounded to ``retention`` seconds with a least-squares slope.
+
+    Points inside the most recent ``rate_window`` seconds contribute to running
+    sums, so appending a point and reading the slope are both O(1) (amortized).
+    Older points are kept until they fall out of ``retention`` so the series can
+    be persisted and resumed incrementally.
+    """
+
+    def __init__(self, rate_window: float, retention: float) -> None:
+        self.rate_window = rate_window
+        self.retention = max(retention, rate_window)
+        self._older: deque[tuple[float, float]] = deque()
+        self._recent: deque[tuple[float, float]] = deque()
+        # Times are stored relative to an origin to keep the sums well conditioned.
+        self._origin: float | None = None
+        self._n = 0
+        self._st = 0.0
+        self._sv = 0.0
+        self._stt = 0.0
+        self._stv = 0.0
+
+    def __len__(self) -> int:
+        return len(self._older) + len(self._recent)
+
+    @property
+    def latest(self) -> tuple[float, float] | None:
+        return self._recent[-1] if self._recent else None
+
+    def _add(self, t: float, v: float, sign: float) -> None:
+        x = t - self._origin
+        self._n += int(sign)
+        self._st += sign * x
+        self._sv += sign * v
+        self._stt += sign * x * x
+        self._stv += sign * x * v
+
+    def append(self, t: float, v: float) -> bool:
+        """Add a point; points not newer than the latest one are ignored."""
+        latest = self.latest
+        if latest is not None and t <= latest[0]:
+            return False
+        if self._origin is None:
+            self._origin = t
+        self._recent.append((t, v))
+        self._add(t, v, 1.0)
+        while self._recent and self._recent[0][0] < t - self.rate_window:
+            old = self._recent.popleft()
+            self._add(old[0], old[1], -1.0)
+            self._older.append(old)
+        while self._older and self._older[0][0] < t - self.retention:
+            self._older.popleft()
+        return True
+
+    def slope(self) -> float | None:
+        """Least-squares rate of change per second over the rate window."""
+        if self._n < 2:
+            return None
+        denom = self._n * self._stt - self._st * self._st
+        if denom <= 0:
+            return None
+        return (self._n * self._stv - self._st * self._sv) / denom
+
+    def points(self) -> list[list[float]]:
+        return [[t, v] for t, v in (*self._older, *self._recent)]
+
+    @classmethod
+    def from_points(
+        cls, points, rate_window: float, retention: float
+    ) -> "RollingRate":
+        series = cls(rate_window, retention)
+        for point in points or []:
+            try:
+                series.append(float(point[0]), float(point[1]))
+            except (TypeError, ValueError, IndexError):
+                continue
+        return series
+
+
+def time_to_threshold(
+    value: float | None, rate_per_hour: float | None, threshold: float | None
+) -> float | None:
+    """Hours until a rising value reaches threshold, or None if not rising toward it."""
+    if value is None or rate_per_hour is None or threshold is None:
+        return None
+    if value >= threshold or rate_per_hour <= 0:
+        return None
+    return (threshold - value) / rate_per_hour
+
+
+class SlotTotals:
+    """Fixed-interval totals (e.g. 5-minute rainfall) with prefix sums.
+
+    Slots are indexed arithmetically from ``base`` so the total since any cutoff is a
+    single prefix-sum difference (O(1)). Missing slots count as zero.
+    """
+
+    def __init__(self, slot_seconds: int, retention_slots: int) -> None:
+        self.slot_seconds = slot_seconds
+        self.retention_slots = retention_slots
+        self.base: int | None = None
+        self._values: list[float] = []
+        self._prefix: list[float] = [0.0]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def last_time(self) -> float | None:
+        if self.base is None or not self._values:
+            return None
+        return float((self.base + len(self._values) - 1) * self.slot_seconds)
+
+    @property
+    def first_time(self) -> float | None:
+        if self.base is None or not self._values:
+            return None
+        return float(self.base * self.slot_seconds)
+
+    def add(self, t: float, value: float) -> None:
+        slot = int(t // self.slot_seconds)
+        if self.base is None:
+            self.base = slot
+        idx = slot - self.base
+        if idx < 0:
+            return
+        if idx - len(self._values) >= self.retention_slots:
+            # Gap longer than the retention window: nothing stored is still relevant.
+            self.base, idx = slot, 0
+            self._values = []
+            self._prefix = [0.0]
+        if idx < len(self._values):
+            # Re-delivered slot (overlapping fetch): rebuild the prefix tail.
+            self._values[idx] = value
+            for i in range(idx, len(self._values)):
+                self._prefix[i + 1] = self._prefix[i] + self._values[i]
+            return
+        while len(self._values) < idx:
+            self._values.append(0.0)
+            self._prefix.append(self._prefix[-1])
+        self._values.append(value)
+        self._prefix.append(self._prefix[-1] + value)
+        # Trim in batches so eviction stays amortized O(1).
+        excess = len(self._values) - self.retention_slots
+        if excess > self.retention_slots // 4:
+            del self._values[:excess]
+            offset = self._prefix[excess]
+            self._prefix = [p - offset for p in self._prefix[excess:]]
+            self.base += excess
+
+    def total_since(self, cutoff: float) -> float:
+        """Sum of slots stamped at or after ``cutoff`` (epoch seconds)."""
+        if self.base is None:
+            return 0.0
+        idx = -(-int(cutoff) // self.slot_seconds) - self.base
+        idx = min(max(idx, 0), len(self._values))
+        return self._prefix[-1] - self._prefix[idx]
+
+    def to_dict(self) -> dict:
+        return {"base": self.base, "values": [round(v, 3) for v in self._values]}
+
+    @classmethod
+    def from_dict(cls, data, slot_seconds: int, retention_slots: int) -> "SlotTotals":
+        totals = cls(slot_seconds, retention_slots)
+        if not isinstance(data, dict) or data.get("base") is None:
+            return totals
+        try:
+            base = int(data["base"])
+            for idx, value in enumerate(data.get("values") or []):
+                totals.add(float((base + idx) * slot_seconds), float(value))
+        except (TypeError, ValueError):
+            return cls(slot_seconds, retention_slots)
+        return totals
@@ -1,56 +1,140 @@
 import datetime as dt
 import html
 import email.utils
+from io import BytesIO
+from typing import Callable, Iterator
 
-import feedparser
+from lxml import etree
 
-from src.scrape.base import clean_text, fetch_html
+from src.scrape.base import clean_text, fetch_bytes
 
 
 HST = dt.timezone(dt.timedelta(hours=-10))
 
+# RSS 0.9x/2.0 and RSS 1.0 use <item>, Atom uses <entry>; namespaces are ignored.
+_ENTRY_TAGS = frozenset({"item", "entry"})
+_SUMMARY_TAGS = ("summary", "description", "encoded", "content")
+_DATE_TAGS = ("pubDate", "published", "updated", "date")
 
-def _format_published(entry) -> str:
-    parsed = getattr(entry, "published_parsed", None) or getattr(entry, "updated_parsed", None)
-    if parsed:
-        dt_obj = dt.datetime(*parsed[:6], tzinfo=dt.timezone.utc).astimezone(HST)
-        return dt_obj.strftime("%Y-%m-%d %H:%M HST")
-    raw = clean_text(getattr(entry, "published", "") or getattr(entry, "updated", ""))
+
+def _format_published(raw: str) -> str:
+    raw = clean_text(raw)
     if not raw:
         return ""
     try:
         dt_obj = email.utils.parsedate_to_datetime(raw)
-        if dt_obj.tzinfo is None:
-            dt_obj = dt_obj.replace(tzinfo=dt.timezone.utc)
-        return dt_obj.astimezone(HST).strftime("%Y-%m-%d %H:%M HST")
-    except (TypeError, ValueError):
-        return raw
-
-
-def parse_rss(xml_text: str, limit: int = 5) -> list[dict]:
-    feed = feedparser.parse(xml_text)
+    except (TypeError, ValueError, IndexError):
+        try:
+            dt_obj = dt.datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        except ValueError:
+            return raw
+    if dt_obj.tzinfo is None:
+        dt_obj = dt_obj.replace(tzinfo=dt.timezone.utc)
+    return dt_obj.astimezone(HST).strftime("%Y-%m-%d %H:%M HST")
+
+
+def _localname(tag) -> str:
+    # Comments and processing instructions have non-string tags.
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _entry_link(entry) -> str:
+    fallback = ""
+    for child in entry:
+        if _localname(child.tag) != "link":
+            continue
+        href = child.get("href")
+        if href is None:
+            return (child.text or "").strip()
+        if child.get("rel", "alternate") == "alternate":
+            return href.strip()
+        fallback = fallback or href.strip()
+    return fallback
+
+
+def _entry_item(entry) -> dict:
+    fields: dict[str, str] = {}
+    for child in entry:
+        name = _localname(child.tag)
+        if name and name not in fields:
+            fields[name] = "".join(child.itertext())
+    summary = next((fields[name] for name in _SUMMARY_TAGS if fields.get(name)), "")
+    published = next((fields[name] for name in _DATE_TAGS if fields.get(name)), "")
+    return {
+        "title": clean_text(fields.get("title", "")) or "Untitled",
+        "url": _entry_link(entry),
+        "summary": clean_text(summary),
+        "published": _format_published(published),
+    }
+
+
+def iter_feed_items(data: bytes, errors: list[str] | None = None) -> Iterator[dict]:
+    """Yield RSS/Atom entries as their closing tags are parsed.
+
+    Only title, link, summary and date are extracted. Each entry is freed once
+    yielded, and a caller that stops iterating never parses the rest of the document.
+    Malformed markup is recovered from; the parser's messages for the part that was
+    read are appended to ``errors`` when given.
+    """
+    context = etree.iterparse(
+        BytesIO(data),
+        events=("end",),
+        recover=True,
+        resolve_entities=False,
+        no_network=True,
+    )
+    try:
+        for _, element in context:
+            if _localname(element.tag) not in _ENTRY_TAGS:
+                continue
+            item = _entry_item(element)
+            element.clear()
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+            yield item
+    finally:
+        if errors is not None:
+            errors.extend(f"line {entry.line}: {entry.message}" for entry in context.error_log)
+
+
+def parse_rss(
+    data: bytes | str,
+    limit: int = 5,
+    predicate: Callable[[dict], bool] | None = None,
+    scan: int | None = None,
+    errors: list[str] | None = None,
+) -> list[dict]:
+    """First ``limit`` feed items (matching ``predicate``, if given).
+
+    ``scan`` caps how many items are looked at, so a filter only considers the newest
+    entries; parser messages go to ``errors`` (see ``iter_feed_items``).
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
     items = []
-    for entry in feed.entries:
-        title = clean_text(getattr(entry, "title", "")) or "Untitled"
-        link = getattr(entry, "link", "") or ""
-        summary = clean_text(getattr(entry, "summary", "") or getattr(entry, "description", ""))
-        published = _format_published(entry)
-        items.append(
-            {
-                "title": title,
-                "url": link,
-                "summary": summary,
-                "published": published,
-            }
-        )
+    for index, item in enumerate(iter_feed_items(data, errors)):
+        if scan is not None and index >= scan:
+            break
+        if predicate is not None and not predicate(item):
+            continue
+        items.append(item)
         if len(items) >= limit:
             break
     return items
 
 
-def scrape_rss(url: str, limit: int = 5) -> list[dict]:
-    xml_text = fetch_html(url)
-    return parse_rss(xml_text, limit=limit)
+def scrape_rss(
+    url: str,
+    limit: int = 5,
+    predicate: Callable[[dict], bool] | None = None,
+    scan: int | None = None,
+    errors: list[str] | None = None,
+) -> list[dict]:
+    return parse_rss(
+        fetch_bytes(url), limit=limit, predicate=predicate, scan=scan, errors=errors
+    )
 
 
 def render_rss_html(items: list[dict]) -> str:
@@ -73,5 +157,3 @@ def render_rss_html(items: list[dict]) -> str:
             "</details>"
         )
     return "".join(blocks)
-
-
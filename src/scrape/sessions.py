@@ -0,0 +1,130 @@
+"""Per-provider session store: bearer tokens and cookie jars that outlive a run.
+
+Sessions live in ``data/cache/state/sessions`` next to the other scraper state (so
+CI restores them with it). Files are written owner-only (0600) in an owner-only
+directory since they hold credentials.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Callable, TypeVar
+
+import httpx
+
+from src.scrape import cache
+
+T = TypeVar("T")
+
+# Cookies without an expiry are kept this long before the warmup is repeated.
+SESSION_COOKIE_TTL = 12 * 3600
+REJECTED_STATUS_CODES = frozenset({401, 403})
+
+
+def _session_dir() -> Path:
+    return cache.STATE_DIR / "sessions"
+
+
+def load_session(provider: str) -> dict:
+    session = cache.load_state(provider, state_dir=_session_dir())
+    return session if isinstance(session, dict) else {}
+
+
+def save_session(provider: str, session: dict) -> None:
+    directory = _session_dir()
+    try:
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        directory.chmod(0o700)
+    except OSError as exc:
+        print(f"Session save failed for {provider}: {exc}")
+        return
+    cache.save_state(provider, session, state_dir=directory)
+
+
+def load_token(provider: str) -> tuple[str | None, float]:
+    """Stored ``(token, expires_at)``, or ``(None, 0.0)`` when missing or expired."""
+    token = load_session(provider).get("token") or {}
+    value, expires_at = token.get("value"), token.get("expires_at", 0.0)
+    if not value or expires_at <= time.time():
+        return None, 0.0
+    return value, expires_at
+
+
+def save_token(provider: str, token: str, expires_at: float) -> None:
+    session = load_session(provider)
+    session["token"] = {"value": token, "expires_at": expires_at}
+    save_session(provider, session)
+
+
+def restore_cookies(client: httpx.Client, provider: str) -> bool:
+    """Load unexpired stored cookies into ``client``; False when there were none."""
+    stored = load_session(provider).get("cookies") or {}
+    now = time.time()
+    if now - stored.get("saved_at", 0) > SESSION_COOKIE_TTL:
+        return False
+    restored = 0
+    for cookie in stored.get("jar", []):
+        expires = cookie.get("expires")
+        if expires is not None and expires <= now:
+            continue
+        client.cookies.set(
+            cookie["name"], cookie["value"], domain=cookie.get("domain", ""), path=cookie.get("path", "/")
+        )
+        restored += 1
+    return restored > 0
+
+
+def store_cookies(client: httpx.Client, provider: str) -> None:
+    jar = [
+        {
+            "name": cookie.name,
+            "value": cookie.value,
+            "domain": cookie.domain,
+            "path": cookie.path,
+            "expires": cookie.expires,
+        }
+        for cookie in client.cookies.jar
+    ]
+    session = load_session(provider)
+    session["cookies"] = {"saved_at": time.time(), "jar": jar}
+    save_session(provider, session)
+
+
+def discard_cookies(provider: str) -> None:
+    session = load_session(provider)
+    if session.pop("cookies", None) is not None:
+        save_session(provider, session)
+
+
+def _warm_up(client: httpx.Client, warmup_url: str) -> None:
+    try:
+        client.get(warmup_url)
+    except Exception as exc:
+        print(f"Warmup failed for {warmup_url}: {exc}")
+
+
+def with_session_cookies(
+    client: httpx.Client, provider: str, warmup_url: str, fetch: Callable[[], T]
+) -> T:
+    """Run ``fetch`` with the provider's stored cookies, warming up only when needed.
+
+    Without stored cookies the warmup page is requested first to collect them. If
+    restored cookies are rejected (``fetch`` raises a 401/403 ``HTTPStatusError``)
+    they are discarded, the warmup is repeated and ``fetch`` retried once. Cookies are
+    stored again after a successful fetch.
+    """
+    restored = restore_cookies(client, provider)
+    if not restored:
+        _warm_up(client, warmup_url)
+    try:
+        result = fetch()
+    except httpx.HTTPStatusError as exc:
+        if not restored or exc.response.status_code not in REJECTED_STATUS_CODES:
+            raise
+        discard_cookies(provider)
+        client.cookies.clear()
+        _warm_up(client, warmup_url)
+        result = fetch()
+    store_cookies(client, provider)
+    return result
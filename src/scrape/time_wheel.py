@@ -136,10 +136,7 @@ def scrape() -> dict:
 .time-wheel .tw-label--night { fill: #fff !important; }
 """
 
-    body = (
-        "<style>" + css + "</style>"
-        '<div class="time-wheel">' + svg_content + "</div>"
-    )
+    body = '<div class="time-wheel">' + svg_content + "</div>"
 
     return {
         "id": "time_wheel",
@@ -147,6 +144,7 @@ def scrape() -> dict:
         "retrieved_at": now_iso(),
         "source_urls": [],
         "html": body,
+        "css": css,
         "error": None,
         "stale": False,
     }
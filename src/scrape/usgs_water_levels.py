@@ -5,7 +5,10 @@ from urllib.parse import urlencode
 
 import httpx
 
+from src.render.tables import Cell, Column, build_table
 from src.scrape.base import fetch_json, now_iso
+from src.scrape.cache import load_state, save_state
+from src.scrape.rolling import RollingRate, time_to_threshold
 
 USGS_URL = "https://waterdata.usgs.gov/state/Hawaii/"
 USGS_API_KEY = os.getenv("USGS_API_KEY", "")
@@ -16,6 +19,9 @@ USGS_LOCATION_URL = (
     "https://api.waterdata.usgs.gov/ogcapi/v0/collections/monitoring-locations/items"
 )
 USGS_DAILY_URL = "https://api.waterdata.usgs.gov/ogcapi/v0/collections/daily/items"
+USGS_CONTINUOUS_URL = (
+    "https://api.waterdata.usgs.gov/ogcapi/v0/collections/continuous/items"
+)
 
 USGS_LOCATIONS = [
     "16103000",  # Hanalei River 
@@ -35,6 +41,29 @@ LEVEL_CODES = {"00065"}
 LEVEL_CONDITION_LOCATIONS = {"16104200", "16094150"}
 DAILY_MEAN_STAT = "00003"
 
+# Gage names are static; re-resolve them monthly so renamed sites eventually update.
+LOCATION_NAMES_STATE = "usgs_location_names"
+LOCATION_NAMES_TTL = 30 * 86400
+
+# Field projections: only the properties the section actually uses.
+LOCATION_PROPERTIES = ("monitoring_location_number", "monitoring_location_name")
+LATEST_PROPERTIES = (
+    "monitoring_location_id",
+    "parameter_code",
+    "statistic_id",
+    "time",
+    "value",
+    "unit_of_measure",
+    "approval_status",
+)
+DAILY_PROPERTIES = (
+    "monitoring_location_id",
+    "parameter_code",
+    "statistic_id",
+    "time",
+    "value",
+)
+
 PARAMETER_LABELS = {
     "00065": "Level",
     "00060": "Flow",
@@ -62,6 +91,29 @@ FLOOD_CLASSES = {
     "Major": "status-red",
 }
 
+# Rolling instantaneous-value store used for rate-of-rise warnings.
+IV_STATE = "usgs_iv_series"
+IV_PARAMETER_CODES = (FLOW_CODE, *sorted(LEVEL_CODES))
+IV_PROPERTIES = ("monitoring_location_id", "parameter_code", "time", "value")
+IV_RETENTION_HOURS = 6
+IV_RATE_WINDOW_HOURS = 1
+# Below these rates a series is reported as steady (level in ft/h, flow as a fraction of value/h).
+STEADY_LEVEL_RATE_FT = 0.05
+STEADY_FLOW_FRACTION = 0.02
+# Projected time to a flood threshold that escalates the trend cell.
+TREND_WARNING_HOURS = 3.0
+TREND_ALERT_HOURS = 1.0
+
+GAGE_COLUMNS = (
+    Column("location", "Location"),
+    Column("metric", "Metric"),
+    Column("value", "Value", align="right"),
+    Column("condition", "Condition"),
+    Column("flood", "Flood"),
+    Column("trend", "Trend"),
+    Column("time", "Time"),
+)
+
 
 def _format_time_hst(time_str: str | None) -> str:
     if not time_str:
@@ -165,67 +217,59 @@ def _fetch_json_retry(url: str, attempts: int = 4, base_delay: float = 1.5) -> d
     raise RuntimeError("unreachable")
 
 
-def _daily_series_url(
-    monitoring_location_id: str,
-    start: date,
-    end: date,
-    parameter_code: str | None,
-    offset: int = 0,
-    limit: int = 10000,
-    skip_geometry: bool = True,
-) -> str:
+def _cql_in(field: str, values) -> str:
+    quoted = ",".join(f"'{value}'" for value in values)
+    return f"{field} IN ({quoted})"
+
+
+def _usgs_id(location: str) -> str:
+    return f"USGS-{location}"
+
+
+def _location_from_id(monitoring_location_id: str | None) -> str:
+    return str(monitoring_location_id or "").removeprefix("USGS-")
+
+
+def _features_url(base: str, cql_filter: str, properties: tuple[str, ...], **params) -> str:
     query = {
         "f": "json",
         "lang": "en-US",
-        "limit": limit,
-        "skipGeometry": "true" if skip_geometry else "false",
-        "offset": offset,
-        "monitoring_location_id": f"USGS-{monitoring_location_id}",
-        "statistic_id": DAILY_MEAN_STAT,
-        "time": f"{start.isoformat()}/{end.isoformat()}",
+        "skipGeometry": "true",
+        "filter-lang": "cql2-text",
+        "filter": cql_filter,
+        "properties": ",".join(properties),
+        **params,
     }
-    if parameter_code:
-        query["parameter_code"] = parameter_code
-    return _build_url(USGS_DAILY_URL, _with_api_key(query))
+    return _build_url(base, _with_api_key(query))
 
 
-def _fetch_daily_mean_series(
-    monitoring_location_id: str,
-    start: date,
-    end: date,
-    parameter_code: str | None,
+def _fetch_features(
+    base: str,
+    cql_filter: str,
+    properties: tuple[str, ...],
+    source_urls: list[str] | None = None,
     page: int = 10000,
-) -> list[tuple[date, float]]:
-    """Fetch the full daily-mean series for a gage/parameter in as few requests as possible.
+    **params,
+) -> list[dict]:
+    """Fetch every matching feature's properties for a batched (multi-gage) query.
 
     Uses numberMatched for pagination so a server-capped page size does not cause an
-    early break. Most gages fit in a single request.
+    early break. Most queries fit in a single request.
     """
-    series: list[tuple[date, float]] = []
+    props_out: list[dict] = []
     offset = 0
     total: int | None = None
     while True:
-        url = _daily_series_url(
-            monitoring_location_id, start, end, parameter_code, offset=offset, limit=page
+        url = _features_url(
+            base, cql_filter, properties, limit=page, offset=offset, **params
         )
+        if source_urls is not None and offset == 0:
+            source_urls.append(url)
         payload = _fetch_json_retry(url)
         if total is None:
             total = payload.get("numberMatched")
         features = payload.get("features", [])
-        for feature in features:
-            props = feature.get("properties", {})
-            if parameter_code and props.get("parameter_code") != parameter_code:
-                continue
-            if props.get("statistic_id") != DAILY_MEAN_STAT:
-                continue
-            value = props.get("value")
-            if value is None:
-                continue
-            try:
-                day = date.fromisoformat(str(props.get("time"))[:10])
-                series.append((day, float(value)))
-            except (ValueError, TypeError):
-                continue
+        props_out.extend(feature.get("properties", {}) for feature in features)
         offset += len(features)
         if not features:
             break
@@ -233,6 +277,102 @@ def _fetch_daily_mean_series(
             break
         if total is None and len(features) < page:
             break
+    return props_out
+
+
+def _fetch_location_names(locations: list[str], source_urls: list[str]) -> dict[str, str]:
+    """Short gage names, cached long-term; only gages missing from the cache are requested."""
+    names: dict[str, str] = load_state(LOCATION_NAMES_STATE, max_age=LOCATION_NAMES_TTL) or {}
+    missing = [location for location in locations if location not in names]
+    if missing:
+        try:
+            features = _fetch_features(
+                USGS_LOCATION_URL,
+                _cql_in("monitoring_location_number", missing),
+                LOCATION_PROPERTIES,
+                source_urls,
+            )
+        except Exception as exc:  # noqa: BLE001 - names are cosmetic
+            print(f"USGS location names fetch failed: {exc}")
+            features = []
+        for props in features:
+            number = str(props.get("monitoring_location_number") or "")
+            name = props.get("monitoring_location_name") or number
+            if number:
+                names[number] = name.split(",")[0].strip()
+        if features:
+            save_state(LOCATION_NAMES_STATE, names)
+    return {location: names.get(location, location) for location in locations}
+
+
+def _fetch_latest_values(locations: list[str], source_urls: list[str]) -> dict[str, list[dict]]:
+    features = _fetch_features(
+        USGS_LATEST_URL,
+        _cql_in("monitoring_location_id", [_usgs_id(loc) for loc in locations]),
+        LATEST_PROPERTIES,
+        source_urls,
+        page=1000,
+    )
+    by_location: dict[str, list[dict]] = {}
+    for props in features:
+        location = _location_from_id(props.get("monitoring_location_id"))
+        by_location.setdefault(location, []).append(
+            {
+                "time": props.get("time"),
+                "value": props.get("value"),
+                "unit": props.get("unit_of_measure"),
+                "approval": props.get("approval_status"),
+                "parameter_code": props.get("parameter_code"),
+                "statistic_id": props.get("statistic_id"),
+            }
+        )
+    for values in by_location.values():
+        values.sort(key=lambda item: str(item.get("parameter_code") or ""))
+    return by_location
+
+
+def _fetch_daily_mean_series(
+    targets: dict[str, list[str]],
+    start: date,
+    end: date,
+    source_urls: list[str],
+) -> dict[tuple[str, str], list[tuple[date, float]]]:
+    """Daily-mean series for every (gage, parameter) pair in a single paginated query.
+
+    ``targets`` maps parameter code to the gages that need a baseline for it.
+    """
+    clauses = [
+        f"({_cql_in('monitoring_location_id', [_usgs_id(loc) for loc in locs])}"
+        f" AND parameter_code = '{parameter_code}')"
+        for parameter_code, locs in sorted(targets.items())
+        if locs
+    ]
+    if not clauses:
+        return {}
+    cql_filter = f"statistic_id = '{DAILY_MEAN_STAT}' AND ({' OR '.join(clauses)})"
+    features = _fetch_features(
+        USGS_DAILY_URL,
+        cql_filter,
+        DAILY_PROPERTIES,
+        source_urls,
+        time=f"{start.isoformat()}/{end.isoformat()}",
+    )
+    series: dict[tuple[str, str], list[tuple[date, float]]] = {}
+    for props in features:
+        if props.get("statistic_id") != DAILY_MEAN_STAT:
+            continue
+        value = props.get("value")
+        if value is None:
+            continue
+        key = (
+            _location_from_id(props.get("monitoring_location_id")),
+            str(props.get("parameter_code") or ""),
+        )
+        try:
+            day = date.fromisoformat(str(props.get("time"))[:10])
+            series.setdefault(key, []).append((day, float(value)))
+        except (ValueError, TypeError):
+            continue
     return series
 
 
@@ -251,91 +391,233 @@ def _doy_window_values(
     return values
 
 
-def _fetch_location_name(monitoring_location_number: str) -> str:
-    params = _with_api_key(
-        {
-        "f": "json",
-        "lang": "en-US",
-        "limit": 1,
-        "skipGeometry": "true",
-        "offset": 0,
-        "monitoring_location_number": monitoring_location_number,
-        }
+def _parse_value(raw) -> float | None:
+    try:
+        return float(raw) if raw is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _iv_key(location: str, parameter_code: str | None) -> str:
+    return f"{location}:{parameter_code}"
+
+
+def _load_iv_series() -> dict[str, RollingRate]:
+    stored = load_state(IV_STATE) or {}
+    return {
+        key: RollingRate.from_points(
+            points, IV_RATE_WINDOW_HOURS * 3600, IV_RETENTION_HOURS * 3600
+        )
+        for key, points in stored.items()
+        if isinstance(points, list)
+    }
+
+
+def _update_iv_series(
+    series: dict[str, RollingRate], locations: list[str], source_urls: list[str]
+) -> None:
+    """Append instantaneous values newer than what is already stored, for all gages at once.
+
+    The request starts at the oldest latest reading among the series that have data;
+    parameters a gage does not report are ignored. A gage with no stored series at
+    all (e.g. newly added) fetches the full retention window.
+    """
+    now = time.time()
+    floor = now - IV_RETENTION_HOURS * 3600
+    latest_by_location = {
+        loc: [
+            series[key].latest[0]
+            for key in (_iv_key(loc, code) for code in IV_PARAMETER_CODES)
+            if key in series and series[key].latest
+        ]
+        for loc in locations
+    }
+    since = floor
+    if latest_by_location and all(latest_by_location.values()):
+        since = max(floor, min(min(times) for times in latest_by_location.values()))
+    since_text = datetime.fromtimestamp(since, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    features = _fetch_features(
+        USGS_CONTINUOUS_URL,
+        f"{_cql_in('monitoring_location_id', [_usgs_id(loc) for loc in locations])}"
+        f" AND {_cql_in('parameter_code', IV_PARAMETER_CODES)}",
+        IV_PROPERTIES,
+        source_urls,
+        time=f"{since_text}/..",
     )
-    url = _build_url(USGS_LOCATION_URL, params)
-    payload = fetch_json(url)
-    features = payload.get("features", [])
-    if not features:
-        return monitoring_location_number
-    props = features[0].get("properties", {})
-    name = props.get("monitoring_location_name") or monitoring_location_number
-    short = name.split(",")[0].strip()
-    return short
-
-
-def _fetch_latest_values(monitoring_location_id: str) -> list[dict]:
-    params = _with_api_key(
-        {
-        "f": "json",
-        "monitoring_location_id": f"USGS-{monitoring_location_id}",
-        }
+    points: list[tuple[float, str, float]] = []
+    for props in features:
+        parsed = _parse_time(props.get("time"))
+        value = _parse_value(props.get("value"))
+        if parsed is None or value is None:
+            continue
+        key = _iv_key(
+            _location_from_id(props.get("monitoring_location_id")),
+            props.get("parameter_code"),
+        )
+        points.append((parsed.timestamp(), key, value))
+    points.sort()
+    for t, key, value in points:
+        if key not in series:
+            series[key] = RollingRate(IV_RATE_WINDOW_HOURS * 3600, IV_RETENTION_HOURS * 3600)
+        series[key].append(t, value)
+    # Drop series that have gone quiet past the retention window.
+    for key in [k for k, s in series.items() if not s.latest or s.latest[0] < floor]:
+        del series[key]
+    save_state(IV_STATE, {key: s.points() for key, s in series.items()})
+
+
+def _trend(
+    location: str, parameter_code: str | None, series: RollingRate | None
+) -> tuple[str, str]:
+    """Trend cell text and status class from the rolling rate of change.
+
+    A series whose last reading is older than the rate window has no current trend.
+    """
+    if series is None or series.latest is None:
+        return "—", ""
+    if series.latest[0] < time.time() - IV_RATE_WINDOW_HOURS * 3600:
+        return "—", ""
+    slope = series.slope()
+    if slope is None:
+        return "—", ""
+    rate = slope * 3600
+    value = series.latest[1]
+    if parameter_code in LEVEL_CODES:
+        steady = abs(rate) < STEADY_LEVEL_RATE_FT
+        rate_text = f"{rate:+.2f} ft/h"
+    else:
+        steady = abs(rate) < max(abs(value) * STEADY_FLOW_FRACTION, 1.0)
+        rate_text = f"{rate:+.0f}/h"
+    if steady:
+        return "Steady", "status-green"
+    arrow = "▲" if rate > 0 else "▼"
+    text = f"{arrow} {rate_text}"
+    css = ""
+    if parameter_code in LEVEL_CODES:
+        thresholds = FLOOD_THRESHOLDS_FT.get(location, {})
+        for label in ("minor", "major"):
+            hours = time_to_threshold(value, rate, thresholds.get(label))
+            if hours is None:
+                continue
+            minutes = int(hours * 60)
+            eta = f"{minutes}m" if minutes < 120 else f"{hours:.0f}h"
+            text = f"{text} · {label.capitalize()} in {eta}"
+            if hours <= TREND_ALERT_HOURS:
+                css = "status-red"
+            elif hours <= TREND_WARNING_HOURS:
+                css = "status-yellow"
+            break
+    return text, css
+
+
+def render(data: dict) -> dict:
+    """Section html/text/rows from ``{"gages": [...]}`` as built by ``scrape``."""
+    table_rows = []
+    for item in data["gages"]:
+        value = item.get("value")
+        unit = item.get("unit") or ""
+        value_text = f"{value} {unit}".strip() if value else "unknown"
+        indicator = item.get("indicator", "Unknown")
+        indicator_class = CONDITION_CLASSES.get(indicator, "")
+        indicator_text = "—" if indicator == "Unknown" else indicator
+        parameter_code = item.get("parameter_code")
+        metric = PARAMETER_LABELS.get(parameter_code, parameter_code or "metric")
+        flood_status = item.get("flood_status")
+        flood_class = FLOOD_CLASSES.get(flood_status, "")
+        flood_text = flood_status or "—"
+        table_rows.append(
+            (
+                item["name"],
+                metric,
+                Cell(value, value_text),
+                Cell(indicator, indicator_text, css=f"status-cell {indicator_class}".strip()),
+                Cell(flood_status, flood_text, css=f"status-cell {flood_class}".strip()),
+                Cell(item["trend"], css=f"status-cell {item['trend_class']}".strip()),
+                item["time"],
+            )
+        )
+    table = build_table(GAGE_COLUMNS, table_rows)
+
+    info_html = (
+        "<p class=\"info\">Condition compares the latest reading to USGS WaterWatch-style percentiles of daily mean values for this time of year (period of record): "
+        "Normal (25th–75th), Above normal (75th–90th), Much above normal (90th–98th), and High (≥98th percentile). "
+        "Streamflow is shown for all gages; river and reservoir level is shown only where the datum is representative. "
+        "Flood indicators for river level are based on USGS/NWS site-specific thresholds. "
+        "Trend is the rate of change over the last hour of instantaneous readings, with the projected time to the next flood threshold when rising.</p>"
     )
-    url = _build_url(USGS_LATEST_URL, params)
-    payload = fetch_json(url)
-    features = payload.get("features", [])
-    if not features:
-        return []
-    items = []
-    for feature in features:
-        props = feature.get("properties", {})
-        items.append(
-            {
-                "time": props.get("time"),
-                "value": props.get("value"),
-                "unit": props.get("unit_of_measure"),
-                "approval": props.get("approval_status"),
-                "parameter_code": props.get("parameter_code"),
-                "statistic_id": props.get("statistic_id"),
-            }
+    return {"html": info_html + table.html, "text": table.text, "rows": {"gages": table.rows}}
+
+
+def summarize(data: dict) -> list[tuple[str, str]]:
+    """Bulletin lines (status class, text) for gages in flood, running high or rising fast."""
+    lines = []
+    for item in data["gages"]:
+        flood_status = item.get("flood_status")
+        indicator = item.get("indicator", "Unknown")
+        classes = {
+            FLOOD_CLASSES.get(flood_status, ""),
+            CONDITION_CLASSES.get(indicator, ""),
+            item.get("trend_class", ""),
+        }
+        status_class = next(
+            (css for css in ("status-red", "status-yellow") if css in classes), None
         )
-    return items
+        if status_class is None:
+            continue
+        value = f"{item.get('value')} {item.get('unit') or ''}".strip()
+        state = f"{flood_status} flood" if flood_status else indicator
+        lines.append((status_class, f"Stream: {item['name']} {state}, {value}, {item['trend']}"))
+    return lines or [("status-green", "Streams: no flooding")]
 
 
 def scrape() -> dict:
     items = []
-    source_urls = []
+    source_urls: list[str] = []
+    names = _fetch_location_names(USGS_LOCATIONS, source_urls)
+    latest_by_location = _fetch_latest_values(USGS_LOCATIONS, source_urls)
+    iv_series = _load_iv_series()
+    try:
+        _update_iv_series(iv_series, USGS_LOCATIONS, source_urls)
+    except Exception as exc:  # noqa: BLE001 - trend is supplemental
+        print(f"USGS instantaneous values fetch failed: {exc}")
+
+    baseline_targets: dict[str, list[str]] = {}
+    latest_times: list[datetime] = []
     for location in USGS_LOCATIONS:
-        name = _fetch_location_name(location)
-        latest_values = _fetch_latest_values(location)
+        for latest in latest_by_location.get(location, []):
+            parameter_code = latest.get("parameter_code")
+            latest_time = _parse_time(latest.get("time"))
+            if latest_time and _should_classify(location, parameter_code):
+                baseline_targets.setdefault(parameter_code, []).append(location)
+                latest_times.append(latest_time)
+
+    series_by_key: dict[tuple[str, str], list[tuple[date, float]]] = {}
+    if latest_times:
+        series_start = (
+            min(latest_times) - timedelta(days=365 * BASELINE_YEARS + WINDOW_DAYS)
+        ).date()
+        series_end = max(latest_times).date()
+        series_by_key = _fetch_daily_mean_series(
+            baseline_targets, series_start, series_end, source_urls
+        )
 
-        for latest in latest_values:
+    for location in USGS_LOCATIONS:
+        name = names.get(location, location)
+        for latest in latest_by_location.get(location, []):
             parameter_code = latest.get("parameter_code")
             if _should_omit_row(location, parameter_code):
                 continue
 
             latest_time = _parse_time(latest.get("time"))
+            latest_value = _parse_value(latest.get("value"))
             baseline_samples = 0
             indicator = "Unknown"
 
-            try:
-                latest_value = (
-                    float(latest.get("value"))
-                    if latest.get("value") is not None
-                    else None
-                )
-            except (TypeError, ValueError):
-                latest_value = None
-
             if latest_time and _should_classify(location, parameter_code):
-                series_start = (
-                    latest_time - timedelta(days=365 * BASELINE_YEARS + WINDOW_DAYS)
-                ).date()
-                series_end = latest_time.date()
-                series = _fetch_daily_mean_series(
-                    location, series_start, series_end, parameter_code
-                )
                 baseline_values = _doy_window_values(
-                    series, latest_time.date(), WINDOW_DAYS
+                    series_by_key.get((location, parameter_code), []),
+                    latest_time.date(),
+                    WINDOW_DAYS,
                 )
                 baseline_samples = len(baseline_values)
 
@@ -352,6 +634,11 @@ def scrape() -> dict:
             flood_status = None
             if parameter_code in LEVEL_CODES:
                 flood_status = _flood_status(location, latest_value)
+            trend, trend_class = _trend(
+                location,
+                parameter_code,
+                iv_series.get(_iv_key(location, parameter_code)),
+            )
 
             items.append(
                 {
@@ -365,98 +652,19 @@ def scrape() -> dict:
                     "indicator": indicator,
                     "baseline_samples": baseline_samples,
                     "flood_status": flood_status,
+                    "trend": trend,
+                    "trend_class": trend_class,
                 }
             )
 
-        source_urls.append(
-            _build_url(
-                USGS_LOCATION_URL,
-                _with_api_key(
-                    {
-                        "f": "json",
-                        "lang": "en-US",
-                        "limit": 1,
-                        "skipGeometry": "false",
-                        "offset": 0,
-                        "monitoring_location_number": location,
-                    }
-                ),
-            )
-        )
-        source_urls.append(
-            _build_url(
-                USGS_LATEST_URL,
-                _with_api_key(
-                    {
-                        "f": "json",
-                        "monitoring_location_id": f"USGS-{location}",
-                    }
-                ),
-            )
-        )
-        for latest in latest_values:
-            parameter_code = latest.get("parameter_code")
-            if not _should_classify(location, parameter_code):
-                continue
-            latest_time = _parse_time(latest.get("time"))
-            if latest_time:
-                series_start = (
-                    latest_time - timedelta(days=365 * BASELINE_YEARS + WINDOW_DAYS)
-                ).date()
-                series_end = latest_time.date()
-                source_urls.append(
-                    _daily_series_url(
-                        location,
-                        series_start,
-                        series_end,
-                        parameter_code,
-                        skip_geometry=False,
-                    )
-                )
-
-    html_rows = []
-    for item in items:
-        value = item.get("value")
-        unit = item.get("unit") or ""
-        value_text = f"{value} {unit}".strip() if value else "unknown"
-        indicator = item.get("indicator", "Unknown")
-        indicator_class = CONDITION_CLASSES.get(indicator, "")
-        indicator_text = "—" if indicator == "Unknown" else indicator
-        parameter_code = item.get("parameter_code")
-        metric = PARAMETER_LABELS.get(parameter_code, parameter_code or "metric")
-        flood_status = item.get("flood_status")
-        flood_class = FLOOD_CLASSES.get(flood_status, "")
-        flood_text = flood_status or "—"
-        html_rows.append(
-            "<tr>"
-            f"<td>{item['name']}</td>"
-            f"<td>{metric}</td>"
-            f"<td style=\"text-align:right;\">{value_text}</td>"
-            f"<td class=\"status-cell {indicator_class}\">{indicator_text}</td>"
-            f"<td class=\"status-cell {flood_class}\">{flood_text}</td>"
-            f"<td>{item['time']}</td>"
-            "</tr>"
-        )
-
-    info_html = (
-        "<p class=\"info\">Condition compares the latest reading to USGS WaterWatch-style percentiles of daily mean values for this time of year (period of record): "
-        "Normal (25th–75th), Above normal (75th–90th), Much above normal (90th–98th), and High (≥98th percentile). "
-        "Streamflow is shown for all gages; river and reservoir level is shown only where the datum is representative. "
-        "Flood indicators for river level are based on USGS/NWS site-specific thresholds.</p>"
-    )
-    block_html = (
-        f"{info_html}"
-        "<table>"
-        "<thead><tr><th>Location</th><th>Metric</th><th>Value</th><th>Condition</th><th>Flood</th><th>Time</th></tr></thead>"
-        f"<tbody>{''.join(html_rows)}</tbody>"
-        "</table>"
-    )
+    data = {"gages": items}
     return {
         "id": "usgs_water_levels",
         "label": f"Rivers &amp; Reservoirs (<a href=\"{USGS_URL}\">USGS</a>)",
         "retrieved_at": now_iso(),
         "source_urls": source_urls,
-        "html": block_html,
+        **render(data),
+        "data": data,
         "error": None,
         "stale": False,
     }
@@ -1,12 +1,11 @@
 import base64
-import html
 import random
 import time
 
 import httpx
 
-from src.http_log import log_provider_failure
 from src.scrape.base import now_iso
+from src.scrape.outage_probe import TOWNS, Carrier, Status, TokenCache, probe_towns, render, summarize_towns
 
 # Example response:
 #
@@ -65,54 +64,6 @@ JOURNEY_ID = 44575938
 COUNTY = "Kauai"
 STATE = "HI"
 
-TOWNS = [
-    {
-        "town": "Princeville",
-        "address": "5-4280 Kuhio Hwy, Princeville, HI 96722, United States",
-        "city": "Princeville",
-        "zipcode": "96722",
-        "latitude": 22.21315,
-        "longitude": -159.47475,
-    },
-    {
-        "town": "Kilauea",
-        "address": "4260 Keneke St, Kilauea, HI 96754, United States",
-        "city": "Kilauea",
-        "zipcode": "96754",
-        "latitude": 22.2119526,
-        "longitude": -159.4061672,
-    },
-    {
-        "town": "Anahola",
-        "address": "4-4350 Kuhio Hwy, Anahola, HI 96703, United States",
-        "city": "Anahola",
-        "zipcode": "96703",
-        "latitude": 22.144722,
-        "longitude": -159.314957,
-    },
-    {
-        "town": "Kapaa",
-        "address": "4-1105 Kuhio Hwy, Kapaa, HI 96746, United States",
-        "city": "Kapaa",
-        "zipcode": "96746",
-        "latitude": 22.05138,
-        "longitude": -159.3338,
-    },
-    {
-        "town": "Lihue",
-        "address": "4280 Rice St, Lihue, HI 96766, United States",
-        "city": "Lihue",
-        "zipcode": "96766",
-        "latitude": 21.97285,
-        "longitude": -159.36477,
-    },
-]
-
-_TOKEN_CACHE: dict[str, str | float | None] = {
-    "token": None,
-    "expires_at": 0.0,
-}
-
 
 def _b64(value: str) -> str:
     return base64.b64encode(value.encode("utf-8")).decode("ascii")
@@ -148,7 +99,7 @@ def _payload_for_town(town: dict) -> dict:
     }
 
 
-def _fetch_token() -> tuple[str | None, float]:
+def _fetch_token(client: httpx.Client) -> tuple[str | None, float]:
     headers = {
         "Content-Type": "application/x-www-form-urlencoded",
         "Accept": "application/json, text/plain, */*",
@@ -162,10 +113,9 @@ def _fetch_token() -> tuple[str | None, float]:
         "client_secret": CLIENT_SECRET,
     }
     try:
-        with httpx.Client(timeout=20.0) as client:
-            response = client.post(TOKEN_URL, data=data, headers=headers)
-            response.raise_for_status()
-            payload = response.json()
+        response = client.post(TOKEN_URL, data=data, headers=headers)
+        response.raise_for_status()
+        payload = response.json()
     except Exception as exc:
         print(f"Verizon token fetch failed: {exc}")
         return None, 0.0
@@ -181,63 +131,15 @@ def _fetch_token() -> tuple[str | None, float]:
     return token, time.time() + ttl
 
 
-def _get_token(force_refresh: bool = False) -> str | None:
-    if not force_refresh:
-        token = _TOKEN_CACHE.get("token")
-        expires_at = _TOKEN_CACHE.get("expires_at") or 0.0
-        if token and expires_at > time.time():
-            return token
-
-    token, expires_at = _fetch_token()
-    if token:
-        _TOKEN_CACHE["token"] = token
-        _TOKEN_CACHE["expires_at"] = expires_at
-    return token
-
-
-def _request_outage(town: dict, token: str) -> httpx.Response:
+def _request(town: dict, token: str | None) -> dict:
     headers = {
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json",
     }
-    with httpx.Client(timeout=20.0) as client:
-        return client.post(VERIZON_URL, json=_payload_for_town(town), headers=headers)
+    return {"json": _payload_for_town(town), "headers": headers}
 
 
-def _fetch_outage(town: dict) -> tuple[str, str, str | None]:
-    token = _get_token()
-    if not token:
-        print("Verizon outage check failed: token fetch failed.")
-        return "Unknown", "", "Token fetch failed."
-
-    response = None
-    try:
-        response = _request_outage(town, token)
-        if response.status_code in {401, 403}:
-            token = _get_token(force_refresh=True)
-            if not token:
-                print("Verizon outage check failed: token refresh failed.")
-                return "Unknown", "", "Token refresh failed."
-            response = _request_outage(town, token)
-        response.raise_for_status()
-        payload = response.json()
-    except Exception as exc:
-        town_name = town.get("town", "unknown")
-        if response is not None:
-            log_provider_failure(
-                "Verizon outage check",
-                f"for {town_name}",
-                status_code=response.status_code,
-                response_body=response.text,
-            )
-        else:
-            log_provider_failure(
-                "Verizon outage check",
-                f"for {town_name}",
-                exc=exc,
-            )
-        return "Unknown", "", "Fetch failed."
-
+def _classify_outage(payload: dict) -> Status:
     outages = payload.get("outages", [])
     outage_type = None
     outage_header = None
@@ -255,40 +157,32 @@ def _fetch_outage(town: dict) -> tuple[str, str, str | None]:
     return "Unknown", "", None
 
 
-def scrape() -> dict:
-    rows = []
-    for town in TOWNS:
-        status, status_class, detail = _fetch_outage(town)
-        rows.append(
-            {
-                "town": town["town"],
-                "status": status,
-                "status_class": status_class,
-                "detail": detail or "",
-            }
-        )
+# Module-level so a long-lived process reuses the token; the session store keeps it across runs.
+TOKENS = TokenCache(_fetch_token, session="verizon")
 
-    table_rows = "".join(
-        "<tr>"
-        f"<td>{html.escape(row['town'])}</td>"
-        f"<td class=\"status-cell {row['status_class']}\">{html.escape(row['status'])}</td>"
-        f"<td>{html.escape(row['detail'])}</td>"
-        "</tr>"
-        for row in rows
-    )
-    body = (
-        "<table>"
-        "<thead><tr><th>Town</th><th>Status</th><th>Detail</th></tr></thead>"
-        f"<tbody>{table_rows}</tbody>"
-        "</table>"
-    )
+CARRIER = Carrier(
+    name="Verizon",
+    url=VERIZON_URL,
+    request=_request,
+    classify=_classify_outage,
+    tokens=TOKENS,
+)
+
+
+def summarize(data: dict) -> list[tuple[str, str]]:
+    return summarize_towns(CARRIER.name, data)
+
+
+def scrape() -> dict:
+    data = {"towns": probe_towns(CARRIER, TOWNS)}
 
     return {
         "id": "verizon_mobile",
         "label": f"Verizon Mobile (<a href=\"{VERIZON_CHECK_URL}\">Verizon</a>)",
         "retrieved_at": now_iso(),
         "source_urls": [VERIZON_URL, TOKEN_URL],
-        "html": body,
+        **render(data),
+        "data": data,
         "error": None,
         "stale": False,
     }
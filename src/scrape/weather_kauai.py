@@ -1,19 +1,30 @@
 import html
 from datetime import datetime, timedelta, timezone
 
-from src.scrape.base import clean_text, fetch_json, now_iso
-from src.hcdp.client import HCDP_BASE_URL, MesonetClient
-from src.hcdp.parse import pivot_latest_measurements
+from src.config import TOWN_COORDS
+from src.render.tables import compact_table
+from src.scrape.base import clean_text, fetch_json, gather, now_iso
+from src.scrape.cache import load_state, save_state
+from src.hcdp.client import HCDP_BASE_URL
+from src.hcdp.parse import pivot_latest_columns
+from src.hcdp.shared import HCDP_STATION_IDS, has_credentials, measurements, register
 
 POINTS_URL = "https://api.weather.gov/points/22.2,-159.42"
-ALERTS_URL = "https://api.weather.gov/alerts?active=true&point=22.21%2C-159.41&limit=500"
 MAP_URL = "https://forecast.weather.gov/MapClick.php?lat=22.2&lon=-159.42"
 PHLI_STATION_URL = "https://api.weather.gov/stations/PHLI"
 PHLI_LATEST_URL = "https://api.weather.gov/stations/PHLI/observations/latest"
+# The points -> gridpoint mapping and station metadata practically never change.
+NWS_METADATA_STATE = "nws_kauai_metadata"
+NWS_METADATA_TTL = 7 * 86400
+NWS_POINTS_URL = "https://api.weather.gov/points/{lat:.4f},{lon:.4f}"
+NWS_GRIDPOINTS_STATE = "nws_kauai_gridpoints"
+# Forecast URLs are per grid cell (gridpoints/{office}/{x},{y}), so towns in the
+# same cell share one forecast request.
+FORECAST_TOWNS = ("Hanalei", "Kilauea", "Kapaa", "Lihue", "Koloa", "Hanapepe", "Waimea")
+TOWN_FORECAST_PERIODS = 2
 
 HCDP_DOCS_URL = "https://hcdp.github.io/hcdp_api_docs/"
 HCDP_MAP_URL = "https://www.hawaii.edu/climate-data-portal/hawaii-mesonet-data/#/data-map"
-HCDP_STATION_IDS = ("0603", "0601", "0602", "0611", "0641", "0621")
 HCDP_WEATHER_VAR_IDS = (
     "Tair_1_Avg",
     "RH_1_Avg",
@@ -24,6 +35,10 @@ HCDP_WEATHER_VAR_IDS = (
     "WDrs_1_Avg",
     "WG_1_Max",
 )
+# Only the latest value per variable is shown; an hour covers slow-reporting sensors.
+HCDP_WEATHER_LOOKBACK = timedelta(hours=1)
+
+register(HCDP_WEATHER_VAR_IDS, HCDP_WEATHER_LOOKBACK)
 
 
 def _format_temp_f(value_c: float | None) -> str:
@@ -128,17 +143,83 @@ def _format_timestamp(value: str | None) -> str:
     return parsed.astimezone(hst).strftime("%Y-%m-%d %H:%M HST")
 
 
-def _fetch_station(station_url: str, obs_url: str) -> dict | None:
-    try:
-        station_payload = fetch_json(station_url)
-        obs_payload = fetch_json(obs_url)
-    except Exception:
-        return None
-    station_props = station_payload.get("properties", {})
+def _fetch_metadata() -> dict:
+    results = gather(
+        {
+            "points": lambda: fetch_json(POINTS_URL),
+            "station": lambda: fetch_json(PHLI_STATION_URL),
+        }
+    )
+    points = results["points"]
+    if isinstance(points, Exception):
+        raise points
+    points_props = points.get("properties", {})
+    forecast_url = points_props.get("forecast")
+    if not forecast_url:
+        raise RuntimeError("NWS points response missing forecast URL.")
+    location = points_props.get("relativeLocation", {}).get("properties", {})
+    metadata = {
+        "forecast_url": forecast_url,
+        "location_name": location.get("city", "Kilauea"),
+    }
+    station = results["station"]
+    if not isinstance(station, Exception):
+        station_props = station.get("properties", {})
+        metadata["station_name"] = station_props.get("name")
+        metadata["station_id"] = station_props.get("stationIdentifier")
+    return metadata
+
+
+def _load_metadata(refresh: bool = False) -> dict:
+    """Forecast URL, location and PHLI station details, cached for NWS_METADATA_TTL."""
+    cached = None if refresh else load_state(NWS_METADATA_STATE, max_age=NWS_METADATA_TTL)
+    if isinstance(cached, dict) and cached.get("forecast_url") and cached.get("station_id"):
+        return cached
+    metadata = _fetch_metadata()
+    if metadata.get("station_id"):
+        save_state(NWS_METADATA_STATE, metadata)
+    return metadata
+
+
+def _fetch_gridpoint(lat: float, lon: float) -> dict:
+    props = fetch_json(NWS_POINTS_URL.format(lat=lat, lon=lon)).get("properties", {})
+    forecast_url = props.get("forecast")
+    if not forecast_url:
+        raise RuntimeError("NWS points response missing forecast URL.")
+    return {
+        "coords": [lat, lon],
+        "forecast_url": forecast_url,
+    }
+
+
+def _resolve_gridpoints(towns: tuple[str, ...]) -> dict[str, dict]:
+    """Forecast grid cell per town; only towns missing from state (or moved) hit /points."""
+    cached = load_state(NWS_GRIDPOINTS_STATE, max_age=NWS_METADATA_TTL) or {}
+    resolved = {
+        town: entry
+        for town, entry in cached.items()
+        if town in TOWN_COORDS and entry.get("coords") == list(TOWN_COORDS[town])
+    }
+    missing = [town for town in towns if town in TOWN_COORDS and town not in resolved]
+    if missing:
+        fetched = gather(
+            {town: (lambda c=TOWN_COORDS[town]: _fetch_gridpoint(*c)) for town in missing}
+        )
+        updated = False
+        for town, entry in fetched.items():
+            if not isinstance(entry, Exception):
+                resolved[town] = entry
+                updated = True
+        if updated:
+            save_state(NWS_GRIDPOINTS_STATE, resolved)
+    return {town: resolved[town] for town in towns if town in resolved}
+
+
+def _format_station(metadata: dict, obs_payload: dict) -> dict:
     obs_props = obs_payload.get("properties", {})
-    station_name = station_props.get("name") or station_props.get("stationIdentifier") or "Station"
+    station_name = metadata.get("station_name") or metadata.get("station_id") or "Station"
     station_short = station_name.split(",", 1)[0].strip() if station_name else "Station"
-    station_id = station_props.get("stationIdentifier") or obs_props.get("stationId") or ""
+    station_id = metadata.get("station_id") or obs_props.get("stationId") or ""
     temp_c = obs_props.get("temperature", {}).get("value")
     pressure_pa = (
         obs_props.get("barometricPressure", {}).get("value")
@@ -162,21 +243,13 @@ def _fetch_station(station_url: str, obs_url: str) -> dict | None:
 
 
 def _fetch_hcdp_stations() -> list[dict]:
-    client = MesonetClient()
-    if not client.has_credentials:
+    if not has_credentials():
         return []
-    n_st = len(HCDP_STATION_IDS)
-    n_var = len(HCDP_WEATHER_VAR_IDS)
-    limit = max(n_st * n_var * 4, 120)
     try:
-        raw = client.get_measurements(
-            station_ids=HCDP_STATION_IDS,
-            var_ids=HCDP_WEATHER_VAR_IDS,
-            limit=limit,
-        )
+        columns = measurements(HCDP_WEATHER_VAR_IDS)
     except Exception:
         return []
-    pivoted = pivot_latest_measurements(raw)
+    pivoted = pivot_latest_columns(columns)
     by_id = {p["station_id"]: p for p in pivoted}
     rows = []
     for sid in HCDP_STATION_IDS:
@@ -212,12 +285,9 @@ def _fetch_hcdp_stations() -> list[dict]:
     return rows
 
 
-def _build_station_block() -> str:
-    stations = [
-        _fetch_station(PHLI_STATION_URL, PHLI_LATEST_URL),
-    ]
-    stations = [station for station in stations if station]
-    stations.extend(_fetch_hcdp_stations())
+def _build_station_block(phli_station: dict | None, hcdp_stations: list[dict]) -> str:
+    stations = [phli_station] if phli_station else []
+    stations.extend(hcdp_stations)
     if not stations:
         return "<p>Station observations unavailable.</p>"
     rows = "".join(
@@ -237,39 +307,20 @@ def _build_station_block() -> str:
         "<h3>Stations</h3>"
         "<p class=\"info\">NWS: Līhuʻe (PHLI). Mesonet: Hawaiʻi Climate Data Portal stations "
         "(5-minute averages where available).</p>"
-        "<table>"
-        "<thead><tr>"
-        "<th></th>"
-        "<th>Temp [F]</th>"
-        "<th>Humidity</th>"
-        "<th>Pressure [inHg]</th>"
-        "<th>Wind [mph]</th>"
-        "<th>Wind Dir</th>"
-        "<th>Wind Gust [mph]</th>"
-        "<th></th>"
-        "</tr></thead>"
-        f"<tbody>{rows}</tbody>"
-        "</table>"
-    )
-
-def _extract_hazards_from_api(payload: dict) -> list[dict]:
-    hazards = []
-    for feature in payload.get("features", []):
-        props = feature.get("properties", {})
-        headline = props.get("headline") or props.get("event")
-        description = props.get("description") or ""
-        instruction = props.get("instruction") or ""
-        if not headline:
-            continue
-        hazards.append(
-            {
-                "headline": headline,
-                "description": description,
-                "instruction": instruction,
-            }
+        + compact_table(
+            "<thead><tr>"
+            "<th></th>"
+            "<th>Temp [F]</th>"
+            "<th>Humidity</th>"
+            "<th>Pressure [inHg]</th>"
+            "<th>Wind [mph]</th>"
+            "<th>Wind Dir</th>"
+            "<th>Wind Gust [mph]</th>"
+            "<th></th>"
+            "</tr></thead>"
+            f"<tbody>{rows}</tbody>"
         )
-    return hazards
-
+    )
 
 def _format_precip(value) -> str:
     if value is None:
@@ -299,16 +350,85 @@ def _format_forecast_cell(period: dict) -> str:
     return "".join(parts)
 
 
+def _format_town_cell(period: dict | None) -> str:
+    if not period:
+        return "N/A"
+    temp = period.get("temperature")
+    temp_text = f"{temp} {period.get('temperatureUnit', '')}".strip() if temp is not None else "N/A"
+    pop_text = _format_precip(period.get("probabilityOfPrecipitation", {}).get("value"))
+    short_fcst = clean_text(period.get("shortForecast", "")) or "N/A"
+    return (
+        f"<strong>{html.escape(temp_text)}</strong> · {html.escape(pop_text)}"
+        f"<br>{html.escape(short_fcst)}"
+    )
+
+
+def _build_town_forecasts(gridpoints: dict[str, dict], forecasts: dict[str, object]) -> str:
+    """Town rows under period columns matched on ``startTime``.
+
+    Towns in different grid cells can be on different forecast issuances, so a
+    town's period only lands under the column with its own start time.
+    """
+    periods_by_town = {}
+    for town, entry in gridpoints.items():
+        payload = forecasts.get(entry["forecast_url"])
+        if isinstance(payload, dict):
+            periods = payload.get("properties", {}).get("periods", [])
+            periods_by_town[town] = {
+                period["startTime"]: period for period in periods if period.get("startTime")
+            }
+    if not periods_by_town:
+        return ""
+    labels = {}
+    for periods in periods_by_town.values():
+        for start in sorted(periods, key=datetime.fromisoformat)[:TOWN_FORECAST_PERIODS]:
+            labels.setdefault(start, clean_text(periods[start].get("name", "")))
+    columns = sorted(labels, key=datetime.fromisoformat)[:TOWN_FORECAST_PERIODS]
+    if not columns:
+        return "<h3>Forecast by town</h3><p>Town forecasts unavailable.</p>"
+    head_cells = "".join(f"<th>{html.escape(labels[start])}</th>" for start in columns)
+    rows = "".join(
+        "<tr>"
+        f"<th>{html.escape(town)}</th>"
+        + "".join(f"<td>{_format_town_cell(periods.get(start))}</td>" for start in columns)
+        + "</tr>"
+        for town, periods in periods_by_town.items()
+    )
+    return (
+        "<h3>Forecast by town</h3>"
+        + compact_table(
+            f"<thead><tr><th></th>{head_cells}</tr></thead>"
+            f"<tbody>{rows}</tbody>"
+        )
+    )
+
+
 def scrape() -> dict:
-    points_payload = fetch_json(POINTS_URL)
-    points_props = points_payload.get("properties", {})
-    forecast_url = points_props.get("forecast")
-    location = points_props.get("relativeLocation", {}).get("properties", {})
-    location_name = location.get("city", "Kilauea")
-    if not forecast_url:
-        raise RuntimeError("NWS points response missing forecast URL.")
+    metadata = _load_metadata()
+    gridpoints = _resolve_gridpoints(FORECAST_TOWNS)
+    forecast_urls = list(
+        dict.fromkeys(
+            [metadata["forecast_url"], *(entry["forecast_url"] for entry in gridpoints.values())]
+        )
+    )
+    # Forecasts (one per distinct grid cell) and observations are independent.
+    results = gather(
+        {
+            **{url: (lambda u=url: fetch_json(u)) for url in forecast_urls},
+            "latest": lambda: fetch_json(PHLI_LATEST_URL),
+            "hcdp": _fetch_hcdp_stations,
+        }
+    )
+    forecasts = {url: results[url] for url in forecast_urls}
+    forecast_payload = forecasts[metadata["forecast_url"]]
+    if isinstance(forecast_payload, Exception):
+        # A cached gridpoint may have moved; resolve it again before giving up.
+        metadata = _load_metadata(refresh=True)
+        forecast_payload = fetch_json(metadata["forecast_url"])
+        forecasts[metadata["forecast_url"]] = forecast_payload
+    forecast_url = metadata["forecast_url"]
+    location_name = metadata.get("location_name") or "Kilauea"
 
-    forecast_payload = fetch_json(forecast_url)
     periods = forecast_payload.get("properties", {}).get("periods", [])
     day_periods = [p for p in periods if p.get("isDaytime")]
     rows = []
@@ -337,45 +457,20 @@ def scrape() -> dict:
         for day_name, day_period, night_period in rows
     )
 
-    try:
-        alerts_payload = fetch_json(ALERTS_URL)
-    except Exception:
-        alerts_payload = {}
-    hazards = _extract_hazards_from_api(alerts_payload)
-    hazard_items = []
-    for hazard in hazards:
-        description = hazard.get("description", "")
-        instruction = hazard.get("instruction", "")
-        summary_parts = [description, instruction]
-        summary = "\n\n".join([part for part in summary_parts if part])
-        summary_html = html.escape(summary).replace("\n", "<br>")
-        headline_html = html.escape(hazard["headline"])
-        if summary:
-            hazard_items.append(
-                "<details>"
-                f"<summary>{headline_html}</summary>"
-                f"<div>{summary_html}</div>"
-                "</details>"
-            )
-        else:
-            hazard_items.append(headline_html)
-
-    hazard_html = (
-        "".join(hazard_items)
-        if hazard_items
-        else "<p>No active hazards.</p>"
-    )
-
-    station_html = _build_station_block()
+    latest = results["latest"]
+    phli_station = None if isinstance(latest, Exception) else _format_station(metadata, latest)
+    hcdp_stations = results["hcdp"]
+    if isinstance(hcdp_stations, Exception):
+        hcdp_stations = []
+    station_html = _build_station_block(phli_station, hcdp_stations)
     block_html = (
         f"<h3>Forecast ({html.escape(location_name)})</h3>"
-        "<table>"
-        "<thead><tr><th></th><th>Day</th><th>Night</th></tr></thead>"
-        f"<tbody>{table_rows}</tbody>"
-        "</table>"
+        + compact_table(
+            "<thead><tr><th></th><th>Day</th><th>Night</th></tr></thead>"
+            f"<tbody>{table_rows}</tbody>"
+        )
+        + f"{_build_town_forecasts(gridpoints, forecasts)}"
         f"{station_html}"
-        "<h3>Hazards</h3>"
-        f"{hazard_html}"
     )
 
     return {
@@ -384,8 +479,7 @@ def scrape() -> dict:
         "retrieved_at": now_iso(),
         "source_urls": [
             POINTS_URL,
-            forecast_url,
-            ALERTS_URL,
+            *forecasts,
             PHLI_STATION_URL,
             PHLI_LATEST_URL,
             HCDP_BASE_URL + "/mesonet/db/measurements",
@@ -0,0 +1,358 @@
+"""Serve the generated site with ETags, compressed bodies and live section updates.
+
+For hosts that serve ``site/`` themselves during an incident. Every file is sent
+with a strong ETag, so a reload of an unchanged page costs a 304, and with a gzip
+(or, when the ``brotli`` package is installed, brotli) body compressed once per
+file version; ``.gz``/``.br``/``.zst`` siblings written by the generator are sent
+as they are instead. ``/events`` is a Server-Sent Events stream: when index.html is
+rewritten (by ``src.generate --daemon`` or any other run), open pages receive only
+the ``<section>`` elements that changed and patch them in place.
+
+    python3 -m src.serve --site-dir site --port 8000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import mimetypes
+import re
+from dataclasses import dataclass
+from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from src.render.compress import COMPRESSED_SUFFIXES, sibling_path
+
+try:
+    import brotli
+except ImportError:  # optional; gzip is always available
+    brotli = None
+
+EVENTS_PATH = "/events"
+INDEX_NAME = "index.html"
+WATCH_INTERVAL_SECONDS = 1.0
+HEARTBEAT_SECONDS = 15.0
+KEEPALIVE_SECONDS = 30.0
+# Files here are named by content hash (see src.render.html.stylesheet_name).
+IMMUTABLE_PREFIX = "/assets/"
+# Bodies smaller than this are not worth a compression header.
+MIN_COMPRESS_BYTES = 512
+_COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "image/svg+xml")
+# Preference order when the client accepts several encodings equally.
+_ENCODING_PREFERENCE = ("br", "zstd", "gzip", "identity")
+CLIENT_QUEUE_SIZE = 32
+
+_SECTION_RE = re.compile(r'<section\b[^>]*\bid="([^"]+)"[^>]*>.*?</section>', re.DOTALL)
+_HEADER_RE = re.compile(r"<header>.*?</header>", re.DOTALL)
+
+
+@dataclass(frozen=True)
+class Asset:
+    etag: str
+    content_type: str
+    bodies: dict[str, bytes]
+
+    def tag(self, encoding: str) -> str:
+        """Strong ETag of one representation (each encoding is a distinct body)."""
+        return self.etag if encoding == "identity" else f'{self.etag[:-1]}-{encoding}"'
+
+
+def build_asset(path: Path, data: bytes, precompressed: dict[str, bytes] | None = None) -> Asset:
+    content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    if content_type.startswith("text/") or content_type.endswith("javascript"):
+        content_type = f"{content_type}; charset=utf-8"
+    bodies = {"identity": data, **(precompressed or {})}
+    if len(data) >= MIN_COMPRESS_BYTES and content_type.startswith(_COMPRESSIBLE_TYPES):
+        if "gzip" not in bodies:
+            bodies["gzip"] = gzip.compress(data, compresslevel=9, mtime=0)
+        if brotli is not None and "br" not in bodies:
+            bodies["br"] = brotli.compress(data)
+    etag = f'"{hashlib.sha256(data).hexdigest()[:32]}"'
+    return Asset(etag=etag, content_type=content_type, bodies=bodies)
+
+
+def _sibling_mtimes(path: Path) -> tuple[int | None, ...]:
+    mtimes = []
+    for suffix in COMPRESSED_SUFFIXES:
+        try:
+            mtimes.append(sibling_path(path, suffix).stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+def read_precompressed(path: Path, mtime_ns: int) -> dict[str, bytes]:
+    """Compressed siblings of ``path`` by encoding, skipping any older than ``path``."""
+    bodies = {}
+    for suffix, (encoding, _compress) in COMPRESSED_SUFFIXES.items():
+        sibling = sibling_path(path, suffix)
+        try:
+            if sibling.stat().st_mtime_ns >= mtime_ns:
+                bodies[encoding] = sibling.read_bytes()
+        except OSError:
+            continue
+    return bodies
+
+
+class SiteCache:
+    """Assets under ``root``, rebuilt only when a file (or a compressed sibling) changes."""
+
+    def __init__(self, root: Path):
+        self.root = root.resolve()
+        self._assets: dict[Path, tuple[tuple[int, int, tuple[int | None, ...]], Asset]] = {}
+
+    def resolve(self, url_path: str) -> Path | None:
+        relative = unquote(url_path).lstrip("/")
+        path = (self.root / relative).resolve()
+        if path != self.root and self.root not in path.parents:
+            return None
+        if path.is_dir():
+            path = path / INDEX_NAME
+        return path if path.is_file() else None
+
+    def get(self, url_path: str) -> Asset | None:
+        path = self.resolve(url_path)
+        if path is None:
+            return None
+        try:
+            stat = path.stat()
+            version = (stat.st_mtime_ns, stat.st_size, _sibling_mtimes(path))
+            cached = self._assets.get(path)
+            if cached and cached[0] == version:
+                return cached[1]
+            asset = build_asset(
+                path, path.read_bytes(), read_precompressed(path, stat.st_mtime_ns)
+            )
+        except OSError:
+            return None
+        self._assets[path] = (version, asset)
+        return asset
+
+
+def choose_encoding(accept_encoding: str, available) -> str:
+    """Best available encoding for an ``Accept-Encoding`` header (q-values honored)."""
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+    candidates = [
+        encoding
+        for encoding in _ENCODING_PREFERENCE
+        if encoding in available and weights.get(encoding, weights.get("*", 0.0)) > 0
+    ]
+    if not candidates:
+        return "identity"
+    return max(candidates, key=lambda encoding: weights.get(encoding, weights.get("*", 0.0)))
+
+
+def split_sections(page: str) -> tuple[dict[str, str], str]:
+    """Section markup by id, and the rest of the page with sections and the header elided."""
+    sections = {match.group(1): match.group(0) for match in _SECTION_RE.finditer(page)}
+    skeleton = _SECTION_RE.sub(lambda match: f"<section {match.group(1)}>", page)
+    return sections, _HEADER_RE.sub("", skeleton)
+
+
+def page_events(old: str | None, new: str) -> list[tuple[str, dict]]:
+    """SSE events that bring a page showing ``old`` up to ``new``.
+
+    One ``section`` event per changed section; ``reload`` when anything outside the
+    sections changed (banner, section order) other than the header's timestamp.
+    """
+    if old is None:
+        return []
+    old_sections, old_skeleton = split_sections(old)
+    new_sections, new_skeleton = split_sections(new)
+    if old_skeleton != new_skeleton:
+        return [("reload", {})]
+    return [
+        ("section", {"id": section_id, "html": markup})
+        for section_id, markup in new_sections.items()
+        if old_sections.get(section_id) != markup
+    ]
+
+
+def format_event(event: str, data: dict) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode("utf-8")
+
+
+def _response_head(status: int, headers: dict[str, str]) -> bytes:
+    lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}"]
+    lines.extend(f"{name}: {value}" for name, value in headers.items())
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+def _parse_request(head: bytes) -> tuple[str, str, dict[str, str]] | None:
+    try:
+        lines = head.decode("latin-1").split("\r\n")
+        method, target, _version = lines[0].split(" ", 2)
+    except ValueError:
+        return None
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return method.upper(), target, headers
+
+
+class DashboardServer:
+    def __init__(self, site_dir: Path, watch_interval: float = WATCH_INTERVAL_SECONDS):
+        self.site = SiteCache(site_dir)
+        self.index_path = self.site.root / INDEX_NAME
+        self.watch_interval = watch_interval
+        self._clients: set[asyncio.Queue] = set()
+        self._page: str | None = None
+        self._page_version: tuple[int, int] | None = None
+
+    def publish(self, event: str, data: dict) -> None:
+        message = format_event(event, data)
+        for queue in self._clients:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # A client this far behind is better off reloading.
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(format_event("reload", {}))
+
+    def check_page(self) -> None:
+        """Publish events if index.html changed since the last check."""
+        try:
+            stat = self.index_path.stat()
+            version = (stat.st_mtime_ns, stat.st_size)
+            if version == self._page_version:
+                return
+            page = self.index_path.read_text(encoding="utf-8")
+        except OSError:
+            return
+        for event, data in page_events(self._page, page):
+            self.publish(event, data)
+        self._page, self._page_version = page, version
+
+    async def watch(self) -> None:
+        while True:
+            self.check_page()
+            await asyncio.sleep(self.watch_interval)
+
+    async def _stream_events(self, writer: asyncio.StreamWriter) -> None:
+        writer.write(
+            _response_head(
+                200,
+                {
+                    "Content-Type": "text/event-stream",
+                    "Cache-Control": "no-cache",
+                    "Connection": "keep-alive",
+                    "X-Accel-Buffering": "no",
+                },
+            )
+        )
+        writer.write(b"retry: 5000\n\n")
+        await writer.drain()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self._clients.add(queue)
+        try:
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    message = b": ping\n\n"
+                writer.write(message)
+                await writer.drain()
+        finally:
+            self._clients.discard(queue)
+
+    def _file_response(self, method: str, path: str, headers: dict[str, str]) -> bytes:
+        asset = self.site.get(path)
+        if asset is None:
+            body = b"Not found\n"
+            return _response_head(
+                404, {"Content-Type": "text/plain", "Content-Length": str(len(body))}
+            ) + (body if method == "GET" else b"")
+        encoding = choose_encoding(headers.get("accept-encoding", ""), asset.bodies)
+        tag = asset.tag(encoding)
+        response_headers = {
+            "Content-Type": asset.content_type,
+            "ETag": tag,
+            "Cache-Control": (
+                "public, max-age=31536000, immutable"
+                if path.startswith(IMMUTABLE_PREFIX)
+                else "no-cache"
+            ),
+            "Vary": "Accept-Encoding",
+        }
+        if encoding != "identity":
+            response_headers["Content-Encoding"] = encoding
+        if_none_match = headers.get("if-none-match", "")
+        if if_none_match.strip() == "*" or tag in [t.strip() for t in if_none_match.split(",")]:
+            return _response_head(304, response_headers)
+        body = asset.bodies[encoding]
+        response_headers["Content-Length"] = str(len(body))
+        return _response_head(200, response_headers) + (body if method == "GET" else b"")
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEPALIVE_SECONDS)
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError):
+                    break
+                request = _parse_request(head)
+                if request is None:
+                    writer.write(_response_head(400, {"Content-Length": "0", "Connection": "close"}))
+                    break
+                method, target, headers = request
+                path = urlsplit(target).path
+                if method not in {"GET", "HEAD"}:
+                    writer.write(
+                        _response_head(405, {"Allow": "GET, HEAD", "Content-Length": "0"})
+                    )
+                elif path == EVENTS_PATH:
+                    await self._stream_events(writer)
+                    break
+                else:
+                    writer.write(self._file_response(method, path, headers))
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str, port: int) -> None:
+        self.check_page()
+        server = await asyncio.start_server(self.handle, host, port)
+        addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+        print(f"Serving {self.site.root} on {addresses}")
+        async with server:
+            await asyncio.gather(server.serve_forever(), self.watch())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the generated dashboard with live updates.")
+    parser.add_argument("--site-dir", default="site", help="Directory of generated pages")
+    parser.add_argument("--host", default="0.0.0.0", help="Address to listen on")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    args = parser.parse_args()
+    try:
+        asyncio.run(DashboardServer(Path(args.site_dir)).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
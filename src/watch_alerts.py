@@ -0,0 +1,110 @@
+"""Watch active NWS alerts and re-render the dashboard as soon as they change.
+
+The scheduled build only picks alerts up once an hour; this watcher closes that gap
+for flash flood and tsunami warnings. Polls are conditional (ETag /
+If-Modified-Since), so an unchanged alert set costs a 304. When an alert is added,
+updated or expires, index.html is rebuilt from cached sections plus a fresh hazards
+section -- no other scraper runs.
+
+    python3 -m src.watch_alerts --island kauai
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import httpx
+from dotenv import load_dotenv
+
+from src.generate import regenerate_island
+from src.scrape.base import DEFAULT_HEADERS, now_iso
+from src.scrape.cache import load_state, save_state
+from src.scrape.nws_alerts import ALERTS_URL, alert_versions, build_result
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+WATCH_STATE = "nws_alerts_watch"
+DEFAULT_INTERVAL_SECONDS = 60.0
+REQUEST_TIMEOUT = 15.0
+
+
+def poll(client: httpx.Client, state: dict) -> tuple[dict | None, dict]:
+    """Fetch alerts conditionally.
+
+    Returns the payload (None when the server answers 304) and the response's validators.
+    """
+    headers = {"Accept": "application/geo+json"}
+    if state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state.get("last_modified"):
+        headers["If-Modified-Since"] = state["last_modified"]
+    response = client.get(ALERTS_URL, headers=headers)
+    if response.status_code == 304:
+        return None, {}
+    response.raise_for_status()
+    validators = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+    return response.json(), validators
+
+
+def check_once(
+    client: httpx.Client, state: dict, island_key: str, output_dir: Path, cache_dir: Path
+) -> bool:
+    """Poll once and regenerate the page if any alert is new, updated or gone.
+
+    ``state`` only advances after a successful regenerate, so a failed write is retried
+    on the next poll instead of being masked by a 304.
+    """
+    payload, validators = poll(client, state)
+    if payload is None:
+        return False
+    versions = alert_versions(payload)
+    changed = versions != state.get("alerts")
+    if changed:
+        regenerate_island(
+            island_key, output_dir, cache_dir, {"nws_alerts": build_result(payload)}
+        )
+    state.update(validators, alerts=versions)
+    return changed
+
+
+def main() -> None:
+    load_dotenv(_REPO_ROOT / ".env")
+    parser = argparse.ArgumentParser(description="Re-render the dashboard when NWS alerts change.")
+    parser.add_argument("--island", default="kauai", help="Island key to regenerate")
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_INTERVAL_SECONDS,
+        help="Seconds between polls",
+    )
+    parser.add_argument("--once", action="store_true", help="Poll a single time and exit")
+    parser.add_argument(
+        "--output-dir", default="site", help="Output directory for generated pages"
+    )
+    parser.add_argument(
+        "--cache-dir", default="data/cache", help="Cache directory for provider data"
+    )
+    args = parser.parse_args()
+
+    output_dir = Path(args.output_dir)
+    cache_dir = Path(args.cache_dir)
+    state = load_state(WATCH_STATE) or {}
+    with httpx.Client(
+        follow_redirects=True, timeout=REQUEST_TIMEOUT, headers=DEFAULT_HEADERS
+    ) as client:
+        while True:
+            try:
+                if check_once(client, state, args.island, output_dir, cache_dir):
+                    print(f"{now_iso()} alerts changed; regenerated {output_dir / 'index.html'}")
+                save_state(WATCH_STATE, state)
+            except (httpx.HTTPError, ValueError, OSError) as exc:
+                print(f"{now_iso()} alert poll failed: {exc}")
+            if args.once:
+                break
+            time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Poll KIUC outages every minute and keep per-area outage timing current.
+
+The hourly build only sees a point-in-time count. This poller folds every new
+summary into the per-ZIP series (see ``src.scrape.kiuc.update_series``) so outage
+start, restore and trend are tracked during storms, and rebuilds index.html from
+cached sections plus a fresh power section. Requests are conditional, and a summary
+whose ``lastUpdate`` has not changed is dropped before anything is written.
+
+    python3 -m src.watch_kiuc --island kauai
+"""
+
+import argparse
+import copy
+import time
+from pathlib import Path
+
+import httpx
+from dotenv import load_dotenv
+
+from src.generate import regenerate_island
+from src.scrape.base import DEFAULT_HEADERS, now_iso
+from src.scrape.cache import load_state, save_state
+from src.scrape.kiuc import KIUC_SERIES_STATE, KIUC_SUMMARY_URL, build_result, update_series
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_INTERVAL_SECONDS = 60.0
+REQUEST_TIMEOUT = 15.0
+
+
+def poll(client: httpx.Client, state: dict) -> tuple[dict | None, dict]:
+    """Fetch the summary conditionally.
+
+    Returns the summary (None when the server answers 304) and the response's validators.
+    """
+    headers = {"Accept": "application/json"}
+    if state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state.get("last_modified"):
+        headers["If-Modified-Since"] = state["last_modified"]
+    response = client.get(KIUC_SUMMARY_URL, headers=headers)
+    if response.status_code == 304:
+        return None, {}
+    response.raise_for_status()
+    validators = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+    return response.json(), validators
+
+
+def check_once(
+    client: httpx.Client, state: dict, island_key: str, output_dir: Path, cache_dir: Path
+) -> bool:
+    """Poll once; on a new ``lastUpdate`` record it and regenerate the page.
+
+    ``state`` (the shared series state) only advances after a successful regenerate,
+    so a failed write is retried on the next poll. A summary with an unchanged
+    ``lastUpdate`` still stores the response's validators, so the next poll can get a 304.
+    """
+    summary, validators = poll(client, state)
+    if summary is None:
+        return False
+    updated = copy.deepcopy(state)
+    if not update_series(updated, summary):
+        state.update(validators)
+        return False
+    regenerate_island(island_key, output_dir, cache_dir, {"kiuc": build_result(summary, updated)})
+    updated.update(validators)
+    state.clear()
+    state.update(updated)
+    return True
+
+
+def main() -> None:
+    load_dotenv(_REPO_ROOT / ".env")
+    parser = argparse.ArgumentParser(description="Track KIUC outages and re-render the dashboard.")
+    parser.add_argument("--island", default="kauai", help="Island key to regenerate")
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_INTERVAL_SECONDS,
+        help="Seconds between polls",
+    )
+    parser.add_argument("--once", action="store_true", help="Poll a single time and exit")
+    parser.add_argument(
+        "--output-dir", default="site", help="Output directory for generated pages"
+    )
+    parser.add_argument(
+        "--cache-dir", default="data/cache", help="Cache directory for provider data"
+    )
+    args = parser.parse_args()
+
+    output_dir = Path(args.output_dir)
+    cache_dir = Path(args.cache_dir)
+    with httpx.Client(
+        follow_redirects=True, timeout=REQUEST_TIMEOUT, headers=DEFAULT_HEADERS
+    ) as client:
+        while True:
+            # Re-read each poll: the hourly build folds summaries into the same state.
+            state = load_state(KIUC_SERIES_STATE) or {}
+            before = copy.deepcopy(state)
+            try:
+                regenerated = check_once(client, state, args.island, output_dir, cache_dir)
+                if state != before:
+                    save_state(KIUC_SERIES_STATE, state)
+                if regenerated:
+                    print(f"{now_iso()} outages updated; regenerated {output_dir / 'index.html'}")
+            except (httpx.HTTPError, ValueError, OSError) as exc:
+                print(f"{now_iso()} KIUC poll failed: {exc}")
+            if args.once:
+                break
+            time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+
+from src.render.api import write_api
+
+
+def _sections(power_html: str = "<p>0 Outages</p>") -> list[dict]:
+    return [
+        {
+            "id": "kiuc",
+            "label": 'Power (<a href="https://kiuc.outagemap.coop">KIUC</a>)',
+            "retrieved_at": "2026-06-08T10:00:00-10:00",
+            "html": power_html,
+            "rows": {"areas": []},
+            "stale": False,
+        },
+        {"id": "nws_alerts", "label": "Hazards", "html": "<p>No active hazards.</p>"},
+        {"id": "breaking_news", "skip": True, "html": ""},
+    ]
+
+
+def _read(path: Path) -> dict:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_write_api_lists_only_changed_sections(tmp_path: Path):
+    api = tmp_path / "api"
+
+    assert write_api(_sections(), tmp_path, "t1") == ["kiuc", "nws_alerts"]
+    power = _read(api / "kiuc.json")
+    assert power["label"] == "Power (KIUC)"
+    assert power["anchor"] == "power-kiuc"
+    assert power["rows"] == {"areas": []}
+    assert not (api / "breaking_news.json").exists()
+
+    alerts_mtime = (api / "nws_alerts.json").stat().st_mtime_ns
+    assert write_api(_sections("<p>12 Outages</p>"), tmp_path, "t2") == ["kiuc"]
+    changes = _read(api / "changes.json")
+    assert changes["changed"] == ["kiuc"]
+    assert changes["previous_generated_at"] == "t1"
+    assert changes["sections"]["kiuc"]["content_hash"] == _read(api / "kiuc.json")["content_hash"]
+    assert (api / "nws_alerts.json").stat().st_mtime_ns == alerts_mtime
+
+
+def test_write_api_refreshes_document_on_new_retrieved_at(tmp_path: Path):
+    write_api(_sections(), tmp_path, "t1")
+    refetched = _sections()
+    refetched[0] = {**refetched[0], "retrieved_at": "2026-06-08T11:00:00-10:00"}
+
+    assert write_api(refetched, tmp_path, "t2") == []
+    power = _read(tmp_path / "api" / "kiuc.json")
+    changes = _read(tmp_path / "api" / "changes.json")
+    assert power["retrieved_at"] == "2026-06-08T11:00:00-10:00"
+    assert changes["sections"]["kiuc"]["retrieved_at"] == power["retrieved_at"]
+
+    refetched[0] = {**refetched[0], "stale": True, "error": "Fetch failed."}
+    write_api(refetched, tmp_path, "t3")
+    power = _read(tmp_path / "api" / "kiuc.json")
+    assert power["stale"] and power["error"] == "Fetch failed."
+
+
+def test_write_api_removes_dropped_sections(tmp_path: Path):
+    write_api(_sections(), tmp_path, "t1")
+
+    write_api(_sections()[:1], tmp_path, "t2")
+
+    assert not (tmp_path / "api" / "nws_alerts.json").exists()
+    assert _read(tmp_path / "api" / "changes.json")["removed"] == ["nws_alerts"]
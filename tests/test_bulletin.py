@@ -0,0 +1,72 @@
+from src.render.bulletin import build_bulletin
+
+GENERATED_AT = "2026-06-08T10:00:00-10:00"
+
+
+def _sections() -> list[dict]:
+    return [
+        {"id": "time_wheel", "label": "Timezones", "html": "<svg></svg>"},
+        {
+            "id": "nws_alerts",
+            "data": {
+                "hazards": [
+                    {"headline": "Flood Watch issued June 8 at 9:00AM HST by NWS Honolulu HI"},
+                    {"headline": "Flash Flood Warning issued June 8 at 9:30AM HST by NWS Honolulu HI"},
+                ]
+            },
+        },
+        {
+            "id": "kiuc",
+            "stale": True,
+            "data": {
+                "total_out": 300,
+                "as_of": 10_000.0,
+                "areas": [
+                    {"name": "Hanalei", "affected": 300, "pct_out": 40.0, "since": 7_900.0, "change": 180},
+                    {"name": "Līhuʻe", "affected": 0, "pct_out": 0.0},
+                ],
+            },
+        },
+        {
+            "id": "verizon_mobile",
+            "data": {
+                "towns": [
+                    {"town": "Kapaa", "status": "OK", "status_class": "status-green", "detail": ""},
+                    {"town": "Hanalei", "status": "Degraded", "status_class": "status-yellow", "detail": ""},
+                ]
+            },
+        },
+    ]
+
+
+def test_bulletin_ranks_lines_by_severity():
+    text = build_bulletin("Kauai", _sections(), GENERATED_AT, 2048)
+
+    assert text.splitlines() == [
+        "KAUAI SITREP 2026-06-08 10:00 HST",
+        "Hazard: Flash Flood Warning issued June 8 at 9:30AM HST",
+        "Power: 300 out (stale)",
+        "Power: Hanalei 300 (40%) for 35m, +180 in 30m (stale)",
+        "Hazard: Flood Watch issued June 8 at 9:00AM HST",
+        "Verizon: Degraded Hanalei",
+    ]
+    assert text.isascii()
+
+
+def test_bulletin_fits_byte_budget():
+    text = build_bulletin("Kauai", _sections(), GENERATED_AT, 120)
+
+    assert len(text.encode("utf-8")) <= 120
+    assert text.splitlines()[1].startswith("Hazard: Flash Flood Warning")
+    assert text.splitlines()[-1] == "+4 more"
+
+
+def test_bulletin_never_exceeds_small_budgets():
+    for max_bytes in (0, 1, 10, 30, 34, 40, 45):
+        text = build_bulletin("Kauai", _sections(), GENERATED_AT, max_bytes)
+
+        assert len(text.encode("utf-8")) <= max_bytes
+
+    assert build_bulletin("Kauai", _sections(), GENERATED_AT, 10) == "KAUAI SIT\n"
+    assert build_bulletin("Kauai", _sections(), GENERATED_AT, 40) == "KAUAI SITREP 2026-06-08 10:00 HST\n"
+    assert build_bulletin("Kauai", _sections(), GENERATED_AT, 45).splitlines()[-1] == "+5 more"
@@ -0,0 +1,66 @@
+import json
+from pathlib import Path
+
+from src.scrape.cache import (
+    CACHE_SCHEMA_VERSION,
+    cache_path,
+    compressed_cache_path,
+    load_cache,
+    save_cache,
+)
+
+
+def _section(html: str, retrieved_at: str = "2026-06-08T10:00:00-10:00") -> dict:
+    return {"id": "kiuc", "label": "KIUC", "retrieved_at": retrieved_at, "html": html}
+
+
+def test_small_sections_are_compact_json(tmp_path: Path):
+    assert save_cache(tmp_path, "kiuc", _section("<p>ok</p>"))
+
+    raw = cache_path(tmp_path, "kiuc").read_text(encoding="utf-8")
+    assert "\n" not in raw
+    assert not compressed_cache_path(tmp_path, "kiuc").exists()
+    loaded = load_cache(tmp_path, "kiuc")
+    assert loaded["html"] == "<p>ok</p>"
+    assert loaded["schema"] == CACHE_SCHEMA_VERSION
+
+
+def test_large_sections_are_compressed_and_replace_plain_file(tmp_path: Path):
+    save_cache(tmp_path, "kiuc", _section("<p>small</p>"))
+    big = "<tr><td>Hanalei</td><td>0</td></tr>" * 500
+
+    save_cache(tmp_path, "kiuc", _section(big))
+
+    assert compressed_cache_path(tmp_path, "kiuc").exists()
+    assert not cache_path(tmp_path, "kiuc").exists()
+    assert load_cache(tmp_path, "kiuc")["html"] == big
+    assert [p.name for p in tmp_path.iterdir()] == ["kiuc.json.zst"]
+
+
+def test_unchanged_section_is_not_rewritten(tmp_path: Path):
+    assert save_cache(tmp_path, "kiuc", _section("<p>ok</p>"))
+    first = load_cache(tmp_path, "kiuc")
+
+    assert not save_cache(tmp_path, "kiuc", _section("<p>ok</p>", "2026-06-08T11:00:00-10:00"))
+    assert not save_cache(
+        tmp_path, "kiuc", _section("<p>ok</p>", "2026-06-08T12:00:00-10:00"), previous=first
+    )
+    assert load_cache(tmp_path, "kiuc")["retrieved_at"] == "2026-06-08T10:00:00-10:00"
+
+    assert save_cache(tmp_path, "kiuc", _section("<p>changed</p>"), previous=first)
+    assert load_cache(tmp_path, "kiuc")["html"] == "<p>changed</p>"
+
+
+def test_legacy_entries_are_rewritten_with_schema(tmp_path: Path):
+    cache_path(tmp_path, "kiuc").write_text(json.dumps(_section("<p>ok</p>")), encoding="utf-8")
+
+    assert save_cache(tmp_path, "kiuc", _section("<p>ok</p>"))
+    assert load_cache(tmp_path, "kiuc")["schema"] == CACHE_SCHEMA_VERSION
+
+
+def test_readable_caches_stay_indented_json(tmp_path: Path):
+    save_cache(tmp_path, "marinetraffic_kauai", _section("x" * 5000), readable=True)
+
+    raw = cache_path(tmp_path, "marinetraffic_kauai").read_text(encoding="utf-8")
+    assert raw.startswith('{\n  "id"')
+    assert not compressed_cache_path(tmp_path, "marinetraffic_kauai").exists()
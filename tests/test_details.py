@@ -0,0 +1,55 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from src.scrape.details import fetch_details
+
+
+def test_fetch_details_only_fetches_new_urls(tmp_path: Path):
+    calls = []
+
+    def extract(url):
+        calls.append(url)
+        return "" if url.endswith("broken") else f"body of {url}"
+
+    with patch("src.scrape.cache.STATE_DIR", tmp_path):
+        first = fetch_details("test", ["a", "b", "broken"], extract)
+        second = fetch_details("test", ["b", "c", "broken"], extract)
+
+    assert first == {"a": "body of a", "b": "body of b"}
+    assert second == {"b": "body of b", "c": "body of c"}
+    assert sorted(calls) == ["a", "b", "broken", "broken", "c"]
+
+
+def test_fetch_details_evicts_least_recently_listed(tmp_path: Path):
+    calls = []
+
+    def extract(url):
+        calls.append(url)
+        return url.upper()
+
+    with patch("src.scrape.cache.STATE_DIR", tmp_path), patch("time.time") as clock:
+        clock.return_value = 1000.0
+        fetch_details("test", ["a", "b"], extract, max_entries=2)
+        clock.return_value = 1001.0
+        fetch_details("test", ["b", "c"], extract, max_entries=2)
+        clock.return_value = 1002.0
+        fetch_details("test", ["a", "b", "c"], extract, max_entries=2)
+
+    assert sorted(calls) == ["a", "a", "b", "c"]
+
+
+def test_fetch_details_skips_uncacheable_results(tmp_path: Path):
+    calls = []
+
+    def extract(url):
+        calls.append(url)
+        return {"complete": False}
+
+    with patch("src.scrape.cache.STATE_DIR", tmp_path):
+        for _ in range(2):
+            result = fetch_details(
+                "test", ["a"], extract, cacheable=lambda page: page["complete"]
+            )
+            assert result == {"a": {"complete": False}}
+
+    assert calls == ["a", "a"]
@@ -1,7 +1,10 @@
+import threading
 from pathlib import Path
 from unittest.mock import patch
 
-from src.generate import scrape_with_cache
+from src.generate import load_section, run_daemon, scrape_with_cache
+from src.scrape.cache import save_cache
+from src.scrape.kiuc import render
 
 
 def test_marinetraffic_cache_fallback_is_not_stale(tmp_path: Path):
@@ -43,3 +46,104 @@ def test_other_scrapers_still_mark_stale_on_cache_fallback(tmp_path: Path):
 
     assert result["stale"] is True
     assert "Fetch failed" in result["error"]
+
+
+def test_offline_rerenders_cached_data_with_current_renderer(tmp_path: Path):
+    data = {
+        "total_out": 12,
+        "areas": [{"zip": "96714", "name": "Hanalei", "affected": 12, "served": 600, "pct_out": 2.0}],
+    }
+    save_cache(tmp_path, "kiuc", {"id": "kiuc", "label": "KIUC", "html": "<p>old</p>", "data": data})
+
+    result = scrape_with_cache("kiuc", tmp_path, offline=True)
+
+    assert result["html"] == render(data)["html"]
+    assert "12 Outages" in result["html"]
+    assert result["rows"]["areas"][0]["area"] == "Hanalei"
+    assert result["stale"] is True
+
+
+def test_offline_replays_html_of_unversioned_cache(tmp_path: Path):
+    (tmp_path / "kiuc.json").write_text(
+        '{"id":"kiuc","label":"KIUC","html":"<p>old</p>","data":{"areas":[]}}',
+        encoding="utf-8",
+    )
+
+    result = scrape_with_cache("kiuc", tmp_path, offline=True)
+
+    assert result["html"] == "<p>old</p>"
+
+
+def test_daemon_rewrites_index_only_when_content_changes(tmp_path: Path):
+    clock = [1000.0]
+    counts = {"a": 0, "b": 0}
+
+    def make_scraper(name):
+        def scrape():
+            counts[name] += 1
+            # "a" changes on its third run; "b" never changes.
+            body = "<p>new</p>" if name == "a" and counts[name] >= 3 else "<p>same</p>"
+            return {"id": name, "label": name, "retrieved_at": str(clock[0]), "html": body}
+
+        return scrape
+
+    def sleep(seconds):
+        clock[0] += seconds
+
+    cache_dir = tmp_path / "cache"
+    cached_b = {"id": "b", "label": "b", "retrieved_at": "0", "html": "<p>same</p>"}
+    save_cache(cache_dir, "b", cached_b)
+    writes = []
+    island = {"test": {"name": "Test", "scrapers": ["a", "b"]}}
+    with patch("src.generate.ISLANDS", island), patch(
+        "src.generate.get_scraper", side_effect=make_scraper
+    ), patch("src.generate.SCRAPE_INTERVALS", {"a": 60, "b": 600}), patch(
+        "src.generate.SCRAPE_JITTER", 0.0
+    ), patch("src.generate._write_index", side_effect=lambda *args: writes.append(args[1])), patch(
+        "src.generate.load_section", wraps=load_section
+    ) as loads:
+        run_daemon("test", tmp_path, cache_dir, max_runs=4, clock=lambda: clock[0], sleep=sleep)
+
+    assert counts == {"a": 3, "b": 1}
+    assert clock[0] == 1120.0
+    # The page starts from the cache ("a" has none yet) and b's unchanged scrape is not a write.
+    assert [[section["html"] for section in results] for results in writes] == [
+        ["<p>Offline mode: no cached data available.</p>", "<p>same</p>"],
+        ["<p>same</p>", "<p>same</p>"],
+        ["<p>new</p>", "<p>same</p>"],
+    ]
+    # Only startup reads the cache; later scrapes fall back to the in-memory section.
+    assert {call.args[1] for call in loads.call_args_list} == {"a", "b"}
+    assert loads.call_count == 3
+
+
+def test_daemon_does_not_hold_fast_sources_behind_slow_ones(tmp_path: Path):
+    fast_runs = []
+    fast_ran_three_times = threading.Event()
+
+    def make_scraper(name):
+        def scrape():
+            if name == "slow":
+                # Only finishes once "fast" has been rescheduled around it.
+                released = fast_ran_three_times.wait(timeout=5)
+                return {"id": name, "label": name, "html": f"<p>{released}</p>"}
+            fast_runs.append(name)
+            if len(fast_runs) == 3:
+                fast_ran_three_times.set()
+            return {"id": name, "label": name, "html": f"<p>{len(fast_runs)}</p>"}
+
+        return scrape
+
+    island = {"test": {"name": "Test", "scrapers": ["fast", "slow"]}}
+    writes = []
+    with patch("src.generate.ISLANDS", island), patch(
+        "src.generate.get_scraper", side_effect=make_scraper
+    ), patch("src.generate.SCRAPE_INTERVALS", {"fast": 0.01, "slow": 600}), patch(
+        "src.generate._write_index", side_effect=lambda *args: writes.append(args[1])
+    ):
+        run_daemon("test", tmp_path, tmp_path / "cache", max_runs=4)
+
+    assert len(fast_runs) == 3
+    # The page is written at startup and on each fast result, without waiting for "slow".
+    assert writes[1][0]["html"] == "<p>1</p>" and writes[1][1]["stale"] is True
+    assert writes[-1][1]["html"] == "<p>True</p>"
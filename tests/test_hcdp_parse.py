@@ -0,0 +1,39 @@
+import math
+
+from src.hcdp.parse import (
+    decode_measurement_columns,
+    normalize_measurements_payload,
+    pivot_latest_columns,
+    pivot_latest_measurements,
+)
+
+PAYLOAD = {
+    "index": ["station_id", "variable", "timestamp", "value", "station_name", "nws_id"],
+    "data": [
+        ["0603", "Tair_1_Avg", "2026-01-05T10:00:00Z", "22.5", "Waipa", "WPAH1"],
+        ["0603", "Tair_1_Avg", "2026-01-05T10:05:00Z", "22.7", "Waipa", "WPAH1"],
+        ["0603", "RF_1_Tot300s", "2026-01-05T10:05:00Z", "0.25", "Waipa", "WPAH1"],
+        ["0601", "Tair_1_Avg", "2026-01-05T10:00:00Z", "bad", "Lihue", None],
+        ["0601", "RF_1_Tot300s", "not-a-time", "1.0", "Lihue", None],
+        ["", "Tair_1_Avg", "2026-01-05T10:00:00Z", "1.0", None, None],
+    ],
+}
+
+
+def test_pivot_latest_columns_matches_row_pivot():
+    expected = pivot_latest_measurements(normalize_measurements_payload(PAYLOAD))
+    assert pivot_latest_columns(decode_measurement_columns(PAYLOAD)) == expected
+
+
+def test_decode_columns_accepts_list_payload():
+    rows = normalize_measurements_payload(PAYLOAD)
+    cols = decode_measurement_columns(rows)
+    assert len(cols) == 4
+    assert cols.metadata["0603"]["nws_id"] == "WPAH1"
+    assert math.isnan(cols.value[cols.station_id.index("0601")])
+
+
+def test_select_filters_variables():
+    cols = decode_measurement_columns(PAYLOAD).select(["RF_1_Tot300s"])
+    assert cols.station_id == ["0603"]
+    assert list(cols.value) == [0.25]
@@ -0,0 +1,38 @@
+from array import array
+from datetime import timedelta
+from unittest.mock import patch
+
+from src.hcdp import shared
+from src.hcdp.parse import MeasurementColumns
+
+
+def _columns(var_ids) -> MeasurementColumns:
+    return MeasurementColumns(
+        station_id=["0603"] * len(var_ids),
+        variable=list(var_ids),
+        epoch=array("d", [0.0] * len(var_ids)),
+        value=array("d", [1.0] * len(var_ids)),
+    )
+
+
+def test_one_merged_request_per_run():
+    requests = []
+
+    def get_measurement_columns(self, **query):
+        requests.append(query)
+        return _columns(query["var_ids"])
+
+    with patch.object(shared, "_SUBSCRIPTIONS", {}), patch.object(shared, "_MEMO", {}), patch.object(
+        shared.MesonetClient, "get_measurement_columns", get_measurement_columns
+    ):
+        shared.register(("Tair_1_Avg", "RH_1_Avg"), timedelta(hours=1))
+        shared.register(("RF_1_Tot300s",), lambda: timedelta(hours=2))
+
+        weather = shared.measurements(("Tair_1_Avg", "RH_1_Avg"))
+        rain = shared.measurements(("RF_1_Tot300s",))
+        shared.measurements(("Tair_1_Avg", "RH_1_Avg"))
+
+    assert [query["var_ids"] for query in requests] == [("RF_1_Tot300s", "RH_1_Avg", "Tair_1_Avg")]
+    assert requests[0]["limit"] == shared._row_limit(len(shared.HCDP_STATION_IDS), 3, timedelta(hours=2))
+    assert sorted(weather.variable) == ["RH_1_Avg", "Tair_1_Avg"]
+    assert rain.variable == ["RF_1_Tot300s"]
@@ -0,0 +1,97 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+
+from src.scrape.kiuc import build_data, render, update_series
+from src.watch_kiuc import check_once
+
+T0 = 1_767_000_000_000  # lastUpdate is epoch milliseconds
+
+
+def _summary(minutes: int, hanalei_out: int) -> dict:
+    return {
+        "lastUpdate": T0 + minutes * 60_000,
+        "outages": [{"nbrOut": hanalei_out}],
+        "regionDataSets": [
+            {
+                "id": "omszip",
+                "regions": [
+                    {"id": "96714", "numberOut": hanalei_out, "numberServed": 1000},
+                    {"id": "96766", "numberOut": 0, "numberServed": 5000},
+                ],
+            }
+        ],
+    }
+
+
+def test_series_tracks_start_trend_and_restore():
+    state: dict = {}
+    assert update_series(state, _summary(0, 0))
+    assert update_series(state, _summary(10, 120))
+    assert not update_series(state, _summary(10, 120))
+    assert update_series(state, _summary(40, 300))
+    assert update_series(state, _summary(45, 300))
+
+    hanalei = state["zips"]["96714"]
+    assert hanalei["since"] == (T0 + 10 * 60_000) / 1000
+    # Unchanged counts are not stored again.
+    assert [count for _, count in hanalei["points"]] == [0, 120, 300]
+
+    data = build_data(_summary(45, 300), state)
+    area = data["areas"][0]
+    assert area["change"] == 180  # vs. the count 30 minutes earlier
+    rows = render(data)["rows"]["areas"]
+    assert rows[0]["affected"] == 300
+    assert "35m" in render(data)["text"]
+    assert "▲ 180" in render(data)["html"]
+
+    assert update_series(state, _summary(130, 0))
+    hanalei = state["zips"]["96714"]
+    assert hanalei["since"] is None
+    assert hanalei["duration"] == 120 * 60
+    text = render(build_data(_summary(130, 0), state))["text"]
+    assert "Restored" in text and "2h 00m" in text
+
+
+def test_poller_skips_unchanged_summaries(tmp_path: Path):
+    responses = [_summary(0, 5), _summary(0, 5), None]
+    sent_etags = []
+
+    def handler(request):
+        sent_etags.append(request.headers.get("If-None-Match"))
+        body = responses.pop(0)
+        if body is None:
+            return httpx.Response(304)
+        return httpx.Response(200, json=body, headers={"ETag": f'"v{len(sent_etags)}"'})
+
+    state: dict = {}
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client, patch(
+        "src.watch_kiuc.regenerate_island"
+    ) as regenerate:
+        assert check_once(client, state, "kauai", tmp_path, tmp_path)
+        assert not check_once(client, state, "kauai", tmp_path, tmp_path)
+        assert not check_once(client, state, "kauai", tmp_path, tmp_path)
+
+    assert regenerate.call_count == 1
+    # The repeated summary's new validator is kept even though nothing was regenerated.
+    assert sent_etags == [None, '"v1"', '"v2"']
+    assert state["etag"] == '"v2"'
+    fresh = regenerate.call_args.args[3]["kiuc"]
+    assert fresh["rows"]["areas"][0]["affected"] == 5
+
+
+def test_failed_regenerate_leaves_state_untouched(tmp_path: Path):
+    def handler(request):
+        return httpx.Response(200, json=_summary(0, 5))
+
+    state: dict = {}
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client, patch(
+        "src.watch_kiuc.regenerate_island", side_effect=OSError("disk full")
+    ):
+        try:
+            check_once(client, state, "kauai", tmp_path, tmp_path)
+        except OSError:
+            pass
+
+    assert state == {}
@@ -0,0 +1,92 @@
+import threading
+
+import httpx
+
+from src.scrape.outage_probe import Carrier, TokenCache, _probe_all
+
+TOWNS = [{"town": f"Town {i}"} for i in range(6)]
+
+
+def _request(town, token):
+    return {"json": {"town": town["town"]}, "headers": {"Authorization": f"Bearer {token}"}}
+
+
+def _classify(payload):
+    return "OK", "status-green", payload["town"]
+
+
+def test_probes_run_concurrently_and_keep_town_order():
+    # Every request waits for all the others; a sequential probe would break the barrier.
+    barrier = threading.Barrier(len(TOWNS), timeout=5)
+
+    def handler(request):
+        barrier.wait()
+        return httpx.Response(200, content=request.content)
+
+    carrier = Carrier(name="Test", url="https://carrier.test/outage", request=_request, classify=_classify)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        rows = _probe_all(client, carrier, TOWNS, max_workers=len(TOWNS))
+
+    assert [row["town"] for row in rows] == [town["town"] for town in TOWNS]
+    assert all(row["status"] == "OK" for row in rows)
+    assert rows[2]["detail"] == "Town 2"
+
+
+def test_rejected_token_is_refreshed_once_for_all_probes():
+    issued = []
+    lock = threading.Lock()
+
+    def fetch_token(client):
+        with lock:
+            issued.append(f"token-{len(issued)}")
+            return issued[-1], 1e12
+
+    def handler(request):
+        if request.headers["Authorization"] == "Bearer token-0":
+            return httpx.Response(401)
+        return httpx.Response(200, content=request.content)
+
+    carrier = Carrier(
+        name="Test",
+        url="https://carrier.test/outage",
+        request=_request,
+        classify=_classify,
+        tokens=TokenCache(fetch_token),
+    )
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        rows = _probe_all(client, carrier, TOWNS, max_workers=len(TOWNS))
+
+    assert issued == ["token-0", "token-1"]
+    assert all(row["status"] == "OK" for row in rows)
+
+
+def test_failed_probe_is_reported_unknown():
+    def handler(request):
+        return httpx.Response(500, text="boom")
+
+    carrier = Carrier(name="Test", url="https://carrier.test/outage", request=_request, classify=_classify)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        (row,) = _probe_all(client, carrier, TOWNS[:1], max_workers=1)
+
+    assert row == {"town": "Town 0", "status": "Unknown", "status_class": "", "detail": "Fetch failed."}
+
+
+def test_failed_token_fetch_is_not_retried_per_town():
+    calls = []
+
+    def fetch_token(client):
+        calls.append(1)
+        return None, 0.0
+
+    carrier = Carrier(
+        name="Test",
+        url="https://carrier.test/outage",
+        request=_request,
+        classify=_classify,
+        tokens=TokenCache(fetch_token),
+    )
+    with httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200))) as client:
+        rows = _probe_all(client, carrier, TOWNS, max_workers=len(TOWNS))
+
+    assert len(calls) == 1
+    assert {row["detail"] for row in rows} == {"Token fetch failed."}
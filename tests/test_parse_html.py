@@ -0,0 +1,62 @@
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from src.scrape import base, cnn_topstories, hidot_highways_news, kauai_county_press
+from src.scrape.base import extract_headlines, extract_page_summary, parse_html
+
+PAGE = """<!doctype html>
+<html><head><title> County of Kauai </title>
+<meta name="description" content="Official site"></head>
+<body>
+<nav><a href="/">Home</a><a href="/County-Press-Releases">All press releases here</a></nav>
+<div class="layout-homepage__lite">
+  <h2>Latest Stories</h2>
+  <ul><li><a href="/2026/01/05/storm">Storm brings flooding to Kauai</a></li>
+  <li><a href="https://example.com/x">Another long enough headline</a></li></ul>
+</div>
+<main>
+  <article><h2>Water main break on Kuhio Highway</h2>
+    <a href="/County-Press-Releases/water-main">Published on January 5, 2026</a></article>
+  <article><h2>Road work</h2><a href="/elsewhere">Published on Jan. 4, 2026</a></article>
+  <div class="primary-content"><p>Crews are on scene.</p><p style="x">hidden</p>
+    <p>Tagged as roads</p><ul><li>Use alternate routes</li></ul></div>
+</main>
+</body></html>
+"""
+
+
+def _full_parse(markup, only=None):
+    return BeautifulSoup(markup, "lxml")
+
+
+def _extract_all():
+    with patch.object(kauai_county_press, "fetch_html", return_value=PAGE), patch.object(
+        hidot_highways_news, "fetch_html", return_value=PAGE
+    ), patch.object(cnn_topstories, "fetch_html", return_value=PAGE):
+        return (
+            extract_page_summary(PAGE),
+            extract_headlines(PAGE, "https://www.kauai.gov/"),
+            kauai_county_press._parse_listing(PAGE, kauai_county_press.LISTING_URL),
+            kauai_county_press._fetch_release_body("https://www.kauai.gov/x"),
+            hidot_highways_news._fetch_primary_content("https://hidot.hawaii.gov/x"),
+            cnn_topstories.scrape()["html"],
+        )
+
+
+def test_strained_parsing_matches_full_parse():
+    strained = _extract_all()
+    with patch.object(base, "parse_html", _full_parse), patch.object(
+        kauai_county_press, "parse_html", _full_parse
+    ), patch.object(hidot_highways_news, "parse_html", _full_parse), patch.object(
+        cnn_topstories, "parse_html", _full_parse
+    ):
+        full = _extract_all()
+    assert strained == full
+    assert strained[0] == ("County of Kauai", "Latest Stories")
+    assert "Storm brings flooding" in strained[5]
+
+
+def test_parse_html_falls_back_to_full_page():
+    soup = parse_html("<p>No region here</p>", only=SoupStrainer("main"))
+    assert soup.find("p").get_text() == "No region here"
@@ -0,0 +1,55 @@
+import time
+from datetime import timedelta
+from unittest.mock import patch
+
+from src.hcdp.parse import MeasurementColumns
+from src.scrape.precipitation import (
+    _RAIN_RETENTION_SLOTS,
+    HCDP_RAIN_FETCH_OVERLAP,
+    HCDP_RAIN_RETENTION,
+    HCDP_RAIN_SLOT_SECONDS,
+    HCDP_STATION_IDS,
+    _fetch_mesonet_rain,
+    _rain_lookback,
+)
+from src.scrape.rolling import SlotTotals
+
+
+def _station(last_seen: float) -> SlotTotals:
+    totals = SlotTotals(HCDP_RAIN_SLOT_SECONDS, _RAIN_RETENTION_SLOTS)
+    totals.add(last_seen, 0.5)
+    return totals
+
+
+def test_rain_lookback_ignores_dead_station():
+    now = time.time()
+    stations = {"0603": _station(now - 600), "0601": _station(now - 5 * 86400)}
+
+    with patch("src.scrape.precipitation._load_rain_totals", return_value=stations):
+        lookback = _rain_lookback()
+
+    assert lookback < HCDP_RAIN_RETENTION
+    assert lookback <= timedelta(seconds=600 + HCDP_RAIN_SLOT_SECONDS) + HCDP_RAIN_FETCH_OVERLAP
+
+    with patch(
+        "src.scrape.precipitation._load_rain_totals", return_value={"0601": stations["0601"]}
+    ):
+        assert _rain_lookback() == HCDP_RAIN_RETENTION
+
+
+def test_silent_station_shows_no_data_for_windows_after_last_report():
+    now = time.time()
+    stations = {sid: SlotTotals(HCDP_RAIN_SLOT_SECONDS, _RAIN_RETENTION_SLOTS) for sid in HCDP_STATION_IDS}
+    stations["0603"].add(now - 600, 2.54)
+    stations["0601"].add(now - 4 * 3600, 2.54)
+
+    with patch("src.scrape.precipitation._load_rain_totals", return_value=stations), patch(
+        "src.scrape.precipitation.has_credentials", return_value=True
+    ), patch("src.scrape.precipitation.measurements", return_value=MeasurementColumns()), patch(
+        "src.scrape.precipitation.save_state"
+    ):
+        rows = _fetch_mesonet_rain()["rows"]
+
+    live, silent = rows
+    assert [live[key] for key in ("last_1h", "last_6h", "last_72h")] == ["0.10", "0.10", "0.10"]
+    assert [silent[key] for key in ("last_1h", "last_3h", "last_6h", "last_72h")] == ["—", "—", "0.10", "0.10"]
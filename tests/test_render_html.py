@@ -1,4 +1,13 @@
-from src.render.html import render_html
+from src.render.html import page_stylesheet, render_html, stylesheet_name
+from src.render.tables import (
+    TABLE_CLASS,
+    WRAP_CLASS,
+    Cell,
+    Column,
+    build_table,
+    compact_table,
+    ensure_compact_tables,
+)
 
 
 def test_render_html_shows_stale_and_error_for_cached_fallback():
@@ -37,3 +46,76 @@ def test_render_html_omits_stale_indicator_for_fresh_provider():
     assert 'class="module module--stale"' not in html
     assert "<p class=\"provider-status\">" not in html
     assert 'id="kiuc"' in html
+
+
+def test_ensure_compact_tables_wraps_foreign_tables():
+    html = ensure_compact_tables('<p>x</p><TABLE class="info"><tr><td>1</td></tr></TABLE>')
+    assert html == (
+        '<p>x</p><div class="status-table-wrap"><table class="info status-table-compact">'
+        "<tr><td>1</td></tr></TABLE></div>"
+    )
+
+
+def test_ensure_compact_tables_leaves_scraper_tables_unchanged():
+    table = compact_table("<tbody><tr><td>1</td></tr></tbody>", "info-table")
+    assert table == (
+        '<div class="status-table-wrap"><table class="info-table status-table-compact">'
+        "<tbody><tr><td>1</td></tr></tbody></table></div>"
+    )
+    assert ensure_compact_tables(table) == table
+
+
+def test_ensure_compact_tables_handles_nested_and_prewrapped_tables():
+    html = ensure_compact_tables(
+        '<div class="status-table-wrap"><table><tr><td><table></table></td></tr></table></div>'
+    )
+    assert html == (
+        '<div class="status-table-wrap"><table class="status-table-compact"><tr><td>'
+        '<div class="status-table-wrap"><table class="status-table-compact"></table></div>'
+        "</td></tr></table></div>"
+    )
+
+
+def test_build_table_renders_html_text_and_rows():
+    columns = (
+        Column("name", "Name"),
+        Column("depth", "Depth [in]", align="right"),
+    )
+    table = build_table(
+        columns,
+        [
+            ("Hanalei <River>", Cell(1.25, "1.25", css="status-yellow")),
+            (Cell("0601", href="https://example.com/?a=1&b=2"), None),
+        ],
+    )
+
+    assert table.html.startswith(f'<div class="{WRAP_CLASS}"><table class="{TABLE_CLASS}">')
+    assert "<th>Depth [in]</th>" in table.html
+    assert "<td>Hanalei &lt;River&gt;</td>" in table.html
+    assert '<td class="status-yellow" style="text-align:right;">1.25</td>' in table.html
+    assert '<a href="https://example.com/?a=1&amp;b=2">0601</a>' in table.html
+    assert table.text == "Name | Depth [in]\nHanalei <River> | 1.25\n0601 | "
+    assert table.rows == [
+        {"name": "Hanalei <River>", "depth": 1.25},
+        {"name": "0601", "depth": None},
+    ]
+    assert ensure_compact_tables(table.html) == table.html
+
+
+def test_render_html_moves_section_styles_to_stylesheet():
+    providers = [
+        {"id": "a", "label": "A", "html": "<p>A</p>", "css": ".a-x { color: red; }"},
+        {"id": "b", "label": "B", "html": "<style>.b-x {\n  margin: 0 1px;\n}</style><p>B</p>"},
+    ]
+    css = page_stylesheet(providers)
+    assert css.endswith(".a-x{color:red}.b-x{margin:0 1px}")
+    assert stylesheet_name(css) == stylesheet_name(page_stylesheet(providers))
+
+    linked = render_html("Kauai", providers, "2026-04-26T12:00:00-10:00", "assets/dash.abc.css")
+    assert '<link rel="stylesheet" href="assets/dash.abc.css">' in linked
+    assert "<style" not in linked
+    assert "<p>B</p>" in linked
+
+    inline = render_html("Kauai", providers, "2026-04-26T12:00:00-10:00")
+    assert inline.count("<style>") == 1
+    assert f"<style>{css}</style>" in inline
@@ -0,0 +1,67 @@
+from src.scrape.rolling import RollingRate, SlotTotals, time_to_threshold
+
+
+def test_slope_of_steady_rise():
+    series = RollingRate(rate_window=3600, retention=6 * 3600)
+    for minute in range(0, 31, 5):
+        series.append(1_780_000_000 + minute * 60, 3.0 + minute * (2.0 / 30))
+    assert abs(series.slope() * 3600 - 4.0) < 1e-6
+
+
+def test_rate_window_only_uses_recent_points():
+    series = RollingRate(rate_window=3600, retention=6 * 3600)
+    start = 1_780_000_000
+    for minute in range(0, 180, 15):
+        series.append(start + minute * 60, 5.0)
+    for minute in range(180, 241, 15):
+        series.append(start + minute * 60, 5.0 + (minute - 180) / 60)
+    assert abs(series.slope() * 3600 - 1.0) < 1e-6
+    assert len(series) == 17
+
+
+def test_retention_evicts_old_points_and_ignores_duplicates():
+    series = RollingRate(rate_window=600, retention=1800)
+    for minute in range(0, 61, 5):
+        series.append(minute * 60, float(minute))
+    assert series.append(60 * 60, 99.0) is False
+    assert series.points()[0][0] == 30 * 60
+    restored = RollingRate.from_points(series.points(), 600, 1800)
+    assert abs(restored.slope() - series.slope()) < 1e-9
+
+
+def test_time_to_threshold():
+    assert time_to_threshold(5.0, 2.0, 7.0) == 1.0
+    assert time_to_threshold(8.0, 2.0, 7.0) is None
+    assert time_to_threshold(5.0, -1.0, 7.0) is None
+    assert time_to_threshold(5.0, None, 7.0) is None
+
+
+def test_slot_totals_window_sums():
+    totals = SlotTotals(slot_seconds=300, retention_slots=72 * 12)
+    start = 1_780_000_200
+    for idx in range(24):
+        totals.add(start + idx * 300, 1.0)
+    end = start + 23 * 300
+    assert totals.total_since(end - 3600 + 1) == 12.0
+    assert totals.total_since(end) == 1.0
+    assert totals.total_since(start - 86400) == 24.0
+
+
+def test_slot_totals_gap_redelivery_and_roundtrip():
+    totals = SlotTotals(slot_seconds=300, retention_slots=72 * 12)
+    totals.add(0, 2.0)
+    totals.add(900, 1.0)
+    totals.add(900, 3.0)
+    assert len(totals) == 4
+    assert totals.total_since(0) == 5.0
+    restored = SlotTotals.from_dict(totals.to_dict(), 300, 72 * 12)
+    assert restored.total_since(300) == 3.0
+    assert restored.last_time == 900.0
+
+
+def test_slot_totals_trims_to_retention():
+    totals = SlotTotals(slot_seconds=300, retention_slots=12)
+    for idx in range(40):
+        totals.add(idx * 300, 1.0)
+    assert len(totals) <= 15
+    assert totals.total_since(39 * 300 - 3600 + 1) == 12.0
@@ -0,0 +1,103 @@
+from src.scrape.rss import iter_feed_items, parse_rss
+
+RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel>
+  <title>Kauai News</title>
+  <link>https://example.com/</link>
+  <item>
+    <title>Road closed in  L&#299;hu&#699;e</title>
+    <link>https://example.com/a</link>
+    <pubDate>Mon, 05 Jan 2026 20:00:00 +0000</pubDate>
+    <description><![CDATA[<p>Kuhio Highway is closed.</p>]]></description>
+  </item>
+  <item>
+    <title>Second</title>
+    <link>https://example.com/b</link>
+    <content:encoded>Only encoded content</content:encoded>
+  </item>
+  <item>
+    <title>Third</title>
+    <link>https://example.com/c</link>
+  </item>
+</channel>
+</rss>
+"""
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Feed</title>
+  <entry>
+    <title>Atom entry</title>
+    <link rel="self" href="https://example.com/self"/>
+    <link rel="alternate" href="https://example.com/post"/>
+    <updated>2026-01-05T20:00:00Z</updated>
+    <summary>Short summary</summary>
+  </entry>
+</feed>
+"""
+
+
+def test_parse_rss_items():
+    items = parse_rss(RSS, limit=5)
+    assert [item["url"] for item in items] == [
+        "https://example.com/a",
+        "https://example.com/b",
+        "https://example.com/c",
+    ]
+    first = items[0]
+    assert first["title"] == "Road closed in Līhuʻe"
+    assert first["summary"] == "<p>Kuhio Highway is closed.</p>"
+    assert first["published"] == "2026-01-05 10:00 HST"
+    assert items[1]["summary"] == "Only encoded content"
+    assert items[2]["published"] == ""
+
+
+def test_parse_atom_prefers_alternate_link():
+    (item,) = parse_rss(ATOM)
+    assert item == {
+        "title": "Atom entry",
+        "url": "https://example.com/post",
+        "summary": "Short summary",
+        "published": "2026-01-05 10:00 HST",
+    }
+
+
+def test_parse_rss_stops_after_limit_matches():
+    seen = []
+
+    def predicate(item):
+        seen.append(item["title"])
+        return item["title"] != "Road closed in Līhuʻe"
+
+    items = parse_rss(RSS, limit=1, predicate=predicate)
+    assert [item["title"] for item in items] == ["Second"]
+    assert seen == ["Road closed in Līhuʻe", "Second"]
+
+
+def test_iter_feed_items_tolerates_truncated_feed():
+    truncated = RSS[: RSS.index(b"<item>\n    <title>Third")]
+    assert [item["title"] for item in iter_feed_items(truncated)] == [
+        "Road closed in Līhuʻe",
+        "Second",
+    ]
+
+
+def test_parse_rss_scan_limits_items_considered():
+    items = parse_rss(RSS, limit=5, predicate=lambda item: item["title"] == "Third", scan=2)
+    assert items == []
+    assert [item["title"] for item in parse_rss(RSS, limit=5, scan=2)] == [
+        "Road closed in Līhuʻe",
+        "Second",
+    ]
+
+
+def test_parse_rss_reports_parse_errors():
+    errors: list[str] = []
+    broken = RSS.replace(b"<title>Second</title>", b"<title>Second &bad;</title>")
+    assert len(parse_rss(broken, limit=5, errors=errors)) == 3
+    assert errors and "bad" in errors[0]
+
+    clean: list[str] = []
+    parse_rss(RSS, errors=clean)
+    assert clean == []
@@ -0,0 +1,140 @@
+import asyncio
+import gzip
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import zstandard
+
+from src.render import compress
+from src.render.compress import write_site_file
+from src.serve import DashboardServer, choose_encoding, page_events
+
+PAGE = """<!doctype html><html><body>
+<header><p class="meta">{generated}</p></header>
+<div class="modules"><section class="module" id="power">{power}</section><section class="module" id="weather">Sunny</section></div>
+</body></html>
+"""
+
+
+def _page(power: str = "0 Outages", generated: str = "10:00") -> str:
+    return PAGE.format(power=power + " " * 600, generated=generated)
+
+
+def test_choose_encoding_honors_q_values():
+    available = {"identity": b"", "gzip": b""}
+    assert choose_encoding("gzip, deflate, br", available) == "gzip"
+    assert choose_encoding("gzip;q=0, identity", available) == "identity"
+    assert choose_encoding("", available) == "identity"
+    assert choose_encoding("br;q=1.0, gzip;q=0.5", {**available, "br": b""}) == "br"
+
+
+def test_page_events_send_only_changed_sections():
+    assert page_events(None, _page()) == []
+    assert page_events(_page(), _page(generated="10:05")) == []
+
+    (event,) = page_events(_page(), _page("12 Outages", generated="10:05"))
+    assert event[0] == "section"
+    assert event[1]["id"] == "power"
+    assert "12 Outages" in event[1]["html"]
+
+    reordered = _page().replace('id="weather">Sunny', 'id="weather">Sunny</section><section id="x">New')
+    assert page_events(_page(), reordered) == [("reload", {})]
+
+
+async def _request(port: int, raw: str) -> bytes:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(raw.encode("latin-1"))
+    await writer.drain()
+    data = await reader.read()
+    writer.close()
+    return data
+
+
+def test_server_sends_compressed_page_with_etag_and_304(tmp_path: Path):
+    (tmp_path / "index.html").write_text(_page(), encoding="utf-8")
+    server = DashboardServer(tmp_path)
+
+    async def scenario():
+        listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            first = await _request(
+                port, "GET / HTTP/1.1\r\nAccept-Encoding: gzip\r\nConnection: close\r\n\r\n"
+            )
+            head, body = first.split(b"\r\n\r\n", 1)
+            etag = next(
+                line.split(b": ", 1)[1] for line in head.split(b"\r\n") if line.startswith(b"ETag")
+            )
+            second = await _request(
+                port,
+                f"GET /index.html HTTP/1.1\r\nAccept-Encoding: gzip\r\nIf-None-Match: {etag.decode()}\r\n"
+                "Connection: close\r\n\r\n",
+            )
+            missing = await _request(port, "GET /../secret HTTP/1.1\r\nConnection: close\r\n\r\n")
+        return head, body, second, missing
+
+    head, body, second, missing = asyncio.run(scenario())
+    assert head.startswith(b"HTTP/1.1 200")
+    assert b"Content-Encoding: gzip" in head
+    assert gzip.decompress(body).decode("utf-8") == _page()
+    assert second.startswith(b"HTTP/1.1 304")
+    assert missing.startswith(b"HTTP/1.1 404")
+
+
+def test_event_stream_pushes_changed_section(tmp_path: Path):
+    index = tmp_path / "index.html"
+    index.write_text(_page(), encoding="utf-8")
+    server = DashboardServer(tmp_path)
+    server.check_page()
+
+    async def scenario():
+        listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"GET /events HTTP/1.1\r\n\r\n")
+            await writer.drain()
+            await reader.readuntil(b"retry: 5000\n\n")
+            index.write_text(_page("40 Outages", generated="10:05"), encoding="utf-8")
+            server.check_page()
+            message = await asyncio.wait_for(reader.readuntil(b"\n\n"), timeout=5)
+            writer.close()
+        return message
+
+    message = asyncio.run(scenario())
+    assert message.startswith(b"event: section\ndata: ")
+    assert b'"id":"power"' in message
+    assert b"40 Outages" in message
+
+
+def test_missing_brotli_warns_and_drops_old_br(tmp_path: Path):
+    index = tmp_path / "index.html"
+    (tmp_path / "index.html.br").write_bytes(b"old")
+
+    with patch.dict(compress.COMPRESSED_SUFFIXES, {".br": ("br", None)}), pytest.warns(
+        RuntimeWarning, match="brotli is not installed"
+    ):
+        write_site_file(index, _page().encode("utf-8"))
+
+    assert not (tmp_path / "index.html.br").exists()
+    assert (tmp_path / "index.html.zst").exists()
+
+
+def test_server_prefers_precompressed_siblings(tmp_path: Path):
+    index = tmp_path / "index.html"
+    write_site_file(index, _page().encode("utf-8"))
+    assert (tmp_path / "index.html.gz").exists()
+    assert oct(index.stat().st_mode & 0o777) == "0o644"
+    server = DashboardServer(tmp_path)
+
+    asset = server.site.get("/")
+    assert asset.bodies["zstd"] == (tmp_path / "index.html.zst").read_bytes()
+    assert zstandard.ZstdDecompressor().decompress(asset.bodies["zstd"]) == _page().encode("utf-8")
+    assert choose_encoding("gzip, zstd", asset.bodies) == "zstd"
+
+    # A sibling older than its source is ignored rather than served stale.
+    index.write_text(_page("9 Outages"), encoding="utf-8")
+    os.utime(tmp_path / "index.html.zst", ns=(0, 0))
+    assert "zstd" not in server.site.get("/").bodies
@@ -0,0 +1,82 @@
+import stat
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+
+from src.scrape.outage_probe import TokenCache
+from src.scrape.sessions import load_token, save_token, with_session_cookies
+
+WARMUP_URL = "https://provider.test/"
+API_URL = "https://provider.test/api"
+
+
+def test_tokens_persist_owner_only(tmp_path: Path):
+    with patch("src.scrape.cache.STATE_DIR", tmp_path):
+        save_token("carrier", "abc", time.time() + 600)
+        assert load_token("carrier")[0] == "abc"
+        save_token("carrier", "old", time.time() - 1)
+        assert load_token("carrier") == (None, 0.0)
+
+    session_file = tmp_path / "sessions" / "carrier.json"
+    assert stat.S_IMODE(session_file.stat().st_mode) == 0o600
+    assert stat.S_IMODE(session_file.parent.stat().st_mode) == 0o700
+
+
+def test_token_cache_reuses_stored_token(tmp_path: Path):
+    fetched = []
+
+    def fetch(client):
+        fetched.append(1)
+        return "fresh", time.time() + 600
+
+    with patch("src.scrape.cache.STATE_DIR", tmp_path), httpx.Client() as client:
+        assert TokenCache(fetch, session="carrier").get(client) == "fresh"
+        assert TokenCache(fetch, session="carrier").get(client) == "fresh"
+
+    assert len(fetched) == 1
+
+
+def _cookie_client(requests: list, accepted: set):
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.path == "/":
+            return httpx.Response(200, headers={"Set-Cookie": f"sid=s{len(requests)}; Path=/"})
+        if request.headers.get("cookie") in accepted:
+            return httpx.Response(200, text="ok")
+        return httpx.Response(403)
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def _fetch(client):
+    def fetch():
+        response = client.get(API_URL)
+        response.raise_for_status()
+        return response.text
+
+    return fetch
+
+
+def test_stored_cookies_skip_the_warmup(tmp_path: Path):
+    requests: list = []
+    with patch("src.scrape.cache.STATE_DIR", tmp_path):
+        with _cookie_client(requests, {"sid=s1"}) as client:
+            assert with_session_cookies(client, "provider", WARMUP_URL, _fetch(client)) == "ok"
+        with _cookie_client(requests, {"sid=s1"}) as client:
+            assert with_session_cookies(client, "provider", WARMUP_URL, _fetch(client)) == "ok"
+
+    assert requests == ["/", "/api", "/api"]
+
+
+def test_rejected_cookies_are_replaced(tmp_path: Path):
+    requests: list = []
+    with patch("src.scrape.cache.STATE_DIR", tmp_path):
+        with _cookie_client(requests, {"sid=s1"}) as client:
+            with_session_cookies(client, "provider", WARMUP_URL, _fetch(client))
+        # The server no longer accepts the first session; a new warmup issues sid=s4.
+        with _cookie_client(requests, {"sid=s4"}) as client:
+            assert with_session_cookies(client, "provider", WARMUP_URL, _fetch(client)) == "ok"
+
+    assert requests == ["/", "/api", "/api", "/", "/api"]
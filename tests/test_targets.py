@@ -0,0 +1,47 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from src.generate import generate_island
+
+ROWS = '<div class="status-table-wrap"><table class="status-table-compact"><thead><tr><th>A</th></tr></thead><tbody><tr><td>1</td></tr><tr><td>2</td></tr></tbody></table></div>'
+
+
+def test_targets_render_from_one_scrape(tmp_path: Path):
+    calls = []
+
+    def make_scraper(name):
+        def scrape():
+            calls.append(name)
+            return {"id": name, "label": name.title(), "retrieved_at": None, "html": ROWS}
+
+        return scrape
+
+    island = {"test": {"name": "Test", "scrapers": ["power", "roads"]}}
+    with patch("src.generate.ISLANDS", island), patch(
+        "src.generate.get_scraper", side_effect=make_scraper
+    ):
+        generate_island("test", tmp_path / "site", tmp_path / "cache", False)
+
+    assert calls == ["power", "roads"]
+    site = tmp_path / "site"
+    desktop = (site / "index.html").read_text(encoding="utf-8")
+    mobile = (site / "mobile.html").read_text(encoding="utf-8")
+    kiosk = (site / "kiosk.html").read_text(encoding="utf-8")
+    assert "EventSource" in desktop and "table-collapse" not in desktop
+    assert '<summary>Table (2 rows)</summary>' in mobile and "EventSource" not in mobile
+    assert 'http-equiv="refresh"' in kiosk and 'id="toc"' not in kiosk
+    assert len(list((site / "assets").glob("dash.*.css"))) == 1
+    assert (site / "api" / "changes.json").exists()
+    assert (site / "bulletin.txt").exists()
+
+
+def test_targets_can_be_narrowed(tmp_path: Path):
+    island = {"test": {"name": "Test", "scrapers": ["power"], "targets": ["desktop"]}}
+    section = {"id": "power", "label": "Power", "html": "<p>ok</p>"}
+    with patch("src.generate.ISLANDS", island), patch(
+        "src.generate.get_scraper", return_value=lambda: section
+    ):
+        generate_island("test", tmp_path, tmp_path / "cache", False, targets=["bulletin"])
+
+    assert sorted(path.name for path in tmp_path.glob("*.txt")) == ["bulletin.txt"]
+    assert not (tmp_path / "index.html").exists()
@@ -1,7 +1,13 @@
+import time
+from unittest.mock import patch
+
+from src.scrape.rolling import RollingRate
 from src.scrape.usgs_water_levels import (
     _classify_percentile,
     _should_classify,
     _should_omit_row,
+    _trend,
+    _update_iv_series,
 )
 
 PCTS = {"p10": 10.0, "p25": 25.0, "p75": 75.0, "p90": 90.0, "p98": 98.0}
@@ -44,3 +50,55 @@ def test_should_not_omit_allowed_level_or_flow():
     assert _should_omit_row("16104200", "00065") is False
     assert _should_omit_row("16094150", "00065") is False
     assert _should_omit_row("16060000", "00060") is False
+
+
+def _series(values_per_5min, ended_ago: float = 0.0):
+    series = RollingRate(rate_window=3600, retention=6 * 3600)
+    start = time.time() - ended_ago - (len(values_per_5min) - 1) * 300
+    for idx, value in enumerate(values_per_5min):
+        series.append(start + idx * 300, value)
+    return series
+
+
+def test_trend_projects_time_to_minor_flood():
+    # Hanalei at Hwy 56: rising 2 ft in 30 minutes toward the 7.3 ft minor threshold.
+    text, css = _trend("16104200", "00065", _series([4.0 + i / 3 for i in range(7)]))
+    assert text.startswith("▲ +4.00 ft/h")
+    assert "Minor in 19m" in text
+    assert css == "status-red"
+
+
+def test_trend_steady_and_missing():
+    assert _trend("16104200", "00065", _series([4.0] * 7)) == ("Steady", "status-green")
+    assert _trend("16104200", "00065", None) == ("—", "")
+
+
+def test_trend_of_stale_series_is_unknown():
+    # Same rise as above, but the feed stopped two hours ago.
+    rising = _series([4.0 + i / 3 for i in range(7)], ended_ago=2 * 3600)
+    assert _trend("16104200", "00065", rising) == ("—", "")
+
+
+def _fetched_since(series: dict) -> str:
+    with patch("src.scrape.usgs_water_levels._fetch_features", return_value=[]) as fetch, patch(
+        "src.scrape.usgs_water_levels.save_state"
+    ):
+        _update_iv_series(series, ["16104200", "16094150"], [])
+    return fetch.call_args.kwargs["time"]
+
+
+def test_iv_series_fetch_is_incremental_when_a_gage_lacks_a_parameter():
+    now = time.time()
+    series = {}
+    # Kaloko reservoir reports level only; Hanalei reports flow and level.
+    readings = {"16104200:00060": now - 600, "16104200:00065": now - 300, "16094150:00065": now - 900}
+    for key, t in readings.items():
+        series[key] = RollingRate(3600, 6 * 3600)
+        series[key].append(t, 1.0)
+
+    since = _fetched_since(series)
+    assert since == time.strftime("%Y-%m-%dT%H:%M:%SZ/..", time.gmtime(now - 900))
+
+    # A gage with no stored series at all gets the full retention window.
+    del series["16094150:00065"]
+    assert _fetched_since(series) < time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now - 5 * 3600))
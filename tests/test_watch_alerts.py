@@ -0,0 +1,61 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+
+from src.watch_alerts import check_once
+
+PAYLOAD = {
+    "features": [
+        {
+            "properties": {
+                "id": "urn:oid:1",
+                "headline": "Flash Flood Warning issued for Kauai",
+                "description": "Heavy rain.",
+                "sent": "2026-01-05T10:00:00-10:00",
+                "updated": "2026-01-05T10:00:00-10:00",
+            }
+        }
+    ]
+}
+
+
+def _client(status_codes: list[int]) -> httpx.Client:
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(dict(request.headers))
+        status = status_codes.pop(0)
+        if status == 304:
+            return httpx.Response(304)
+        return httpx.Response(200, json=PAYLOAD, headers={"ETag": '"abc"'})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    client.seen_headers = seen_headers
+    return client
+
+
+def test_new_alert_regenerates_then_unchanged_does_not(tmp_path: Path):
+    client = _client([200, 200, 304])
+    state: dict = {}
+    with patch("src.watch_alerts.regenerate_island") as regenerate:
+        assert check_once(client, state, "kauai", tmp_path, tmp_path) is True
+        assert check_once(client, state, "kauai", tmp_path, tmp_path) is False
+        assert check_once(client, state, "kauai", tmp_path, tmp_path) is False
+
+    assert regenerate.call_count == 1
+    fresh = regenerate.call_args.args[3]["nws_alerts"]
+    assert "Flash Flood Warning" in fresh["html"]
+    assert state["alerts"] == {"urn:oid:1": "2026-01-05T10:00:00-10:00"}
+    assert client.seen_headers[1]["if-none-match"] == '"abc"'
+
+
+def test_failed_regenerate_keeps_alert_pending(tmp_path: Path):
+    client = _client([200])
+    state: dict = {}
+    with patch("src.watch_alerts.regenerate_island", side_effect=OSError("disk full")):
+        try:
+            check_once(client, state, "kauai", tmp_path, tmp_path)
+        except OSError:
+            pass
+    assert state == {}
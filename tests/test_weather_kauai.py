@@ -0,0 +1,49 @@
+from src.scrape.weather_kauai import _build_town_forecasts
+
+
+def test_town_forecasts_with_no_periods_are_unavailable():
+    gridpoints = {"Hanalei": {"forecast_url": "a"}, "Lihue": {"forecast_url": "b"}}
+    forecasts = {"a": {"properties": {"periods": []}}, "b": {"properties": {}}}
+
+    assert "Town forecasts unavailable." in _build_town_forecasts(gridpoints, forecasts)
+
+
+def _period(name: str, start: str, temperature: int) -> dict:
+    return {
+        "name": name,
+        "startTime": start,
+        "temperature": temperature,
+        "temperatureUnit": "F",
+        "shortForecast": "Showers",
+    }
+
+
+def test_town_forecasts_match_columns_on_start_time():
+    gridpoints = {"Hanalei": {"forecast_url": "a"}, "Waimea": {"forecast_url": "b"}}
+    forecasts = {
+        "a": {
+            "properties": {
+                "periods": [
+                    _period("This Afternoon", "2026-06-08T12:00:00-10:00", 81),
+                    _period("Tonight", "2026-06-08T18:00:00-10:00", 70),
+                ]
+            }
+        },
+        # Newer issuance: the afternoon period has already rolled off.
+        "b": {
+            "properties": {
+                "periods": [
+                    _period("Tonight", "2026-06-08T18:00:00-10:00", 68),
+                    _period("Monday", "2026-06-09T06:00:00-10:00", 84),
+                ]
+            }
+        },
+    }
+
+    table = _build_town_forecasts(gridpoints, forecasts)
+
+    assert "<th>This Afternoon</th><th>Tonight</th>" in table
+    hanalei, waimea = table.split("<th>Hanalei</th>")[1], table.split("<th>Waimea</th>")[1]
+    assert hanalei.split("</tr>")[0].count("<td>") == 2 and "81 F" in hanalei and "70 F" in hanalei
+    waimea_cells = waimea.split("</tr>")[0].split("<td>")[1:]
+    assert waimea_cells[0] == "N/A</td>" and "68 F" in waimea_cells[1]